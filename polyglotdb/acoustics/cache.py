@@ -0,0 +1,167 @@
+import threading
+from collections import OrderedDict
+
+
+class AcousticCache(object):
+    """
+    Least recently used cache of acoustic tracks, bounded by the total number of time points it holds
+
+    Tracks are keyed by the name of the acoustic measure, the resolution they were downsampled to (if any)
+    and the utterance (or discourse and speaker) they belong to.  When adding a track takes the cache over
+    its maximum size, the least recently used tracks are evicted, though the most recently added track is
+    always kept so that it can be used straight away.  The cache can be shared by threads, such as those
+    running split queries.
+
+    Parameters
+    ----------
+    max_points : int
+        Maximum number of time points across all cached tracks
+    """
+
+    def __init__(self, max_points=2000000):
+        self.max_points = max_points
+        self.points = 0
+        self.hits = 0
+        self.misses = 0
+        self._tracks = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._tracks)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._tracks
+
+    def __getitem__(self, key):
+        with self._lock:
+            track = self._tracks[key]
+            self._tracks.move_to_end(key)
+            return track
+
+    def __setitem__(self, key, track):
+        with self._lock:
+            if key in self._tracks:
+                self.points -= len(self._tracks.pop(key))
+            self._tracks[key] = track
+            self.points += len(track)
+            while self.points > self.max_points and len(self._tracks) > 1:
+                _, evicted = self._tracks.popitem(last=False)
+                self.points -= len(evicted)
+
+    def get(self, key, default=None):
+        """
+        Get a track, recording whether the lookup was a hit or a miss
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the track
+        default : object
+            Value to return if the track is not cached
+
+        Returns
+        -------
+        :class:`~polyglotdb.acoustics.classes.Track`
+            Cached track, or the default if it is not cached
+        """
+        with self._lock:
+            if key in self._tracks:
+                self.hits += 1
+                return self[key]
+            self.misses += 1
+            return default
+
+    def clear(self):
+        """
+        Remove all cached tracks, for instance after acoustic measures are changed in the database
+        """
+        with self._lock:
+            self._tracks.clear()
+            self.points = 0
+
+    def stats(self):
+        """
+        Get the usage statistics of the cache
+
+        Returns
+        -------
+        dict
+            Number of hits, misses, cached tracks and cached time points
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "tracks": len(self._tracks),
+                "points": self.points,
+            }
+
+    def view(self, acoustic_name, resolution=None):
+        """
+        Get a view of the cache for a single acoustic measure, keyed by utterance
+
+        Parameters
+        ----------
+        acoustic_name : str
+            Name of the acoustic measure
+        resolution : float, optional
+            Step in seconds that the tracks were downsampled to
+
+        Returns
+        -------
+        :class:`~polyglotdb.acoustics.cache.AcousticCacheView`
+            View of the cached tracks for the measure
+        """
+        return AcousticCacheView(self, acoustic_name, resolution)
+
+
+class AcousticCacheView(object):
+    """
+    Tracks of a single acoustic measure in an :class:`~polyglotdb.acoustics.cache.AcousticCache`
+
+    Parameters
+    ----------
+    cache : :class:`~polyglotdb.acoustics.cache.AcousticCache`
+        Cache to look tracks up in
+    acoustic_name : str
+        Name of the acoustic measure
+    resolution : float, optional
+        Step in seconds that the tracks were downsampled to
+    """
+
+    def __init__(self, cache, acoustic_name, resolution=None):
+        self.cache = cache
+        self.acoustic_name = acoustic_name
+        self.resolution = resolution
+
+    def __contains__(self, key):
+        return (self.acoustic_name, self.resolution, key) in self.cache
+
+    def __getitem__(self, key):
+        return self.cache[self.acoustic_name, self.resolution, key]
+
+    def __setitem__(self, key, track):
+        self.cache[self.acoustic_name, self.resolution, key] = track
+
+    def get(self, key, default=None):
+        return self.cache.get((self.acoustic_name, self.resolution, key), default)
+
+    def update(self, tracks):
+        for key, track in tracks.items():
+            self[key] = track
+
+
+class SpectrogramCache(AcousticCache):
+    """
+    Least recently used cache of :class:`~polyglotdb.acoustics.classes.Spectrogram` objects, bounded by the total
+    number of cells (frequency bins by time bins) they hold
+
+    Parameters
+    ----------
+    max_cells : int
+        Maximum number of cells across all cached spectrograms
+    """
+
+    def __init__(self, max_cells=10000000):
+        super(SpectrogramCache, self).__init__(max_cells)
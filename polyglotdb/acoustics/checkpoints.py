@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+
+
+def parameter_hash(parameters):
+    """
+    Generate a short hash of analysis parameters
+
+    Parameters
+    ----------
+    parameters : dict
+        Settings that affect the output of an analysis
+
+    Returns
+    -------
+    str
+        Hash of the parameters
+    """
+    encoded = json.dumps(parameters, sort_keys=True, default=str).encode("utf8")
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+def segment_key(segment):
+    """
+    Get the key of a segment in a checkpoint, the ID of its annotation if it has one
+
+    Parameters
+    ----------
+    segment : :class:`~conch.analysis.segments.FileSegment`
+        Segment to get a key for
+
+    Returns
+    -------
+    str
+        Key of the segment
+    """
+    if segment["id"] is not None:
+        return str(segment["id"])
+    return "{}:{}:{}:{}".format(segment.file_path, segment.begin, segment.end, segment.channel)
+
+
+class AnalysisCheckpoint(object):
+    """
+    Record of the segments that an acoustic analysis has analyzed and saved, and the parameters that were used,
+    so that an interrupted analysis can resume where it stopped, and a re-run with different parameters only
+    recomputes the segments the new parameters apply to
+
+    Checkpoints are stored under the ``checkpoints`` directory of the corpus's temporary directory, with one line
+    per saved segment, so that progress is kept even if the process is killed.
+
+    Parameters
+    ----------
+    corpus_context : :class:`~polyglotdb.corpus.AudioContext`
+        Corpus context to store the checkpoint for
+    name : str
+        Name of the analysis, usually the acoustic measure it saves
+    """
+
+    def __init__(self, corpus_context, name):
+        self.name = name
+        self.path = os.path.join(
+            corpus_context.config.temporary_directory("checkpoints"), "{}.tsv".format(name)
+        )
+        self._done = None
+
+    @property
+    def done(self):
+        """
+        Mapping of segment keys to the hash of the parameters they were last analyzed with
+        """
+        if self._done is None:
+            self._done = {}
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf8") as f:
+                    for line in f:
+                        line = line.rstrip("\n")
+                        if not line:
+                            continue
+                        key, _, parameters = line.rpartition("\t")
+                        self._done[key] = parameters
+        return self._done
+
+    def missing(self, segments, parameters):
+        """
+        Filter segments to those that have not been analyzed with the given parameters
+
+        Parameters
+        ----------
+        segments : list
+            Segments to filter
+        parameters : dict
+            Settings of the analysis
+
+        Returns
+        -------
+        list
+            Segments that still need to be analyzed
+        """
+        parameters = parameter_hash(parameters)
+        return [x for x in segments if self.done.get(segment_key(x)) != parameters]
+
+    def mark_done(self, segments, parameters):
+        """
+        Record segments as analyzed and saved with the given parameters
+
+        Parameters
+        ----------
+        segments : iterable
+            Segments that were analyzed and saved
+        parameters : dict
+            Settings of the analysis
+        """
+        parameters = parameter_hash(parameters)
+        lines = []
+        for segment in segments:
+            key = segment_key(segment)
+            self.done[key] = parameters
+            lines.append("{}\t{}\n".format(key, parameters))
+        if lines:
+            with open(self.path, "a", encoding="utf8") as f:
+                f.writelines(lines)
+
+    def clear(self):
+        """
+        Remove all records of analyzed segments
+        """
+        self._done = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
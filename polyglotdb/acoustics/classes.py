@@ -1,21 +1,262 @@
+import math
+from decimal import Decimal
+
+import numpy as np
+
+
+def _is_numeric(value):
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(
+        value, (bool, np.bool_)
+    )
+
+
+def _make_column(values):
+    if all(x is None or _is_numeric(x) for x in values):
+        return np.array([np.nan if x is None else x for x in values], dtype=np.float64)
+    column = np.empty(len(values), dtype=object)
+    column[:] = [None if isinstance(x, float) and math.isnan(x) else x for x in values]
+    return column
+
+
+def _to_object_column(column):
+    if column.dtype == object:
+        return column
+    converted = np.empty(len(column), dtype=object)
+    converted[:] = [None if math.isnan(x) else x for x in column.tolist()]
+    return converted
+
+
+def _missing_column(length, dtype):
+    if dtype == object:
+        return np.full(length, None, dtype=object)
+    return np.full(length, np.nan, dtype=np.float64)
+
+
 class Track(object):
     """
-    Track class to contain, select, and manage :class:`~polyglotdb.acoustics.classes.TimePoint` objects
+    Track class to contain, select, and manage acoustic measurements over time
+
+    Times are stored as a sorted array, alongside one array of values per measure, so that lookups and slices
+    use binary search and slices share memory with the original track.  Numeric measures are stored as floats,
+    with NaN for missing values.  Iterating over a track gives :class:`~polyglotdb.acoustics.classes.TimePoint`
+    views of each time, and setting values on them updates the track.
 
     Attributes
     ----------
-    points : iterable of :class:`~polyglotdb.acoustics.classes.TimePoint`
+    points : list of :class:`~polyglotdb.acoustics.classes.TimePoint`
         Time points with values of the acoustic track
     """
 
     def __init__(self):
-        self.points = []
+        self._seconds = np.empty(0, dtype=np.float64)
+        self._ms = None
+        self._times = None
+        self._columns = {}
+        self._pending = []
 
     def __str__(self):
         return "<Track: {}>".format(self.points)
 
     def __repr__(self):
-        return "<TrackObject with {} points".format(len(self.points))
+        return "<TrackObject with {} points".format(len(self))
+
+    @classmethod
+    def from_columns(cls, times, values):
+        """
+        Construct a track from columns of times and values
+
+        Parameters
+        ----------
+        times : iterable
+            Time of each point
+        values : dict
+            Iterable of values for each measure, NaN or None for missing values
+
+        Returns
+        -------
+        :class:`~polyglotdb.acoustics.classes.Track`
+            Track with a time point for each time
+        """
+        times = list(times)
+        time_objects = np.empty(len(times), dtype=object)
+        time_objects[:] = times
+        track = cls()
+        track._append(
+            np.array([float(x) for x in times], dtype=np.float64), time_objects, None, values
+        )
+        return track
+
+    @classmethod
+    def from_ms(cls, ms, values):
+        """
+        Construct a track from columns of times in milliseconds and values, as returned by InfluxDB.  Times of
+        the track's points are Decimal seconds.
+
+        Parameters
+        ----------
+        ms : iterable
+            Time of each point in milliseconds
+        values : dict
+            Iterable of values for each measure, NaN or None for missing values
+
+        Returns
+        -------
+        :class:`~polyglotdb.acoustics.classes.Track`
+            Track with a time point for each time
+        """
+        ms = np.asarray(ms, dtype=np.int64)
+        track = cls()
+        track._append(ms / 1000, None, ms, values)
+        return track
+
+    def _append(self, seconds, times, ms, values):
+        n = len(self._seconds)
+        count = len(seconds)
+        if not count:
+            return
+        # Exact times are kept as milliseconds where possible, otherwise as the original objects
+        if ms is None or (n and self._ms is None):
+            if times is None:
+                times = np.empty(count, dtype=object)
+                times[:] = [Decimal(x).scaleb(-3) for x in ms.tolist()]
+            if n and self._times is None:
+                self._times = self._time_objects()
+                self._ms = None
+            new_times, new_ms = times, None
+        else:
+            new_times, new_ms = None, ms
+        columns = {}
+        for name, column in values.items():
+            if not isinstance(column, np.ndarray) or column.dtype not in (np.float64, object):
+                column = _make_column(list(column))
+            columns[name] = column
+        for name in set(self._columns) | set(columns):
+            old = self._columns.get(name)
+            new = columns.get(name)
+            if old is None:
+                old = _missing_column(n, new.dtype)
+            if new is None:
+                new = _missing_column(count, old.dtype)
+            if old.dtype != new.dtype:
+                old, new = _to_object_column(old), _to_object_column(new)
+            self._columns[name] = np.concatenate([old, new])
+        self._seconds = np.concatenate([self._seconds, np.asarray(seconds, dtype=np.float64)])
+        if new_ms is not None:
+            self._ms = new_ms if not n else np.concatenate([self._ms, new_ms])
+        else:
+            self._times = new_times if not n else np.concatenate([self._times, new_times])
+        if np.any(np.diff(self._seconds) < 0):
+            self._sort()
+
+    def _sort(self):
+        order = np.argsort(self._seconds, kind="stable")
+        self._seconds = self._seconds[order]
+        if self._ms is not None:
+            self._ms = self._ms[order]
+        if self._times is not None:
+            self._times = self._times[order]
+        self._columns = {k: v[order] for k, v in self._columns.items()}
+
+    def _consolidate(self):
+        if not self._pending:
+            return
+        points, self._pending = self._pending, []
+        times = np.empty(len(points), dtype=object)
+        times[:] = [p.time for p in points]
+        point_values = [p.values for p in points]
+        names = set()
+        for v in point_values:
+            names.update(v.keys())
+        values = {name: [v.get(name) for v in point_values] for name in names}
+        self._append(np.array([float(x) for x in times], dtype=np.float64), times, None, values)
+
+    def _time_objects(self):
+        if self._times is not None:
+            return self._times
+        times = np.empty(len(self._seconds), dtype=object)
+        if self._ms is not None:
+            times[:] = [Decimal(x).scaleb(-3) for x in self._ms.tolist()]
+        return times
+
+    def _time(self, index):
+        if self._ms is not None:
+            return Decimal(int(self._ms[index])).scaleb(-3)
+        return self._times[index]
+
+    def _value(self, index, name):
+        column = self._columns[name]
+        value = column[index]
+        if column.dtype == object:
+            return value
+        value = float(value)
+        if math.isnan(value):
+            return None
+        return value
+
+    def _set_value(self, index, name, value):
+        column = self._columns.get(name)
+        if column is None:
+            column = _missing_column(len(self._seconds), np.float64)
+            self._columns[name] = column
+        if column.dtype != object and not (value is None or _is_numeric(value)):
+            column = _to_object_column(column)
+            self._columns[name] = column
+        if column.dtype != object and value is None:
+            value = np.nan
+        column[index] = value
+
+    def _set_time(self, index, time):
+        if self._times is None:
+            self._times = self._time_objects()
+            self._ms = None
+        self._times[index] = time
+        self._seconds[index] = float(time)
+        if np.any(np.diff(self._seconds) < 0):
+            self._sort()
+
+    def _index(self, time):
+        self._consolidate()
+        seconds = float(time)
+        index = int(np.searchsorted(self._seconds, seconds, side="left"))
+        if index < len(self._seconds) and self._seconds[index] == seconds:
+            return index
+        return None
+
+    @property
+    def points(self):
+        return list(self)
+
+    @property
+    def seconds(self):
+        """
+        Get the times of the track as an array of floats
+
+        Returns
+        -------
+        numpy.array
+            Sorted times in seconds
+        """
+        self._consolidate()
+        return self._seconds
+
+    def column(self, name):
+        """
+        Get the values of a measure as an array
+
+        Parameters
+        ----------
+        name : str
+            Name of the measure
+
+        Returns
+        -------
+        numpy.array
+            Values for each time point, as floats with NaN for missing values for numeric measures
+        """
+        self._consolidate()
+        if name not in self._columns:
+            return np.full(len(self._seconds), np.nan)
+        return self._columns[name]
 
     def keys(self):
         """
@@ -26,10 +267,8 @@ class Track(object):
         list
             All keys on TimePoint objects
         """
-        keys = set()
-        for point in self:
-            keys.update(point.values.keys())
-        return sorted(keys)
+        self._consolidate()
+        return sorted(self._columns.keys())
 
     def times(self):
         """
@@ -40,25 +279,23 @@ class Track(object):
         list
             Sorted time points
         """
-        times = set()
-        for point in self:
-            times.add(point.time)
-        return sorted(times)
+        self._consolidate()
+        if not len(self._seconds):
+            return []
+        first = np.concatenate([[True], np.diff(self._seconds) != 0])
+        return [self._time(i) for i in np.flatnonzero(first).tolist()]
 
     def __getitem__(self, time):
-        for point in self:
-            if point.time == time:
-                return point
-        return None
+        index = self._index(time)
+        if index is None:
+            return None
+        return TimePointView(self, index)
 
     def __len__(self):
-        return len(self.points)
+        return len(self._seconds) + len(self._pending)
 
     def __contains__(self, time):
-        for point in self:
-            if point.time == time:
-                return True
-        return False
+        return self._index(time) is not None
 
     def add(self, point):
         """
@@ -70,11 +307,16 @@ class Track(object):
             Time point to add
 
         """
-        self.points.append(point)
+        if isinstance(point, TimePointView):
+            copied = TimePoint(point.time)
+            copied.values = point.values
+            point = copied
+        self._pending.append(point)
 
     def __iter__(self):
-        for p in sorted(self.points, key=lambda x: x.time):
-            yield p
+        self._consolidate()
+        for i in range(len(self._seconds)):
+            yield TimePointView(self, i)
 
     def items(self):
         """
@@ -85,12 +327,12 @@ class Track(object):
         generator
             Tuples of time points and values
         """
-        for p in sorted(self.points, key=lambda x: x.time):
+        for p in self:
             yield p.time, p.values
 
     def slice(self, begin, end):
         """
-        Create a slice of the acoustic track between two times
+        Create a slice of the acoustic track between two times, sharing memory with this track
 
         Parameters
         ----------
@@ -104,15 +346,85 @@ class Track(object):
         :class:`~polyglotdb.acoustics.classes.Track`
             Track constructed from just the time points in the specified time
         """
+        self._consolidate()
+        start = int(np.searchsorted(self._seconds, float(begin), side="left"))
+        stop = int(np.searchsorted(self._seconds, float(end), side="right"))
         new_track = Track()
-        for p in self:
-            if p.time < begin:
-                continue
-            if p.time > end:
-                break
-            new_track.add(p)
+        new_track._seconds = self._seconds[start:stop]
+        if self._ms is not None:
+            new_track._ms = self._ms[start:stop]
+        if self._times is not None:
+            new_track._times = self._times[start:stop]
+        new_track._columns = {k: v[start:stop] for k, v in self._columns.items()}
         return new_track
 
+    def relative_time(self, begin, end):
+        """
+        Create a copy of the track with times relative to a time range, i.e., 0 at begin and 1 at end
+
+        Parameters
+        ----------
+        begin : float
+            Time corresponding to 0
+        end : float
+            Time corresponding to 1
+
+        Returns
+        -------
+        :class:`~polyglotdb.acoustics.classes.Track`
+            Track with relative times
+        """
+        self._consolidate()
+        begin = Decimal(begin)
+        duration = Decimal(end) - begin
+        times = np.empty(len(self._seconds), dtype=object)
+        times[:] = [(x - begin) / duration for x in self._time_objects()]
+        new_track = Track()
+        new_track._seconds = np.array([float(x) for x in times], dtype=np.float64)
+        new_track._times = times
+        new_track._columns = {k: v.copy() for k, v in self._columns.items()}
+        return new_track
+
+    def merge(self, other):
+        """
+        Add the time points of another track to this one, updating the values of any time points that are in both
+
+        Parameters
+        ----------
+        other : :class:`~polyglotdb.acoustics.classes.Track`
+            Track to merge in
+        """
+        self._consolidate()
+        other._consolidate()
+        if not len(other._seconds):
+            return
+        n = len(self._seconds)
+        if n:
+            index = np.searchsorted(self._seconds, other._seconds, side="left")
+            matched = (index < n) & (self._seconds[np.minimum(index, n - 1)] == other._seconds)
+        else:
+            index = np.zeros(len(other._seconds), dtype=np.int64)
+            matched = np.zeros(len(other._seconds), dtype=bool)
+        if matched.any():
+            targets = index[matched]
+            for name, column in other._columns.items():
+                values = column[matched]
+                current = self._columns.get(name)
+                if current is None:
+                    current = _missing_column(n, column.dtype)
+                if current.dtype != values.dtype:
+                    current, values = _to_object_column(current), _to_object_column(values)
+                current[targets] = values
+                self._columns[name] = current
+        new = ~matched
+        if new.any():
+            self._append(
+                other._seconds[new],
+                None if other._times is None else other._times[new],
+                None if other._ms is None else other._ms[new],
+                {k: v[new] for k, v in other._columns.items()},
+            )
+
 
 class TimePoint(object):
     """
@@ -209,4 +521,158 @@ class TimePoint(object):
 
         """
         for k, v in point.values.items():
-            self.values[k] = v
+            self.add_value(k, v)
+
+
+class TimePointView(TimePoint):
+    """
+    :class:`~polyglotdb.acoustics.classes.TimePoint` backed by a time in a
+    :class:`~polyglotdb.acoustics.classes.Track`, where setting values updates the track
+
+    Parameters
+    ----------
+    track : :class:`~polyglotdb.acoustics.classes.Track`
+        Track containing the time point
+    index : int
+        Index of the time point in the track
+    """
+
+    def __init__(self, track, index):
+        self._track = track
+        self._index = index
+
+    @property
+    def time(self):
+        return self._track._time(self._index)
+
+    @time.setter
+    def time(self, value):
+        self._track._set_time(self._index, value)
+
+    @property
+    def values(self):
+        return {k: self._track._value(self._index, k) for k in self._track._columns}
+
+    def __contains__(self, item):
+        return item in self._track._columns
+
+    def __getitem__(self, item):
+        if item == "time":
+            return self.time
+        return self._track._value(self._index, item)
+
+    def __setitem__(self, key, value):
+        self._track._set_value(self._index, key, value)
+
+    def __getattr__(self, item):
+        if not item.startswith("_") and item in self._track._columns:
+            return self._track._value(self._index, item)
+
+    def has_value(self, name):
+        return name in self._track._columns and self._track._value(self._index, name) is not None
+
+    def add_value(self, name, value):
+        self._track._set_value(self._index, name, value)
+
+
+class Spectrogram(object):
+    """
+    Spectrogram of a stretch of audio, stored as an array of frequency bins by time bins
+
+    Parameters
+    ----------
+    values : numpy.array
+        Power of each frequency bin (rows) in each time bin (columns)
+    time_step : float
+        Time step between time bins
+    freq_step : float
+        Frequency step between frequency bins
+    begin : float
+        Time of the first time bin
+    """
+
+    def __init__(self, values, time_step, freq_step, begin=0.0):
+        self.values = values
+        self.time_step = time_step
+        self.freq_step = freq_step
+        self.begin = begin
+
+    def __len__(self):
+        return self.values.size
+
+    @property
+    def num_time_bins(self):
+        return self.values.shape[1]
+
+    @property
+    def num_freq_bins(self):
+        return self.values.shape[0]
+
+    def times(self):
+        """
+        Get the times of the time bins
+
+        Returns
+        -------
+        numpy.array
+            Times in seconds
+        """
+        return self.begin + np.arange(self.num_time_bins) * self.time_step
+
+    def frequencies(self):
+        """
+        Get the frequencies of the frequency bins
+
+        Returns
+        -------
+        numpy.array
+            Frequencies in Hz
+        """
+        return np.arange(self.num_freq_bins) * self.freq_step
+
+    def rows(self):
+        """
+        Generate one dictionary per cell of the spectrogram, going through every time bin of each frequency bin
+
+        Yields
+        ------
+        dict
+            Time, frequency and power of the cell
+        """
+        times = self.times().tolist()
+        for frequency, powers in zip(self.frequencies().tolist(), self.values.tolist()):
+            for time, power in zip(times, powers):
+                yield {"time": time, "frequency": frequency, "power": power}
+
+    def to_bytes(self):
+        """
+        Get the values as a compact binary payload of little-endian 32-bit floats, in frequency bin major order
+
+        Returns
+        -------
+        bytes
+            Spectrogram values
+        """
+        return np.ascontiguousarray(self.values, dtype="<f4").tobytes()
+
+    def to_dict(self, rows=True):
+        """
+        Get the spectrogram as a dictionary
+
+        Parameters
+        ----------
+        rows : bool
+            Flag for giving the values as a list of dictionaries for each cell, rather than as an array
+
+        Returns
+        -------
+        dict
+            Values, time and frequency steps, and the numbers of time and frequency bins
+        """
+        return {
+            "values": list(self.rows()) if rows else self.values,
+            "time_step": self.time_step,
+            "freq_step": self.freq_step,
+            "num_time_bins": self.num_time_bins,
+            "num_freq_bins": self.num_freq_bins,
+        }
@@ -1,9 +1,9 @@
-from conch import analyze_segments
-
+from polyglotdb.acoustics.checkpoints import AnalysisCheckpoint
 from polyglotdb.acoustics.formants.helper import (
     generate_base_formants_function,
     generate_formants_point_function,
 )
+from polyglotdb.acoustics.scheduling import analyze_file_segments
 from polyglotdb.acoustics.segments import generate_utterance_segments, generate_vowel_segments
 from polyglotdb.acoustics.utils import PADDING
 from polyglotdb.exceptions import SpeakerAttributeError
@@ -16,6 +16,7 @@ def analyze_formant_points(
     vowel_label="vowel",
     duration_threshold=None,
     multiprocessing=True,
+    source="praat",
 ):
     """First pass of the algorithm; generates prototypes.
 
@@ -31,6 +32,8 @@ def analyze_formant_points(
         The subset of phones to analyze.
     duration_threshold : float, optional
         Segments with length shorter than this value (in milliseconds) will not be analyzed.
+    source : str
+        Program to measure formants with, either ``praat`` or ``native``
 
     Returns
     -------
@@ -53,8 +56,10 @@ def analyze_formant_points(
     if call_back is not None:
         call_back("Analyzing files...")
 
-    formant_function = generate_formants_point_function(corpus_context)  # Make formant function
-    output = analyze_segments(
+    formant_function = generate_formants_point_function(
+        corpus_context, source=source
+    )  # Make formant function
+    output = analyze_file_segments(
         segment_mapping,
         formant_function,
         stop_check=stop_check,
@@ -70,6 +75,7 @@ def analyze_formant_tracks(
     call_back=None,
     stop_check=None,
     multiprocessing=True,
+    resume=False,
 ):
     """
     Analyze formants of an entire utterance, and save the resulting formant tracks into the database.
@@ -80,10 +86,17 @@ def analyze_formant_tracks(
         corpus context to use
     vowel_label : str, optional
         Optional subset of phones to compute tracks over.  If None, then tracks over utterances are computed.
+    source : str
+        Program to compute formants, ``praat`` or ``native`` (which runs in Python without calling Praat)
     call_back : callable
         call back function, optional
     stop_check : callable
         stop check function, optional
+    multiprocessing : bool
+        Flag to use multiprocessing rather than threading
+    resume : bool
+        Flag for skipping segments that were already analyzed and saved with the same settings, for
+        instance by a run that was interrupted
     """
     if vowel_label is None:
         segment_mapping = generate_utterance_segments(corpus_context, padding=PADDING)
@@ -101,6 +114,7 @@ def analyze_formant_tracks(
     segment_mapping = segment_mapping.grouped_mapping("speaker")
     if call_back is not None:
         call_back("Analyzing files...")
+    checkpoint = AnalysisCheckpoint(corpus_context, "formants")
     for i, ((speaker,), v) in enumerate(segment_mapping.items()):
         gender = None
         try:
@@ -115,7 +129,14 @@ def analyze_formant_tracks(
             )
         else:
             formant_function = generate_base_formants_function(corpus_context, source=source)
-        output = analyze_segments(
+        parameters = {"source": source, "gender": gender}
+        if resume:
+            v = checkpoint.missing(v, parameters)
+            if not v:
+                continue
+        output = analyze_file_segments(
             v, formant_function, stop_check=stop_check, multiprocessing=multiprocessing
         )
         corpus_context.save_acoustic_tracks("formants", output, speaker)
+        corpus_context.acoustic_writer().flush()
+        checkpoint.mark_done(output.keys(), parameters)
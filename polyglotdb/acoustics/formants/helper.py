@@ -1,10 +1,8 @@
 import os
 import re
-from statistics import mean
 
 import numpy as np
 import scipy
-from conch import analyze_segments
 from conch.analysis.formants import (
     FormantTrackFunction,
     PraatSegmentFormantPointFunction,
@@ -15,6 +13,12 @@ from conch.analysis.segments import SegmentMapping
 from pyraat.parse_outputs import parse_point_script_output
 
 from polyglotdb.acoustics.io import point_measures_from_csv, point_measures_to_csv
+from polyglotdb.acoustics.native import (
+    NativeFormantPointFunction,
+    NativeFormantTrackFunction,
+    NativeVariableFormantPointFunction,
+)
+from polyglotdb.acoustics.scheduling import analyze_file_segments
 from polyglotdb.exceptions import AcousticError
 
 
@@ -84,7 +88,9 @@ def parse_multiple_formant_output(output):
     return to_return
 
 
-def generate_variable_formants_point_function(corpus_context, min_formants, max_formants):
+def generate_variable_formants_point_function(
+    corpus_context, min_formants, max_formants, source="praat"
+):
     """Generates a function used to call Praat to measure formants and bandwidths with variable num_formants.
     This specific function returns a single point per formant at a third of the way through the segment
 
@@ -96,6 +102,9 @@ def generate_variable_formants_point_function(corpus_context, min_formants, max_
         The minimum number of formants to measure with on subsequent passes (default is 4).
     max_formants : int
         The maximum number of formants to measure with on subsequent passes (default is 7).
+    source : str
+        The source of the function, either "praat" or "native" to measure all numbers of formants
+        in Python from a single analysis
 
     Returns
     -------
@@ -103,6 +112,13 @@ def generate_variable_formants_point_function(corpus_context, min_formants, max_
         The function used to call Praat.
     """
     max_freq = 5500
+    if source == "native":
+        return NativeVariableFormantPointFunction(
+            min_formants=min_formants,
+            max_formants=max_formants,
+            window_length=0.025,
+            max_frequency=max_freq,
+        )
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
     script = os.path.join(script_dir, "multiple_num_formants.praat")
@@ -116,7 +132,7 @@ def generate_variable_formants_point_function(corpus_context, min_formants, max_
     return formant_function
 
 
-def generate_formants_point_function(corpus_context, gender=None):
+def generate_formants_point_function(corpus_context, gender=None, source="praat"):
     """Generates a function used to call Praat to measure formants and bandwidths with variable num_formants.
 
     Parameters
@@ -127,6 +143,8 @@ def generate_formants_point_function(corpus_context, gender=None):
         The minimum number of formants to measure with on subsequent passes (default is 4).
     max_formants : int
         The maximum number of formants to measure with on subsequent passes (default is 7).
+    source : str
+        The source of the function, either "praat" or "native"
 
     Returns
     -------
@@ -134,6 +152,10 @@ def generate_formants_point_function(corpus_context, gender=None):
         The function used to call Praat.
     """
     max_freq = 5500
+    if source == "native":
+        return NativeFormantPointFunction(
+            max_frequency=max_freq, num_formants=5, window_length=0.025, time_step=0.01
+        )
     formant_function = PraatSegmentFormantPointFunction(
         praat_path=corpus_context.config.praat_path,
         max_frequency=max_freq,
@@ -161,43 +183,34 @@ def get_mean_SD(data, prototype_parameters=None):
     """
     if prototype_parameters is None:
         prototype_parameters = ["F1", "F2", "F3", "B1", "B2", "B3"]
-    metadata = {}
-    phones = set()
+    observations = {}
     for seg, value in data.items():
-        phones.add(seg["label"])
-
-    for phone in phones:
-        observation_list = []
-        for seg, value in data.items():
-            if seg["label"] == phone:
-                observation = [value[pp] for pp in prototype_parameters]
-                # observation = [
-                #     value['F1'],
-                #     value['F2'],
-                #     value['F3'],
-                #     value['B1'],
-                #     value['B2'],
-                #     value['B3']
-                # ]
-                observation_list.append([x if x else 0 for x in observation])
-
-        # f1_mean, f2_mean, f3_mean = mean(x[0] for x in observation_list), mean(x[1] for x in observation_list), mean(
-        #     x[2] for x in observation_list)
-        # b1_mean, b2_mean, b3_mean = mean(x[3] for x in observation_list), mean(x[4] for x in observation_list), mean(
-        #     x[5] for x in observation_list)
-        # all_means = [f1_mean, f2_mean, f3_mean, b1_mean, b2_mean, b3_mean]
-        all_means = [
-            mean(x[i] for x in observation_list) for i, pp in enumerate(prototype_parameters)
-        ]
-
-        observation_list = np.array(observation_list)
-        cov = np.cov(observation_list.T)
-
-        measurements = [all_means, cov.tolist()]
-        metadata[phone] = measurements
+        observation = [value[pp] for pp in prototype_parameters]
+        observations.setdefault(seg["label"], []).append([x if x else 0 for x in observation])
+
+    metadata = {}
+    for phone, observation_list in observations.items():
+        metadata[phone] = get_mean_covariance(observation_list)
     return metadata
 
 
+def get_mean_covariance(observations):
+    """Gets the means and covariance matrix of a set of observations.
+
+    Parameters
+    ----------
+    observations : list or :class:`numpy.ndarray`
+        Observations with one row per token and one column per parameter.
+
+    Returns
+    -------
+    list
+        Means of each parameter and the covariance matrix, as lists.
+    """
+    observations = np.array(observations, dtype=float)
+    return [observations.mean(axis=0).tolist(), np.cov(observations.T).tolist()]
+
+
 def get_mahalanobis(prototype, observation, inverse_covariance):
     """Gets the Mahalanobis distance between an observation and the prototype.
 
@@ -222,6 +235,29 @@ def get_mahalanobis(prototype, observation, inverse_covariance):
     return distance
 
 
+def get_mahalanobis_distances(prototype, observations, inverse_covariance):
+    """Gets the Mahalanobis distances between many observations and the prototype at once.
+
+    Parameters
+    ----------
+    prototype : list
+        Prototype data.
+    observations : :class:`numpy.ndarray`
+        Observations with parameters along the last axis, for instance tokens by candidates by parameters.
+    inverse_covariance : list
+        The inverse of the covariance matrix for the vowel class.
+
+    Returns
+    -------
+    distances : :class:`numpy.ndarray`
+        The Mahalanobis distances, with the shape of the observations without their last axis.
+    """
+    difference = np.asarray(observations, dtype=float) - np.asarray(prototype, dtype=float)
+    inverse_covariance = np.asarray(inverse_covariance, dtype=float)
+    squared = np.einsum("...i,ij,...j->...", difference, inverse_covariance, difference)
+    return np.sqrt(np.maximum(squared, 0))
+
+
 def save_formant_point_data(corpus_context, data, num_formants=False):
     header = [
         "id",
@@ -254,7 +290,12 @@ def save_formant_point_data(corpus_context, data, num_formants=False):
 
 
 def extract_and_save_formant_tracks(
-    corpus_context, data, num_formants=False, stop_check=None, multiprocessing=True
+    corpus_context,
+    data,
+    num_formants=False,
+    stop_check=None,
+    multiprocessing=True,
+    source="praat",
 ):
     """This function takes a dictionary with the best parameters for each vowels, then recalculates the formants
     as tracks rather than as points"""
@@ -274,15 +315,20 @@ def extract_and_save_formant_tracks(
         segment_mappings[n_formants].segments.append(k)
     outputs = {}
     for n_formants in segment_mappings:
-        func = PraatSegmentFormantTrackFunction(
-            praat_path=corpus_context.config.praat_path,
-            max_frequency=5500,
-            num_formants=n_formants,
-            window_length=0.025,
-            time_step=0.01,
-        )
-
-        output = analyze_segments(
+        if source == "native":
+            func = NativeFormantTrackFunction(
+                max_frequency=5500, num_formants=n_formants, window_length=0.025, time_step=0.01
+            )
+        else:
+            func = PraatSegmentFormantTrackFunction(
+                praat_path=corpus_context.config.praat_path,
+                max_frequency=5500,
+                num_formants=n_formants,
+                window_length=0.025,
+                time_step=0.01,
+            )
+
+        output = analyze_file_segments(
             segment_mappings[n_formants],
             func,
             stop_check=stop_check,
@@ -320,8 +366,9 @@ def generate_base_formants_function(corpus_context, gender=None, source="praat")
         the max frequency is 5000 Hz, otherwise 5500
     source : str
         The source of the function, if it is "praat" then the formants
-        will be calculated with Praat over each segment otherwise
-        it will simply be tracks
+        will be calculated with Praat over each segment, if it is "native"
+        they will be calculated in Python with the same method as Praat,
+        otherwise it will simply be tracks
     Returns
     -------
     formant_function : Partial function object
@@ -340,6 +387,10 @@ def generate_base_formants_function(corpus_context, gender=None, source="praat")
             window_length=0.025,
             time_step=0.01,
         )
+    elif source == "native":
+        formant_function = NativeFormantTrackFunction(
+            max_frequency=max_freq, time_step=0.01, num_formants=5, window_length=0.025
+        )
     else:
         formant_function = FormantTrackFunction(
             max_frequency=max_freq, time_step=0.01, num_formants=5, window_length=0.025
@@ -2,15 +2,16 @@ import math
 import os
 
 import numpy as np
-from conch import analyze_segments
 
 from polyglotdb.acoustics.formants.helper import (
     extract_and_save_formant_tracks,
     generate_variable_formants_point_function,
-    get_mahalanobis,
+    get_mahalanobis_distances,
+    get_mean_covariance,
     get_mean_SD,
     save_formant_point_data,
 )
+from polyglotdb.acoustics.scheduling import analyze_file_segments
 from polyglotdb.acoustics.segments import generate_vowel_segments
 
 
@@ -59,6 +60,7 @@ def analyze_formant_points_refinement(
     drop_formant=False,
     multiprocessing=True,
     output_tracks=False,
+    source="praat",
 ):
     """Extracts F1, F2, F3 and B1, B2, B3.
 
@@ -75,6 +77,9 @@ def analyze_formant_points_refinement(
     output_tracks : bool, optional
         Whether to save only the formant values as a point at 0.33 if false or have a track over the entire
         vowel duration if true.
+    source : str, optional
+        Program to measure formants with, ``praat`` or ``native``, which measures every number of formants
+        from a single analysis in Python rather than running Praat.
 
     Returns
     -------
@@ -137,10 +142,18 @@ def analyze_formant_points_refinement(
         max_formants = 7
     default_formant = 5
     formant_function = generate_variable_formants_point_function(
-        corpus_context, min_formants, max_formants
+        corpus_context, min_formants, max_formants, source=source
     )
     best_prototype_metadata = {}
 
+    # Measure every vowel token in one pass, so that each sound file is only read by one worker
+    all_output = analyze_file_segments(
+        segment_mapping,
+        formant_function,
+        stop_check=stop_check,
+        multiprocessing=multiprocessing,
+    )
+
     # For each vowel token, collect the formant measurements
     # Pick the best track that is closest to the averages gotten from prototypes
 
@@ -162,12 +175,7 @@ def analyze_formant_points_refinement(
             + str(len(seg))
             + " tokens"
         )
-        output = analyze_segments(
-            seg,
-            formant_function,
-            stop_check=stop_check,
-            multiprocessing=multiprocessing,
-        )  # Analyze the phone
+        output = {x: all_output[x] for x in seg if x in all_output}
 
         if len(seg) < 6:
             print(
@@ -260,6 +268,8 @@ def analyze_formant_points_refinement(
                 for candidate, measurements in data.items():
                     output[s][candidate]["Ax"] = output[s][candidate]["A4"]
         output = {k: v for k, v in output.items() if v}
+        if not output:
+            continue
         for s, data in output.items():
             for candidate, measurements in data.items():
                 try:
@@ -298,6 +308,20 @@ def analyze_formant_points_refinement(
         else:
             prev_prototype_metadata = vowel_prototype_metadata
 
+        # Stack the candidates of every token into a tokens x candidates x parameters matrix, with the candidates
+        # of each token in their original order and missing ones left as NaN, so that every distance can be
+        # computed at once in each iteration
+        tokens = list(output.keys())
+        candidates = [list(output[s].keys()) for s in tokens]
+        points = np.full(
+            (len(tokens), max(len(x) for x in candidates), len(prototype_parameters)), np.nan
+        )
+        for t, s in enumerate(tokens):
+            for c, number in enumerate(candidates[t]):
+                point = output[s][number]
+                points[t, c] = [point[x] if point[x] else 0 for x in prototype_parameters]
+        token_indices = np.arange(len(tokens))
+
         if num_iterations > 1 and len(seg) < 6:
             print(
                 "Skipping iterations for vowel {}, at least 6 tokens are needed, only found {}.".format(
@@ -307,57 +331,37 @@ def analyze_formant_points_refinement(
             my_iterations = [0]
         else:
             my_iterations = range(num_iterations)
+        last_iteration_best = None
         for iteration in my_iterations:
-            best_numbers = []
-            selected_tracks = {}
             prototype_means = prev_prototype_metadata[vowel][0]
             # Get Mahalanobis distance between every new observation and the sample/means
             covariance = np.array(prev_prototype_metadata[vowel][1])
             inverse_covariance = np.linalg.pinv(covariance)
-            best_number = 5
-            for s, data in output.items():
-                best_distance = math.inf
-                best_track = 0
-                for number, point in data.items():
-                    point = [point[x] if point[x] else 0 for x in prototype_parameters]
-                    distance = get_mahalanobis(prototype_means, point, inverse_covariance)
-                    if (
-                        distance < best_distance
-                    ):  # Update "best" measures when new best distance is found
-                        best_distance = distance
-                        best_track = point
-                        best_number = number
-                # selected_tracks[s] = {k: best_track[i] for i, k in enumerate(columns)}
-                selected_tracks[s] = {k: best_track[i] for i, k in enumerate(prototype_parameters)}
-                # best_data[s] = {k: best_track[i] for i, k in enumerate(output_columns)}
-                # best_data[s] = {k: best_track[i] for i, k in enumerate(columns)}
-                best_data[s] = {}
-                for output_column in output_columns:
-                    best_data[s][output_column] = output[s][best_number][output_column]
-
-                best_data[s]["num_formants"] = float(str(best_number).split("x")[0])
-                best_data[s]["Fx"] = int(str(best_number)[0])
-                if "x" in str(best_number):
-                    best_data[s]["drop_formant"] = int(str(best_number).split("x")[-1])
-                else:
-                    best_data[s]["drop_formant"] = 0
-
-                best_numbers.append(best_number)
+            distances = get_mahalanobis_distances(prototype_means, points, inverse_covariance)
+            distances[np.isnan(distances)] = np.inf
+            best = np.argmin(distances, axis=1)
 
             if len(seg) >= 6:
-                prototype_metadata = get_mean_SD(selected_tracks, prototype_parameters)
+                prototype_metadata = {vowel: get_mean_covariance(points[token_indices, best])}
                 prev_prototype_metadata = prototype_metadata
                 best_prototype_metadata.update(prototype_metadata)
 
-            last_iteration_best_numbers = best_numbers
-
-            if iteration > 0:
-                changed_numbers = 0
-                for b_i, bn in enumerate(best_numbers):
-                    if bn != last_iteration_best_numbers[b_i]:
-                        changed_numbers += 1
-                if changed_numbers == 0:
-                    break
+            if last_iteration_best is not None and np.array_equal(best, last_iteration_best):
+                break
+            last_iteration_best = best
+
+        for t, s in enumerate(tokens):
+            best_number = candidates[t][best[t]]
+            best_data[s] = {}
+            for output_column in output_columns:
+                best_data[s][output_column] = output[s][best_number][output_column]
+
+            best_data[s]["num_formants"] = float(str(best_number).split("x")[0])
+            best_data[s]["Fx"] = int(str(best_number)[0])
+            if "x" in str(best_number):
+                best_data[s]["drop_formant"] = int(str(best_number).split("x")[-1])
+            else:
+                best_data[s]["drop_formant"] = 0
         log_output.append([speaker, vowel, str(len(output)), str(iteration + 1)])
     for s, v, token_count, iteration_count in log_output:
         print(
@@ -370,6 +374,7 @@ def analyze_formant_points_refinement(
             num_formants=True,
             multiprocessing=multiprocessing,
             stop_check=stop_check,
+            source=source,
         )
     else:
         save_formant_point_data(corpus_context, best_data, num_formants=True)
@@ -1,6 +1,8 @@
-from conch import analyze_segments
 from conch.analysis.intensity import PraatSegmentIntensityTrackFunction
 
+from polyglotdb.acoustics.checkpoints import AnalysisCheckpoint
+from polyglotdb.acoustics.native import NativeIntensityTrackFunction
+from polyglotdb.acoustics.scheduling import analyze_file_segments
 from polyglotdb.acoustics.segments import generate_utterance_segments
 from polyglotdb.acoustics.utils import PADDING
 from polyglotdb.exceptions import AcousticError
@@ -12,6 +14,7 @@ def analyze_intensity(
     call_back=None,
     stop_check=None,
     multiprocessing=True,
+    resume=False,
 ):
     """
     Analyze intensity of an entire utterance, and save the resulting intensity tracks into the database.
@@ -21,13 +24,16 @@ def analyze_intensity(
     corpus_context : :class:`~polyglot.corpus.context.CorpusContext`
         corpus context to use
     source : str
-        Source program to use (only `praat` available)
+        Source program to use, either `praat` or `native` (which runs in Python without calling Praat)
     call_back : callable
         call back function, optional
     stop_check : function
         stop check function, optional
     multiprocessing : bool
         Flag to use multiprocessing rather than threading
+    resume : bool
+        Flag for skipping utterances that were already analyzed and saved with the same settings, for
+        instance by a run that was interrupted
     """
     segment_mapping = generate_utterance_segments(
         corpus_context, padding=PADDING, file_type="consonant"
@@ -40,18 +46,26 @@ def analyze_intensity(
             corpus_context, "intensity", [("Intensity", float)]
         )
         corpus_context.encode_hierarchy()
+    checkpoint = AnalysisCheckpoint(corpus_context, "intensity")
+    parameters = {"source": source}
     for i, ((speaker,), v) in enumerate(segment_mapping.items()):
-        intensity_function = generate_base_intensity_function(corpus_context)
-        output = analyze_segments(
+        if resume:
+            v = checkpoint.missing(v, parameters)
+            if not v:
+                continue
+        intensity_function = generate_base_intensity_function(corpus_context, source=source)
+        output = analyze_file_segments(
             v,
             intensity_function,
             stop_check=stop_check,
             multiprocessing=multiprocessing,
         )
         corpus_context.save_acoustic_tracks("intensity", output, speaker)
+        corpus_context.acoustic_writer().flush()
+        checkpoint.mark_done(output.keys(), parameters)
 
 
-def generate_base_intensity_function(corpus_context):
+def generate_base_intensity_function(corpus_context, source="praat"):
     """
     Generate an Intensity function from Conch
 
@@ -59,12 +73,16 @@ def generate_base_intensity_function(corpus_context):
     ----------
     corpus_context : :class:`~polyglotdb.CorpusContext`
         CorpusContext to use for getting path to Praat (if not on the system path)
+    source : str
+        Source program to use, either `praat` or `native`
 
     Returns
     -------
-    :class:`~conch.analysis.intensity.PraatSegmentIntensityTrackFunction`
+    :class:`~conch.analysis.intensity.PraatSegmentIntensityTrackFunction` or :class:`~polyglotdb.acoustics.native.NativeIntensityTrackFunction`
         Intensity analysis function
     """
+    if source == "native":
+        return NativeIntensityTrackFunction(time_step=0.01)
     if getattr(corpus_context.config, "praat_path", None) is None:
         raise (AcousticError("Could not find the Praat executable"))
     intensity_function = PraatSegmentIntensityTrackFunction(
@@ -1,6 +1,6 @@
 import csv
+import hashlib
 import os
-import re
 import shutil
 import subprocess
 
@@ -48,52 +48,128 @@ def resample_audio(file_path, new_file_path, new_sr):
         write_wav(sig, sr, new_file_path)
 
 
-def add_discourse_sound_info(corpus_context, discourse, filepath):
+def file_hash(file_path, chunk_size=1048576):
+    """
+    Generate a hash of a file's contents
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the file
+    chunk_size : int
+        Number of bytes to read at a time
+
+    Returns
+    -------
+    str
+        SHA-1 hash of the file
+    """
+    h = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cached_resample_audio(file_path, new_file_path, new_sr, cache_dir, key):
+    """
+    Resample an audio file through a cache of resampled files shared across corpora, so that a recording is only
+    resampled to a given rate once
+
+    Parameters
+    ----------
+    file_path : str
+        Path to audio file
+    new_file_path : str
+        Path to save new audio file
+    new_sr : int
+        Sampling rate of new audio file
+    cache_dir : str
+        Directory of the cache
+    key : str
+        Key of the original recording in the cache, i.e., the hash of its contents
+
+    Returns
+    -------
+    str
+        Path to the resampled file in the cache
+    """
+    cached_path = os.path.join(cache_dir, "{}_{}.wav".format(key, new_sr))
+    if not os.path.exists(cached_path):
+        # Resample to a unique temporary file first, so that other processes never see a partial file
+        temp_path = os.path.join(cache_dir, "{}_{}.{}.tmp.wav".format(key, new_sr, os.getpid()))
+        resample_audio(file_path, temp_path, new_sr)
+        os.replace(temp_path, cached_path)
+    # Copied rather than linked, so that changing a discourse's file does not change the cache or other corpora
+    if os.path.exists(new_file_path):
+        os.remove(new_file_path)
+    shutil.copy(cached_path, new_file_path)
+    return cached_path
+
+
+def prepare_discourse_audio(filepath, audio_dir, cache_dir=None):
+    """
+    Generate the consonant, vowel and low frequency versions of a discourse's sound file
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the discourse's sound file
+    audio_dir : str
+        Directory to save the sound files of the discourse in
+    cache_dir : str, optional
+        Directory of a cache of resampled files shared across corpora, if None, files are resampled
+        directly into the discourse's directory
+
+    Returns
+    -------
+    dict
+        Information about the sound files for :func:`save_discourse_sound_info`
+    """
     with soundfile.SoundFile(filepath) as f:
         sample_rate = f.samplerate
         n_channels = f.channels
-    try:
-        p = subprocess.Popen(
-            ["sox", filepath, "-n", "stat"],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        output, err = p.communicate()
-        err = err.decode("utf8")
-        warnings = re.search(r"(sox WARN.*)", err).groups()
-        if warnings:
-            for w in warnings:
-                print(w)
-        duration = float(re.search(r"Length \(seconds\):\s+([0-9.]+)", err).groups()[0])
-    except Exception:
-        with soundfile.SoundFile(filepath) as f:
-            frames = f.frames
-            sample_rate = f.samplerate
-            duration = frames / sample_rate
-    audio_dir = corpus_context.discourse_audio_directory(discourse)
+        duration = f.frames / f.samplerate
     os.makedirs(audio_dir, exist_ok=True)
-    consonant_rate = 16000
-    consonant_path = os.path.join(audio_dir, "consonant.wav")
-    vowel_rate = 11000
-    vowel_path = os.path.join(audio_dir, "vowel.wav")
-    low_freq_rate = 2000
-    low_freq_path = os.path.join(audio_dir, "low_freq.wav")
-    if sample_rate > consonant_rate:
-        resample_audio(filepath, consonant_path, consonant_rate)
-    else:
-        shutil.copy(filepath, consonant_path)
-        consonant_rate = sample_rate
-    if sample_rate > vowel_rate:
-        resample_audio(consonant_path, vowel_path, vowel_rate)
-    else:
-        shutil.copy(filepath, vowel_path)
-        vowel_rate = sample_rate
-    if sample_rate > low_freq_rate:
-        resample_audio(vowel_path, low_freq_path, low_freq_rate)
-    else:
-        shutil.copy(filepath, low_freq_path)
-        low_freq_rate = sample_rate
+    key = None
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        key = file_hash(filepath)
+    info = {
+        "filepath": filepath,
+        "duration": duration,
+        "sampling_rate": sample_rate,
+        "n_channels": n_channels,
+    }
+    # Each version is resampled from the previous one
+    source_path = filepath
+    for name, rate in [("consonant", 16000), ("vowel", 11000), ("low_freq", 2000)]:
+        path = os.path.join(audio_dir, "{}.wav".format(name))
+        info["{}_filepath".format(name)] = path
+        if sample_rate <= rate:
+            shutil.copy(filepath, path)
+        elif key is not None:
+            source_path = cached_resample_audio(source_path, path, rate, cache_dir, key)
+            continue
+        else:
+            resample_audio(source_path, path, rate)
+        source_path = path
+    return info
+
+
+def save_discourse_sound_info(corpus_context, discourse, info):
+    """
+    Save information about a discourse's sound files to the graph
+
+    Parameters
+    ----------
+    corpus_context : :class:`~polyglotdb.corpus.CorpusContext`
+        Corpus to save to
+    discourse : str
+        Name of the discourse
+    info : dict
+        Information generated by :func:`prepare_discourse_audio`
+    """
     statement = """MATCH (d:Discourse:{corpus_name}) where d.name = $discourse_name
                     SET d.file_path = $filepath,
                     d.consonant_file_path = $consonant_filepath,
@@ -104,17 +180,16 @@ def add_discourse_sound_info(corpus_context, discourse, filepath):
                     d.num_channels = $n_channels""".format(
         corpus_name=corpus_context.cypher_safe_name
     )
-    corpus_context.execute_cypher(
-        statement,
-        filepath=filepath,
-        consonant_filepath=consonant_path,
-        vowel_filepath=vowel_path,
-        low_freq_filepath=low_freq_path,
-        duration=duration,
-        sampling_rate=sample_rate,
-        n_channels=n_channels,
-        discourse_name=discourse,
+    corpus_context.execute_cypher(statement, discourse_name=discourse, **info)
+
+
+def add_discourse_sound_info(corpus_context, discourse, filepath):
+    info = prepare_discourse_audio(
+        filepath,
+        corpus_context.discourse_audio_directory(discourse),
+        corpus_context.config.audio_cache_dir,
     )
+    save_discourse_sound_info(corpus_context, discourse, info)
 
 
 def setup_audio(corpus_context, data):
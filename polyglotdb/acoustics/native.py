@@ -0,0 +1,632 @@
+import os
+from math import gcd
+
+import librosa
+import numpy as np
+from conch.analysis.functions import BaseAnalysisFunction
+from conch.analysis.segments import SignalSegment
+from scipy.signal import resample_poly
+
+
+def frame_signal(signal, sr, window_length, time_step):
+    """
+    Split a signal into overlapping frames, centred over the signal in the same way as Praat
+
+    Parameters
+    ----------
+    signal : numpy.array
+        Signal to split
+    sr : int
+        Sample rate of the signal
+    window_length : float
+        Duration of each frame in seconds
+    time_step : float
+        Time between the centres of consecutive frames in seconds
+
+    Returns
+    -------
+    numpy.array
+        Frames of the signal, one per row
+    numpy.array
+        Time of the centre of each frame in seconds
+    """
+    frame_length = int(round(window_length * sr))
+    duration = signal.shape[0] / sr
+    if signal.shape[0] < frame_length:
+        return np.zeros((0, frame_length)), np.zeros(0)
+    num_frames = int(np.floor((duration - window_length) / time_step + 1e-9)) + 1
+    first_time = (duration - (num_frames - 1) * time_step) / 2
+    times = first_time + np.arange(num_frames) * time_step
+    starts = np.round(times * sr - frame_length / 2).astype(int)
+    starts = np.clip(starts, 0, signal.shape[0] - frame_length)
+    frames = signal[starts[:, None] + np.arange(frame_length)]
+    return frames, times
+
+
+def _autocorrelation(frames, num_lags):
+    n_fft = 1 << int(np.ceil(np.log2(2 * frames.shape[-1])))
+    spectrum = np.fft.rfft(frames, n_fft, axis=-1)
+    return np.fft.irfft(np.abs(spectrum) ** 2, n_fft, axis=-1)[..., :num_lags]
+
+
+def native_pitch(
+    signal,
+    sr,
+    time_step=0.01,
+    min_pitch=50,
+    max_pitch=500,
+    silence_threshold=0.03,
+    voicing_threshold=0.45,
+    octave_cost=0.01,
+    periods_per_window=3,
+):
+    """
+    Estimate F0 with the autocorrelation method of Boersma (1993), computed for all frames at once
+
+    Each frame is voiced if its best autocorrelation candidate is stronger than the unvoiced candidate, using
+    the same candidate strengths as Praat's ``To Pitch (ac)``, though without Praat's path finding across frames.
+
+    Parameters
+    ----------
+    signal : numpy.array
+        Signal to analyze
+    sr : int
+        Sample rate of the signal
+    time_step : float
+        Time between frames in seconds
+    min_pitch : float
+        Pitch floor in Hz
+    max_pitch : float
+        Pitch ceiling in Hz
+    silence_threshold : float
+        Frames with peak amplitudes below this proportion of the signal's peak amplitude are unvoiced
+    voicing_threshold : float
+        Minimum autocorrelation strength for a frame to be voiced
+    octave_cost : float
+        Bias towards higher F0 candidates, per octave
+    periods_per_window : float
+        Length of the analysis window in periods of the pitch floor
+
+    Returns
+    -------
+    dict
+        F0 for each frame keyed by time, with unvoiced frames having an F0 of None
+    """
+    signal = np.asarray(signal, dtype=np.float64)
+    frames, times = frame_signal(signal, sr, periods_per_window / min_pitch, time_step)
+    output = {}
+    if not len(times):
+        return output
+    min_lag = max(int(np.floor(sr / max_pitch)), 2)
+    max_lag = min(int(np.ceil(sr / min_pitch)), frames.shape[1] // 2)
+    frames = frames - frames.mean(axis=1, keepdims=True)
+    local_peak = np.abs(frames).max(axis=1)
+    global_peak = np.abs(signal - signal.mean()).max()
+
+    window = np.hanning(frames.shape[1])
+    window_ac = _autocorrelation(window, max_lag + 2)
+    frame_ac = _autocorrelation(frames * window, max_lag + 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = (frame_ac / frame_ac[:, :1]) / (window_ac / window_ac[0])
+    r = np.nan_to_num(r, nan=0.0)
+
+    lags = np.arange(min_lag, max_lag + 1)
+    candidates = r[:, min_lag : max_lag + 1]
+    is_peak = (candidates >= r[:, min_lag - 1 : max_lag]) & (
+        candidates > r[:, min_lag + 1 : max_lag + 2]
+    )
+    strength = candidates - octave_cost * np.log2(min_pitch * lags / sr)
+    strength = np.where(is_peak, strength, -np.inf)
+    best = strength.argmax(axis=1)
+    best_strength = strength[np.arange(len(best)), best]
+
+    # Refine the lag of the best peak with parabolic interpolation
+    best_lag = lags[best]
+    rows = np.arange(len(best))
+    left, centre, right = (r[rows, best_lag - 1], r[rows, best_lag], r[rows, best_lag + 1])
+    denominator = left - 2 * centre + right
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shift = np.where(denominator < 0, 0.5 * (left - right) / denominator, 0)
+    f0 = sr / (best_lag + shift)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unvoiced_strength = voicing_threshold + np.maximum(
+            0,
+            2 - (local_peak / global_peak) / (silence_threshold / (1 + voicing_threshold)),
+        )
+    voiced = (
+        np.isfinite(best_strength)
+        & (best_strength > unvoiced_strength)
+        & (f0 >= min_pitch)
+        & (f0 <= max_pitch)
+    )
+    for t, v, value in zip(np.round(times, 3), voiced, f0):
+        output[float(t)] = {"F0": float(value) if v else None}
+    return output
+
+
+def native_intensity(signal, sr, time_step=0.01, min_pitch=100, subtract_mean=True):
+    """
+    Calculate intensity in dB SPL in the same way as Praat's ``To Intensity``, computed for all frames at once
+
+    Parameters
+    ----------
+    signal : numpy.array
+        Signal to analyze, in Pascal
+    sr : int
+        Sample rate of the signal
+    time_step : float
+        Time between frames in seconds
+    min_pitch : float
+        Lowest pitch expected in the signal, which determines the window length
+    subtract_mean : bool
+        Flag for subtracting the (windowed) mean of each frame before calculating its energy
+
+    Returns
+    -------
+    dict
+        Intensity for each frame keyed by time
+    """
+    signal = np.asarray(signal, dtype=np.float64)
+    frames, times = frame_signal(signal, sr, 6.4 / min_pitch, time_step)
+    output = {}
+    if not len(times):
+        return output
+    window = np.kaiser(frames.shape[1], 20)
+    window_sum = window.sum()
+    if subtract_mean:
+        frames = frames - (frames @ window / window_sum)[:, None]
+    energy = (frames**2) @ window / window_sum
+    with np.errstate(divide="ignore"):
+        intensity = np.where(energy < 1e-30, -300, 10 * np.log10(energy / 4e-10))
+    for t, value in zip(np.round(times, 3), intensity):
+        output[float(t)] = {"Intensity": float(value)}
+    return output
+
+
+def burg_lpc(frames, order):
+    """
+    Estimate linear prediction coefficients with Burg's method for all frames at once
+
+    Burg's method is recursive in the model order, so the coefficients of every order up to the maximum come
+    from a single pass.
+
+    Parameters
+    ----------
+    frames : numpy.array
+        Windowed frames, one per row
+    order : int
+        Maximum order of the linear prediction model
+
+    Returns
+    -------
+    list
+        Coefficients of each frame for each order from 1 to ``order``, as arrays with one row per frame
+    """
+    frames = np.asarray(frames, dtype=np.float64)
+    forward = frames[:, 1:]
+    backward = frames[:, :-1]
+    a = np.zeros((frames.shape[0], order + 1))
+    a[:, 0] = 1
+    coefficients = []
+    for m in range(order):
+        numerator = -2 * np.sum(forward * backward, axis=1)
+        denominator = np.sum(forward**2 + backward**2, axis=1)
+        k = np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)[
+            :, None
+        ]
+        a[:, : m + 2] = a[:, : m + 2] + k * a[:, m + 1 :: -1]
+        coefficients.append(a[:, : m + 2].copy())
+        forward, backward = (forward + k * backward)[:, 1:], (backward + k * forward)[:, :-1]
+    return coefficients
+
+
+def lpc_formants(coefficients, sr, num_formants):
+    """
+    Get formant frequencies and bandwidths from the roots of linear prediction polynomials
+
+    Parameters
+    ----------
+    coefficients : numpy.array
+        Linear prediction coefficients, one row per frame
+    sr : int
+        Sample rate of the analyzed signal
+    num_formants : int
+        Number of formants to return
+
+    Returns
+    -------
+    numpy.array
+        Formant frequencies in Hz, one row per frame, with infinity for missing formants
+    numpy.array
+        Formant bandwidths in Hz, one row per frame
+    """
+    num_frames, order = coefficients.shape[0], coefficients.shape[1] - 1
+    companion = np.zeros((num_frames, order, order))
+    companion[:, 0, :] = -coefficients[:, 1:]
+    companion[:, np.arange(1, order), np.arange(order - 1)] = 1
+    roots = np.linalg.eigvals(np.nan_to_num(companion))
+    # Reflect unstable roots into the unit circle, as Praat does
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roots = np.where(np.abs(roots) > 1, 1 / np.conj(roots), roots)
+        frequencies = np.angle(roots) * sr / (2 * np.pi)
+        bandwidths = -np.log(np.abs(roots)) * sr / np.pi
+    valid = (frequencies > 50) & (frequencies < sr / 2 - 50)
+    frequencies = np.where(valid, frequencies, np.inf)
+    if order < num_formants:
+        padding = ((0, 0), (0, num_formants - order))
+        frequencies = np.pad(frequencies, padding, constant_values=np.inf)
+        bandwidths = np.pad(bandwidths, padding, constant_values=np.inf)
+    indices = np.argsort(frequencies, axis=1)[:, :num_formants]
+    frequencies = np.take_along_axis(frequencies, indices, axis=1)
+    bandwidths = np.take_along_axis(bandwidths, indices, axis=1)
+    bandwidths[np.isinf(frequencies)] = np.inf
+    return frequencies, bandwidths
+
+
+def _formant_signal(signal, sr, max_frequency):
+    """Resample a signal to twice the formant ceiling and pre-emphasize it from 50 Hz, as Praat does"""
+    signal = np.asarray(signal, dtype=np.float64)
+    new_sr = int(2 * max_frequency)
+    divisor = gcd(int(sr), new_sr)
+    signal = resample_poly(signal, new_sr // divisor, int(sr) // divisor)
+    signal[1:] = signal[1:] - np.exp(-2 * np.pi * 50 / new_sr) * signal[:-1]
+    return signal, new_sr
+
+
+def _gaussian_window(length):
+    """Gaussian window used by Praat's Burg formant analysis"""
+    edge = np.exp(-12.0)
+    mid = 0.5 * (length + 1)
+    i = np.arange(1, length + 1)
+    return (np.exp(-48.0 * (i - mid) ** 2 / (length + 1) ** 2) - edge) / (1 - edge)
+
+
+def _formant_values(frequencies, bandwidths, log_bandwidths=False):
+    values = {}
+    for i, (f, b) in enumerate(zip(frequencies, bandwidths)):
+        defined = np.isfinite(f)
+        if log_bandwidths and defined:
+            b = np.log10(b)
+        values["F{}".format(i + 1)] = float(f) if defined else None
+        values["B{}".format(i + 1)] = float(b) if defined else None
+    return values
+
+
+def native_formant_track(
+    signal, sr, time_step=0.01, window_length=0.025, num_formants=5, max_frequency=5500
+):
+    """
+    Track formants with Burg's method in the same way as Praat's ``To Formant (burg)``, computed for all
+    frames at once
+
+    Parameters
+    ----------
+    signal : numpy.array
+        Signal to analyze
+    sr : int
+        Sample rate of the signal
+    time_step : float
+        Time between frames in seconds
+    window_length : float
+        Effective length of the analysis window in seconds
+    num_formants : float
+        Number of formants to find, the linear prediction order is twice this number
+    max_frequency : float
+        Formant ceiling in Hz
+
+    Returns
+    -------
+    dict
+        Formant frequencies and bandwidths for each frame keyed by time
+    """
+    signal, sr = _formant_signal(signal, sr, max_frequency)
+    frames, times = frame_signal(signal, sr, 2 * window_length, time_step)
+    output = {}
+    if not len(times):
+        return output
+    frames = frames * _gaussian_window(frames.shape[1])
+    coefficients = burg_lpc(frames, int(2 * num_formants))[-1]
+    frequencies, bandwidths = lpc_formants(coefficients, sr, int(num_formants))
+    for t, f, b in zip(np.round(times, 3), frequencies, bandwidths):
+        output[float(t)] = _formant_values(f, b)
+    return output
+
+
+def _formant_point_frame(signal, sr, point, window_length, max_frequency):
+    """Get the windowed frame of a signal centred on a time point, resampled for formant analysis"""
+    signal, new_sr = _formant_signal(signal, sr, max_frequency)
+    frame_length = int(round(2 * window_length * new_sr))
+    start = int(round(point * new_sr - frame_length / 2))
+    frame = np.zeros(frame_length)
+    available = signal[max(start, 0) : start + frame_length]
+    offset = max(-start, 0)
+    frame[offset : offset + available.shape[0]] = available
+    return (frame * _gaussian_window(frame_length))[None, :], new_sr
+
+
+def _formant_amplitudes(signal, sr, point, begin, end, frequencies, bandwidths):
+    """
+    Measure the amplitude of each formant as the peak of the long-term average spectrum around it, in the same
+    way as the formant refinement Praat script
+    """
+    window_begin = max(begin, point - 0.025)
+    window_end = min(point + 0.025, end)
+    window = np.asarray(
+        signal[int(round(window_begin * sr)) : int(round(window_end * sr))], dtype=np.float64
+    )
+    band_width = np.ceil(sr / 512)
+    num_bands = int(np.ceil(sr / 2 / band_width))
+    power = np.abs(np.fft.rfft(window)) ** 2 / max(window.shape[0], 1) / sr
+    bins = np.minimum(
+        (np.fft.rfftfreq(window.shape[0], 1 / sr) / band_width).astype(int), num_bands - 1
+    )
+    band_power = np.bincount(bins, weights=power, minlength=num_bands) / np.maximum(
+        np.bincount(bins, minlength=num_bands), 1
+    )
+    with np.errstate(divide="ignore"):
+        band_db = 10 * np.log10(band_power / 4e-10)
+    band_centres = (np.arange(num_bands) + 0.5) * band_width
+    amplitudes = []
+    for j, (f, b) in enumerate(zip(frequencies, bandwidths)):
+        if not np.isfinite(f):
+            amplitudes.append(None)
+            continue
+        half_up = half_down = min(b, 300) / 2
+        if j < len(frequencies) - 1 and np.isfinite(frequencies[j + 1]):
+            half_up = min(half_up, (frequencies[j + 1] - f) / 2)
+        formant_down = max(f / 2, 200) if j == 0 else frequencies[j - 1]
+        if np.isfinite(formant_down):
+            half_down = min(half_down, (f - formant_down) / 2)
+        in_range = (band_centres >= f - half_down) & (band_centres <= f + half_up)
+        if not in_range.any():
+            in_range = np.arange(num_bands) == np.argmin(np.abs(band_centres - f))
+        amplitudes.append(float(band_db[in_range].max()))
+    return amplitudes
+
+
+def native_formant_point(
+    signal,
+    sr,
+    point,
+    time_step=0.01,
+    window_length=0.025,
+    num_formants=5,
+    max_frequency=5500,
+):
+    """
+    Measure formants at a single time point with Burg's method
+
+    Parameters
+    ----------
+    signal : numpy.array
+        Signal to analyze
+    sr : int
+        Sample rate of the signal
+    point : float
+        Time in seconds from the beginning of the signal to measure at
+    time_step : float
+        Unused, for consistency with the arguments of the formant track analysis
+    window_length : float
+        Effective length of the analysis window in seconds
+    num_formants : float
+        Number of formants to find, the linear prediction order is twice this number
+    max_frequency : float
+        Formant ceiling in Hz
+
+    Returns
+    -------
+    dict
+        Formant frequencies and bandwidths
+    """
+    frame, new_sr = _formant_point_frame(signal, sr, point, window_length, max_frequency)
+    coefficients = burg_lpc(frame, int(2 * num_formants))[-1]
+    frequencies, bandwidths = lpc_formants(coefficients, new_sr, int(num_formants))
+    return _formant_values(frequencies[0], bandwidths[0])
+
+
+def native_variable_formant_points(
+    signal,
+    sr,
+    point,
+    begin,
+    end,
+    min_formants=4,
+    max_formants=7,
+    window_length=0.025,
+    max_frequency=5500,
+):
+    """
+    Measure formants, bandwidths and amplitudes at a single time point for every candidate number of formants
+    between a minimum and maximum, in half steps, as the formant refinement Praat script does
+
+    All candidate model orders come from a single Burg analysis of the highest order.
+
+    Parameters
+    ----------
+    signal : numpy.array
+        Signal to analyze
+    sr : int
+        Sample rate of the signal
+    point : float
+        Time in seconds from the beginning of the signal to measure at
+    begin : float
+        Beginning of the segment in seconds from the beginning of the signal
+    end : float
+        End of the segment in seconds from the beginning of the signal
+    min_formants : int
+        Smallest number of formants to try
+    max_formants : int
+        Largest number of formants to try
+    window_length : float
+        Effective length of the analysis window in seconds
+    max_frequency : float
+        Formant ceiling in Hz
+
+    Returns
+    -------
+    dict
+        Formant frequencies, log10 bandwidths and amplitudes keyed by number of formants
+    """
+    frame, new_sr = _formant_point_frame(signal, sr, point, window_length, max_frequency)
+    coefficients = burg_lpc(frame, 2 * max_formants)
+    output = {}
+    for order in range(2 * min_formants, 2 * max_formants + 1):
+        num_formants = order // 2
+        frequencies, bandwidths = lpc_formants(coefficients[order - 1], new_sr, num_formants)
+        values = _formant_values(frequencies[0], bandwidths[0], log_bandwidths=True)
+        amplitudes = _formant_amplitudes(
+            signal, sr, point, begin, end, frequencies[0], bandwidths[0]
+        )
+        for i, a in enumerate(amplitudes):
+            values["A{}".format(i + 1)] = a
+        output[order / 2] = values
+    return output
+
+
+def _segment_signal(segment):
+    """
+    Get the signal of a segment with its padding, along with the beginning and end of the segment relative to
+    the start of the signal
+    """
+    padding = segment["padding"] or 0
+    begin, end = segment["begin"], segment["end"]
+    signal_begin = max(begin - padding, 0)
+    if isinstance(segment, SignalSegment):
+        signal, sr = segment.signal, segment.sr
+        if end is None:
+            end = signal_begin + signal.shape[-1] / sr - padding
+    else:
+        signal, sr = librosa.load(
+            os.path.expanduser(segment.file_path),
+            mono=False,
+            offset=signal_begin,
+            duration=end + padding - signal_begin,
+        )
+        if signal.ndim > 1:
+            signal = signal[segment.channel]
+    return signal, sr, begin - signal_begin, end - signal_begin
+
+
+class NativePitchTrackFunction(BaseAnalysisFunction):
+    """
+    Pitch analysis function that runs in Python on the signal in memory, rather than calling Praat or REAPER
+
+    Parameters
+    ----------
+    time_step : float
+        Time between frames in seconds
+    min_pitch : float
+        Pitch floor in Hz
+    max_pitch : float
+        Pitch ceiling in Hz
+    """
+
+    def __init__(self, time_step=0.01, min_pitch=50, max_pitch=500):
+        super(NativePitchTrackFunction, self).__init__()
+        self._function = native_pitch
+        self.arguments = [time_step, min_pitch, max_pitch]
+
+
+class NativeIntensityTrackFunction(BaseAnalysisFunction):
+    """
+    Intensity analysis function that runs in Python on the signal in memory, rather than calling Praat
+
+    Parameters
+    ----------
+    time_step : float
+        Time between frames in seconds
+    """
+
+    def __init__(self, time_step=0.01):
+        super(NativeIntensityTrackFunction, self).__init__()
+        self._function = native_intensity
+        self.arguments = [time_step]
+
+
+class NativeFormantTrackFunction(BaseAnalysisFunction):
+    """
+    Formant track analysis function that runs in Python on the signal in memory, rather than calling Praat
+
+    Parameters
+    ----------
+    time_step : float
+        Time between frames in seconds
+    window_length : float
+        Effective length of the analysis window in seconds
+    num_formants : float
+        Number of formants to find
+    max_frequency : float
+        Formant ceiling in Hz
+    """
+
+    def __init__(self, time_step=0.01, window_length=0.025, num_formants=5, max_frequency=5500):
+        super(NativeFormantTrackFunction, self).__init__()
+        self._function = native_formant_track
+        self.arguments = [time_step, window_length, num_formants, max_frequency]
+
+
+class NativeFormantPointFunction(BaseAnalysisFunction):
+    """
+    Formant point analysis function that measures formants part way through a segment in Python, rather than
+    calling Praat
+
+    Parameters
+    ----------
+    time_step : float
+        Time between frames in seconds
+    window_length : float
+        Effective length of the analysis window in seconds
+    num_formants : float
+        Number of formants to find
+    max_frequency : float
+        Formant ceiling in Hz
+    point_percent : float
+        Proportion of the way through the segment to measure at
+    """
+
+    def __init__(
+        self,
+        time_step=0.01,
+        window_length=0.025,
+        num_formants=5,
+        max_frequency=5500,
+        point_percent=0.33,
+    ):
+        super(NativeFormantPointFunction, self).__init__()
+        self._function = native_formant_point
+        self.arguments = [time_step, window_length, num_formants, max_frequency]
+        self.point_percent = point_percent
+
+    def __call__(self, segment):
+        signal, sr, begin, end = _segment_signal(segment)
+        point = begin + (end - begin) * self.point_percent
+        return self._function(signal, sr, point, *self.arguments)
+
+
+class NativeVariableFormantPointFunction(NativeFormantPointFunction):
+    """
+    Formant point analysis function that measures formants, bandwidths and amplitudes a third of the way through
+    a segment for a range of numbers of formants, in Python rather than calling Praat
+
+    Parameters
+    ----------
+    min_formants : int
+        Smallest number of formants to try
+    max_formants : int
+        Largest number of formants to try
+    window_length : float
+        Effective length of the analysis window in seconds
+    max_frequency : float
+        Formant ceiling in Hz
+    """
+
+    def __init__(self, min_formants=4, max_formants=7, window_length=0.025, max_frequency=5500):
+        super(NativeVariableFormantPointFunction, self).__init__()
+        self._function = native_variable_formant_points
+        self.arguments = [min_formants, max_formants, window_length, max_frequency]
+
+    def __call__(self, segment):
+        signal, sr, begin, end = _segment_signal(segment)
+        point = begin + (end - begin) * self.point_percent
+        return self._function(signal, sr, point, begin, end, *self.arguments)
@@ -1,9 +1,12 @@
+import hashlib
+import os
 import time
 
-from conch import analyze_segments
 from conch.analysis.praat import PraatAnalysisFunction
 
+from polyglotdb.acoustics.checkpoints import AnalysisCheckpoint
 from polyglotdb.acoustics.io import point_measures_from_csv, point_measures_to_csv
+from polyglotdb.acoustics.scheduling import analyze_file_segments
 from polyglotdb.acoustics.segments import generate_segments
 
 
@@ -42,6 +45,7 @@ def analyze_script(
     file_type="consonant",
     stop_check=None,
     multiprocessing=True,
+    resume=False,
 ):
     """
     Perform acoustic analysis of phones using an input praat script.
@@ -76,6 +80,14 @@ def analyze_script(
         stop check function, optional
     multiprocessing : bool
         Flag to use multiprocessing, otherwise will use threading
+    resume : bool
+        Flag for skipping annotations that were already analyzed and saved with the same script and settings,
+        for instance by a run that was interrupted
+
+    Returns
+    -------
+    list
+        Names of the measures saved, empty if all annotations were skipped
     """
     if file_type not in ["consonant", "vowel", "low_freq"]:
         raise ValueError("File type must be one of: consonant, vowel, or low_freq")
@@ -86,6 +98,19 @@ def analyze_script(
     if script_path is None:
         raise ValueError("Please specify script path")
 
+    with open(script_path, "rb") as f:
+        script_hash = hashlib.sha1(f.read()).hexdigest()
+    checkpoint = AnalysisCheckpoint(
+        corpus_context,
+        "script_{}_{}".format(annotation_type, os.path.splitext(os.path.basename(script_path))[0]),
+    )
+    parameters = {
+        "script": script_hash,
+        "arguments": arguments,
+        "padding": padding,
+        "file_type": file_type,
+    }
+
     if call_back is not None:
         call_back("Analyzing {}...".format(annotation_type))
     time_section = time.time()
@@ -101,9 +126,14 @@ def analyze_script(
         call_back("generate segments took: " + str(time.time() - time_section))
     praat_path = corpus_context.config.praat_path
     script_function = generate_praat_script_function(praat_path, script_path, arguments=arguments)
+    segments = segment_mapping.segments
+    if resume:
+        segments = checkpoint.missing(segments, parameters)
+        if not segments:
+            return []
     time_section = time.time()
-    output = analyze_segments(
-        segment_mapping.segments,
+    output = analyze_file_segments(
+        segments,
         script_function,
         stop_check=stop_check,
         multiprocessing=multiprocessing,
@@ -114,6 +144,7 @@ def analyze_script(
     header_info = {h: float for h in header}
     point_measures_to_csv(corpus_context, output, header)
     point_measures_from_csv(corpus_context, header_info, annotation_type=annotation_type)
+    checkpoint.mark_done(output.keys(), parameters)
     return [x for x in header if x != "id"]
 
 
@@ -162,7 +193,7 @@ def analyze_track_script(
     praat_path = corpus_context.config.praat_path
     script_function = generate_praat_script_function(praat_path, script_path, arguments=arguments)
     for i, ((speaker,), v) in enumerate(segment_mapping.items()):
-        output = analyze_segments(
+        output = analyze_file_segments(
             v, script_function, stop_check=stop_check, multiprocessing=multiprocessing
         )
         corpus_context.save_acoustic_tracks(acoustic_name, output, speaker)
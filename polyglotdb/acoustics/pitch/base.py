@@ -1,11 +1,12 @@
 import math
 from datetime import datetime
 
-from conch import analyze_segments
 from conch.analysis.segments import SegmentMapping
 
+from polyglotdb.acoustics.checkpoints import AnalysisCheckpoint
 from polyglotdb.acoustics.classes import TimePoint, Track
-from polyglotdb.acoustics.pitch.helper import generate_pitch_function
+from polyglotdb.acoustics.pitch.helper import PitchTrackCache, generate_pitch_function
+from polyglotdb.acoustics.scheduling import FileSegmentPool
 from polyglotdb.acoustics.segments import generate_utterance_segments
 from polyglotdb.acoustics.utils import PADDING
 from polyglotdb.exceptions import SpeakerAttributeError
@@ -91,13 +92,12 @@ def update_utterance_pitch_track(corpus_context, utterance, new_track):
         u = r["u"]
         phones = r["p"]
 
-    client = corpus_context.acoustic_client()
     query = f"""DELETE from "pitch"
                     where "discourse" = '{discourse}'
                     and "speaker" = '{speaker}'
                     and "time" >= {s_to_nano(u["begin"])}
                     and "time" <= {s_to_nano(u["end"])};"""
-    client.query(query)
+    corpus_context.execute_influxdb(query)
 
     data = []
     for data_point in new_track:
@@ -132,7 +132,7 @@ def update_utterance_pitch_track(corpus_context, utterance, new_track):
             "fields": fields,
         }
         data.append(d)
-    client.write_points(data, batch_size=1000, time_precision="ms")
+    corpus_context.acoustic_writer().write(data, time_precision="ms")
     if "pitch" not in corpus_context.hierarchy.acoustics:
         corpus_context.hierarchy.acoustics.add("pitch")
         corpus_context.encode_hierarchy()
@@ -149,6 +149,8 @@ def analyze_pitch(
     adjusted_octaves=1,
     stop_check=None,
     multiprocessing=True,
+    resume=False,
+    first_pass_cache=None,
 ):
     """
 
@@ -156,7 +158,8 @@ def analyze_pitch(
     ----------
     corpus_context : :class:`~polyglotdb.corpus.audio.AudioContext`
     source : str
-        Program to use for analyzing pitch, either ``praat`` or ``reaper``
+        Program to use for analyzing pitch, either ``praat``, ``reaper`` or ``native`` (which runs in Python
+        without calling an external program)
     algorithm : str
         Algorithm to use, ``base``, ``gendered``, or ``speaker_adjusted``
     absolute_min_pitch : int
@@ -171,6 +174,14 @@ def analyze_pitch(
         Function to report progress
     multiprocessing : bool
         Flag whether to use multiprocessing or threading
+    resume : bool
+        Flag for skipping utterances that were already analyzed and saved with the same settings, for
+        instance by a run that was interrupted
+    first_pass_cache : str, optional
+        For the ``speaker_adjusted`` algorithm, whether to keep the first pass's tracks of utterances whose
+        voiced frames already fall within the speaker's adjusted pitch floor and ceiling, and save those
+        instead of analyzing the utterances again, either ``memory`` to keep the tracks in memory or ``disk``
+        to write them to the corpus's temporary directory.  Defaults to analyzing every utterance again
 
     Returns
     -------
@@ -198,65 +209,160 @@ def analyze_pitch(
     if "pitch" not in corpus_context.hierarchy.acoustics:
         corpus_context.hierarchy.add_acoustic_properties(corpus_context, "pitch", [("F0", float)])
         corpus_context.encode_hierarchy()
-    if algorithm == "speaker_adjusted":
-        speaker_data = {}
-        if call_back is not None:
-            call_back("Getting original speaker means and SDs...")
-        for i, ((k,), v) in enumerate(segment_mapping.items()):
-            if call_back is not None:
-                call_back(f"Analyzing speaker {k} ({i + 1} of {num_speakers})")
-            output = analyze_segments(
-                v,
-                pitch_function,
-                stop_check=stop_check,
-                multiprocessing=multiprocessing,
-            )
-
-            sum_pitch = 0
-            n = 0
-            for seg, track in output.items():
-                for t, v in track.items():
-                    v = v["F0"]
-
-                    if v is not None and v > 0:  # only voiced frames
-                        n += 1
-                        sum_pitch += v
-            mean_pitch = sum_pitch / n
-            speaker_data[k] = int(mean_pitch / math.pow(2, adjusted_octaves)), int(
-                mean_pitch * math.pow(2, adjusted_octaves)
-            )
-
-    for i, ((speaker,), v) in enumerate(segment_mapping.items()):
-        if call_back is not None:
-            call_back("Analyzing speaker {} ({} of {})".format(speaker, i + 1, num_speakers))
-        if algorithm == "gendered":
-            min_pitch = absolute_min_pitch
-            max_pitch = absolute_max_pitch
-            try:
-                q = corpus_context.query_speakers().filter(corpus_context.speaker.name == speaker)
-                q = q.columns(corpus_context.speaker.gender.column_name("Gender"))
-                gender = q.all()[0]["Gender"]
-                if gender is not None:
-                    if gender.lower()[0] == "f":
-                        min_pitch = 100
-                    else:
-                        max_pitch = 400
-            except SpeakerAttributeError:
-                pass
-            pitch_function = generate_pitch_function(source, min_pitch, max_pitch, path=path)
-        elif algorithm == "speaker_adjusted":
-            min_pitch, max_pitch = speaker_data[speaker]
-            if min_pitch < absolute_min_pitch:
+    checkpoint = AnalysisCheckpoint(corpus_context, "pitch")
+    adjusted_parameters = {
+        "source": source,
+        "algorithm": algorithm,
+        "absolute_min_pitch": absolute_min_pitch,
+        "absolute_max_pitch": absolute_max_pitch,
+        "adjusted_octaves": adjusted_octaves,
+    }
+    speaker_segments = {speaker: v for (speaker,), v in segment_mapping.items()}
+    cache = None
+    if algorithm == "speaker_adjusted" and first_pass_cache is not None:
+        directory = None
+        if first_pass_cache == "disk":
+            directory = corpus_context.config.temporary_directory("pitch_first_pass")
+        cache = PitchTrackCache(directory)
+    speaker_parameters = {}
+    if call_back is not None:
+        call_back("Analyzing {} speakers...".format(num_speakers))
+    # Speakers are analyzed concurrently, so each speaker's second pass starts as soon as their first pass
+    # is done, and their tracks are saved while the workers carry on with the other speakers
+    with FileSegmentPool(multiprocessing=multiprocessing, stop_check=stop_check) as pool:
+        for speaker, v in speaker_segments.items():
+            if algorithm == "speaker_adjusted":
+                # Speaker adjusted settings depend on a first pass over all the speaker's utterances
+                if resume and not checkpoint.missing(v, adjusted_parameters):
+                    continue
+                speaker_parameters[speaker] = adjusted_parameters
+                pool.submit(("first pass", speaker), v, pitch_function)
+                continue
+            if algorithm == "gendered":
                 min_pitch = absolute_min_pitch
-            if max_pitch > absolute_max_pitch:
                 max_pitch = absolute_max_pitch
-            pitch_function = generate_pitch_function(source, min_pitch, max_pitch, path=path)
-        output = analyze_segments(
-            v, pitch_function, stop_check=stop_check, multiprocessing=multiprocessing
-        )
-        corpus_context.save_acoustic_tracks("pitch", output, speaker)
+                try:
+                    q = corpus_context.query_speakers().filter(
+                        corpus_context.speaker.name == speaker
+                    )
+                    q = q.columns(corpus_context.speaker.gender.column_name("Gender"))
+                    gender = q.all()[0]["Gender"]
+                    if gender is not None:
+                        if gender.lower()[0] == "f":
+                            min_pitch = 100
+                        else:
+                            max_pitch = 400
+                except SpeakerAttributeError:
+                    pass
+                speaker_function = generate_pitch_function(source, min_pitch, max_pitch, path=path)
+                parameters = {"source": source, "min_pitch": min_pitch, "max_pitch": max_pitch}
+            else:
+                speaker_function = pitch_function
+                parameters = {
+                    "source": source,
+                    "min_pitch": absolute_min_pitch,
+                    "max_pitch": absolute_max_pitch,
+                }
+            if resume:
+                v = checkpoint.missing(v, parameters)
+                if not v:
+                    continue
+            speaker_parameters[speaker] = parameters
+            pool.submit(("analysis", speaker), v, speaker_function)
+
+        num_done = 0
+        for (stage, speaker), output in pool.completed():
+            if stage == "first pass":
+                min_pitch, max_pitch = speaker_pitch_range(output, adjusted_octaves)
+                if min_pitch < absolute_min_pitch:
+                    min_pitch = absolute_min_pitch
+                if max_pitch > absolute_max_pitch:
+                    max_pitch = absolute_max_pitch
+                speaker_function = generate_pitch_function(source, min_pitch, max_pitch, path=path)
+                v = speaker_segments[speaker]
+                if resume:
+                    v = checkpoint.missing(v, adjusted_parameters)
+                if cache is not None:
+                    reusable = set(tracks_within_pitch_range(output, min_pitch, max_pitch))
+                    cache.store(speaker, {x: output[x] for x in v if x in reusable})
+                    v = [x for x in v if x not in reusable]
+                pool.submit(("analysis", speaker), v, speaker_function)
+                continue
+            if cache is not None and speaker in cache:
+                output.update(cache.load(speaker))
+            corpus_context.save_acoustic_tracks("pitch", output, speaker)
+            corpus_context.acoustic_writer().flush()
+            checkpoint.mark_done(output.keys(), speaker_parameters[speaker])
+            num_done += 1
+            if call_back is not None:
+                call_back(
+                    "Saved pitch for speaker {} ({} of {})".format(
+                        speaker, num_done, len(speaker_parameters)
+                    )
+                )
+    if speaker_parameters:
         today = datetime.utcnow()
         corpus_context.query_graph(corpus_context.utterance).set_properties(
             pitch_last_edited=today.timestamp()
         )
         corpus_context.encode_hierarchy()
+
+
+def speaker_pitch_range(output, adjusted_octaves=1):
+    """
+    Get a speaker adjusted pitch floor and ceiling from a first pass of pitch analysis over the speaker's
+    utterances
+
+    Parameters
+    ----------
+    output : dict
+        Pitch tracks keyed by segment
+    adjusted_octaves : int
+        How many octaves around the speaker's mean pitch to set the pitch floor and ceiling
+
+    Returns
+    -------
+    int
+        Pitch floor
+    int
+        Pitch ceiling
+    """
+    sum_pitch = 0
+    n = 0
+    for seg, track in output.items():
+        for t, v in track.items():
+            v = v["F0"]
+
+            if v is not None and v > 0:  # only voiced frames
+                n += 1
+                sum_pitch += v
+    mean_pitch = sum_pitch / n
+    return int(mean_pitch / math.pow(2, adjusted_octaves)), int(
+        mean_pitch * math.pow(2, adjusted_octaves)
+    )
+
+
+def tracks_within_pitch_range(output, min_pitch, max_pitch):
+    """
+    Find pitch tracks whose voiced frames all fall within a pitch floor and ceiling
+
+    Parameters
+    ----------
+    output : dict
+        Pitch tracks keyed by segment
+    min_pitch : float
+        Pitch floor
+    max_pitch : float
+        Pitch ceiling
+
+    Returns
+    -------
+    list
+        Segments with at least one voiced frame and no voiced frames outside of the range
+    """
+    segments = []
+    for seg, track in output.items():
+        voiced = [v["F0"] for v in track.values() if v["F0"] is not None and v["F0"] > 0]
+        if voiced and min_pitch <= min(voiced) and max(voiced) <= max_pitch:
+            segments.append(seg)
+    return segments
@@ -1,9 +1,15 @@
+import os
+
+import numpy as np
 from conch.analysis.pitch import (
     PitchTrackFunction,
     PraatSegmentPitchTrackFunction,
     ReaperPitchTrackFunction,
 )
 
+from polyglotdb.acoustics.checkpoints import parameter_hash
+from polyglotdb.acoustics.native import NativePitchTrackFunction
+
 
 def generate_pitch_function(algorithm, min_pitch, max_pitch, path=None, kwargs=None):
     time_step = 0.01
@@ -24,8 +30,91 @@ def generate_pitch_function(algorithm, min_pitch, max_pitch, path=None, kwargs=N
             time_step=time_step,
             **kwargs
         )
+    elif algorithm == "native":
+        pitch_function = NativePitchTrackFunction(
+            min_pitch=min_pitch, max_pitch=max_pitch, time_step=time_step
+        )
     else:
         pitch_function = PitchTrackFunction(
             min_pitch=min_pitch, max_pitch=max_pitch, time_step=time_step
         )
     return pitch_function
+
+
+class PitchTrackCache(object):
+    """
+    Store for pitch tracks from the first pass of a multi-pass analysis, so that they can be saved later
+    without analyzing their segments again
+
+    Tracks are kept in memory, or written to disk as compact arrays of times and F0 values if a directory is
+    given.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Directory to write the tracks to, defaults to keeping them in memory
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self._segments = {}
+        self._tracks = {}
+
+    def _path(self, key):
+        return os.path.join(self.directory, "{}.npz".format(parameter_hash(key)))
+
+    def __contains__(self, key):
+        return key in self._segments
+
+    def store(self, key, tracks):
+        """
+        Store pitch tracks
+
+        Parameters
+        ----------
+        key : str
+            Key to store the tracks under, such as the speaker's name
+        tracks : dict
+            Pitch tracks keyed by segment
+        """
+        segments = list(tracks.keys())
+        self._segments[key] = segments
+        if self.directory is None:
+            self._tracks[key] = tracks
+            return
+        lengths = np.array([len(tracks[x]) for x in segments], dtype=np.int64)
+        times = np.array([t for x in segments for t in tracks[x].keys()], dtype=np.float64)
+        f0 = np.array(
+            [np.nan if v["F0"] is None else v["F0"] for x in segments for v in tracks[x].values()],
+            dtype=np.float64,
+        )
+        np.savez(self._path(key), lengths=lengths, times=times, f0=f0)
+
+    def load(self, key):
+        """
+        Load and remove stored pitch tracks
+
+        Parameters
+        ----------
+        key : str
+            Key the tracks were stored under
+
+        Returns
+        -------
+        dict
+            Pitch tracks keyed by segment
+        """
+        segments = self._segments.pop(key)
+        if self.directory is None:
+            return self._tracks.pop(key)
+        path = self._path(key)
+        with np.load(path) as data:
+            offsets = np.concatenate([[0], np.cumsum(data["lengths"])])
+            times = data["times"].tolist()
+            f0 = [None if np.isnan(x) else x for x in data["f0"].tolist()]
+        os.remove(path)
+        tracks = {}
+        for i, segment in enumerate(segments):
+            begin, end = offsets[i], offsets[i + 1]
+            tracks[segment] = {t: {"F0": v} for t, v in zip(times[begin:end], f0[begin:end])}
+        return tracks
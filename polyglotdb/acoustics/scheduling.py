@@ -0,0 +1,333 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import librosa
+from conch import analyze_segments
+from conch.analysis.functions import BaseAnalysisFunction
+from conch.analysis.segments import SignalSegment
+
+MAX_BATCH_DURATION = 120
+
+
+def padded_bounds(segment):
+    """
+    Get the span of a sound file that an analysis of a segment reads, including its padding
+
+    Parameters
+    ----------
+    segment : :class:`~conch.analysis.segments.FileSegment`
+        Segment to get the span of
+
+    Returns
+    -------
+    float
+        Beginning of the span
+    float
+        End of the span
+    """
+    begin, end = segment.begin, segment.end
+    padding = segment["padding"]
+    if padding:
+        begin = max(begin - padding, 0)
+        end += padding
+    return begin, end
+
+
+class FileSegmentBatch(object):
+    """
+    Segments from a single sound file that are analyzed together by one worker, so that the file
+    is only opened and decoded once for all of them
+
+    Parameters
+    ----------
+    segments : list
+        :class:`~conch.analysis.segments.FileSegment` objects from the same file, sorted by time
+    """
+
+    def __init__(self, segments):
+        self.segments = tuple(segments)
+        self.file_path = self.segments[0].file_path
+        bounds = [padded_bounds(x) for x in self.segments]
+        self.begin = min(x[0] for x in bounds)
+        self.end = max(x[1] for x in bounds)
+
+    def __len__(self):
+        return len(self.segments)
+
+    def __iter__(self):
+        return iter(self.segments)
+
+    def __hash__(self):
+        return hash(self.segments)
+
+    def __eq__(self, other):
+        if not isinstance(other, FileSegmentBatch):
+            return False
+        return self.segments == other.segments
+
+    def __lt__(self, other):
+        if not isinstance(other, FileSegmentBatch):
+            return False
+        return (self.file_path, self.begin, self.end) < (other.file_path, other.begin, other.end)
+
+    def __repr__(self):
+        return "<FileSegmentBatch of {} segments from {} ({}-{})>".format(
+            len(self), self.file_path, self.begin, self.end
+        )
+
+
+class FileSegmentBatchFunction(object):
+    """
+    Wrapper around an analysis function that analyzes every segment in a
+    :class:`~polyglotdb.acoustics.scheduling.FileSegmentBatch`
+
+    Functions that work on signals have the span of the batch decoded once and each segment sliced from it
+    in memory.  Functions that read the sound file themselves (i.e., Praat scripts on long sound files and
+    AutoVOT) are called on each segment in turn, so that one worker reads through the file in order, unless they
+    have an ``analyze_batch`` method to analyze all the segments at once.
+
+    Parameters
+    ----------
+    function : callable
+        Analysis function that takes a single segment
+    """
+
+    def __init__(self, function):
+        self.function = function
+
+    @property
+    def slices_signal(self):
+        return (
+            isinstance(self.function, BaseAnalysisFunction)
+            and not self.function.uses_segments
+            and not self.function.requires_segment_as_arg
+        )
+
+    def __call__(self, batch):
+        if hasattr(self.function, "analyze_batch"):
+            return self.function.analyze_batch(batch)
+        if not self.slices_signal:
+            return {x: self.function(x) for x in batch}
+        signal, sr = librosa.load(
+            os.path.expanduser(batch.file_path),
+            mono=False,
+            offset=batch.begin,
+            duration=batch.end - batch.begin,
+        )
+        output = {}
+        for segment in batch:
+            begin, end = padded_bounds(segment)
+            begin_sample = int(round((begin - batch.begin) * sr))
+            end_sample = int(round((end - batch.begin) * sr))
+            segment_signal = signal[..., begin_sample:end_sample]
+            if segment_signal.ndim > 1:
+                segment_signal = segment_signal[segment.channel]
+            output[segment] = self.function(
+                SignalSegment(
+                    segment_signal,
+                    sr,
+                    begin=segment.begin,
+                    end=segment.end,
+                    padding=segment["padding"],
+                )
+            )
+        return output
+
+
+def file_segment_batches(segments, max_duration=MAX_BATCH_DURATION):
+    """
+    Group segments into batches of segments from the same sound file
+
+    Segments are sorted by file and time, and a file's segments are split into consecutive batches spanning
+    at most ``max_duration`` seconds, so that long recordings can still be spread across workers.
+
+    Parameters
+    ----------
+    segments : iterable
+        :class:`~conch.analysis.segments.FileSegment` objects to group
+    max_duration : float, optional
+        Maximum span in seconds of the sound file covered by a batch, defaults to 120
+
+    Returns
+    -------
+    list
+        :class:`~polyglotdb.acoustics.scheduling.FileSegmentBatch` objects
+    """
+    batches = []
+    current = []
+    current_begin = None
+    for segment in sorted(segments):
+        begin, end = padded_bounds(segment)
+        if current and (
+            segment.file_path != current[0].file_path or end - current_begin > max_duration
+        ):
+            batches.append(FileSegmentBatch(current))
+            current = []
+        if not current:
+            current_begin = begin
+        current.append(segment)
+    if current:
+        batches.append(FileSegmentBatch(current))
+    return batches
+
+
+def analyze_file_segments(
+    segments,
+    analysis_function,
+    stop_check=None,
+    multiprocessing=True,
+    max_duration=MAX_BATCH_DURATION,
+    num_jobs=None,
+):
+    """
+    Analyze segments with workers that each handle batches of segments from a single sound file, rather than
+    individual segments in arbitrary order
+
+    Parameters
+    ----------
+    segments : :class:`~conch.analysis.segments.SegmentMapping` or list
+        Segments to analyze
+    analysis_function : callable
+        Analysis function that takes a single segment
+    stop_check : callable, optional
+        Function to check whether to stop the analysis early
+    multiprocessing : bool, optional
+        Flag to use multiprocessing rather than threading, defaults to True
+    max_duration : float, optional
+        Maximum span in seconds of the sound file covered by a batch, defaults to 120
+    num_jobs : int, optional
+        Number of workers, defaults to three quarters of the available cores (at least one)
+
+    Returns
+    -------
+    dict
+        Output of the analysis function keyed by segment, as for :func:`conch.analyze_segments`
+    """
+    batches = file_segment_batches(segments, max_duration)
+    if not batches:
+        return {}
+    if num_jobs is None:
+        num_jobs = max(1, int(3 * os.cpu_count() / 4))
+    num_jobs = min(num_jobs, len(batches))
+    batch_output = analyze_segments(
+        batches,
+        FileSegmentBatchFunction(analysis_function),
+        num_jobs=num_jobs,
+        stop_check=stop_check,
+        multiprocessing=multiprocessing,
+    )
+    output = {}
+    for v in batch_output.values():
+        output.update(v)
+    return output
+
+
+class FileSegmentPool(object):
+    """
+    Pool of workers that runs several analyses of segments at once, such as the analyses of different speakers
+    or the passes of a multi-pass algorithm, in batches of segments from single sound files
+
+    Analyses can be submitted while others are still running, and the output of each is returned as soon as all
+    of its batches have finished, so that a later pass can start and results can be saved while the workers
+    keep analyzing everything else.
+
+    Parameters
+    ----------
+    num_jobs : int, optional
+        Number of workers, defaults to three quarters of the available cores (at least one)
+    multiprocessing : bool, optional
+        Flag to use multiprocessing rather than threading, defaults to True
+    max_duration : float, optional
+        Maximum span in seconds of the sound file covered by a batch, defaults to 120
+    stop_check : callable, optional
+        Function to check whether to stop the analysis early
+    """
+
+    def __init__(
+        self, num_jobs=None, multiprocessing=True, max_duration=MAX_BATCH_DURATION, stop_check=None
+    ):
+        if num_jobs is None:
+            num_jobs = max(1, int(3 * os.cpu_count() / 4))
+        self.num_jobs = num_jobs
+        self.multiprocessing = multiprocessing
+        self.max_duration = max_duration
+        self.stop_check = stop_check
+        self._executor = None
+        self._futures = {}
+        self._remaining = {}
+        self._outputs = {}
+        self._finished = []
+
+    def __enter__(self):
+        if self.multiprocessing:
+            self._executor = ProcessPoolExecutor(max_workers=self.num_jobs)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.num_jobs)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Batches that have not started are cancelled, rather than with shutdown's cancel_futures (which
+        # requires Python 3.9)
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=exc_type is None)
+        self._executor = None
+
+    def submit(self, key, segments, analysis_function):
+        """
+        Queue an analysis of segments
+
+        Parameters
+        ----------
+        key : object
+            Hashable key to identify the analysis's output, must not be in use by another pending analysis
+        segments : :class:`~conch.analysis.segments.SegmentMapping` or list
+            Segments to analyze
+        analysis_function : callable
+            Analysis function that takes a single segment
+        """
+        if key in self._outputs:
+            raise ValueError("An analysis with the key {} is already pending.".format(key))
+        batches = file_segment_batches(segments, self.max_duration)
+        self._outputs[key] = {}
+        self._remaining[key] = len(batches)
+        if not batches:
+            self._finished.append(key)
+            return
+        function = FileSegmentBatchFunction(analysis_function)
+        for batch in batches:
+            self._futures[self._executor.submit(function, batch)] = key
+
+    def completed(self):
+        """
+        Generate the output of submitted analyses in the order they finish, including analyses that are
+        submitted while iterating
+
+        Yields
+        ------
+        object
+            Key of the analysis
+        dict
+            Output of the analysis function keyed by segment
+        """
+        while self._finished or self._futures:
+            while self._finished:
+                key = self._finished.pop(0)
+                del self._remaining[key]
+                yield key, self._outputs.pop(key)
+            if not self._futures:
+                break
+            if self.stop_check is not None and self.stop_check():
+                for future in self._futures:
+                    future.cancel()
+                self._futures = {}
+                self._remaining = {}
+                self._outputs = {}
+                return
+            done, _ = wait(list(self._futures), timeout=1, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = self._futures.pop(future)
+                self._outputs[key].update(future.result())
+                self._remaining[key] -= 1
+                if not self._remaining[key]:
+                    self._finished.append(key)
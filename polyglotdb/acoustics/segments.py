@@ -39,106 +39,182 @@ def generate_segments(
         and not corpus_context.hierarchy.has_token_subset(annotation_type, subset)
     ):
         raise Exception()
-    speakers = corpus_context.speakers
+    discourses = _speaker_discourse_files(corpus_context, file_type)
     segment_mapping = SegmentMapping()
-    for s in speakers:
-        statement = """MATCH (s:Speaker:{corpus_name})-[r:speaks_in]->(d:Discourse:{corpus_name})
-                    WHERE s.name = $speaker_name
-                    RETURN d, r.channel as channel""".format(
-            corpus_name=corpus_context.cypher_safe_name
-        )
-        results = corpus_context.execute_cypher(statement, speaker_name=s)
-        for r in results:
-            channel = r["channel"]
-            discourse = r["d"]["name"]
-            if file_type == "vowel":
-                file_path = r["d"]["vowel_file_path"]
-            elif file_type == "low_freq":
-                file_path = r["d"]["low_freq_file_path"]
-            else:
-                file_path = r["d"]["consonant_file_path"]
-            if file_path is None:
-                print("Skipping discourse {} because no wav file exists.".format(discourse))
-                continue
-            discourse_duration = r["d"]["duration"]
-            at = getattr(corpus_context, annotation_type)
-            qr = corpus_context.query_graph(at)
-            if subset is not None:
-                qr = qr.filter(at.subset == subset)
-            qr = qr.filter(at.discourse.name == discourse)
-            qr = qr.filter(at.end <= discourse_duration)
-            qr = qr.filter(at.begin != at.end)  # Skip zero duration segments if they exist
-            if duration_threshold is not None:
-                qr = qr.filter(at.duration >= duration_threshold)
-            qr = qr.filter(at.speaker.name == s)
-            if (
-                annotation_type != "utterance"
-                and "utterance" in corpus_context.hierarchy.annotation_types
-            ):
-                qr.preload(at.utterance)
-            else:
-                qr.preload(at.discourse)
-            if fetch_subannotations:
-                for t in corpus_context.hierarchy.annotation_types:
-                    if t in corpus_context.hierarchy.subannotations:
-                        for s in corpus_context.hierarchy.subannotations[t]:
-                            if t == "utterance":
-                                qr = qr.preload(getattr(corpus_context.utterance, s))
-                            else:
-                                qr = qr.preload(getattr(getattr(corpus_context.utterance, t), s))
-
-            if qr.count() == 0:
-                continue
-            annotations = qr.all()
-            if annotations is not None:
-                for a in annotations:
-                    if annotation_type == "utterance":
-                        utt_id = a.id
-                    elif "utterance" not in corpus_context.hierarchy.annotation_types:
-                        utt_id = None
-                    else:
-                        utt_id = a.utterance.id
-                    if fetch_subannotations:
-                        # Get subannotations too
-                        subannotations = {}
-                        if (
-                            annotation_type in corpus_context.hierarchy.subannotations
-                            and corpus_context.hierarchy.subannotations[annotation_type]
-                        ):
-                            for s in corpus_context.hierarchy.subannotations[annotation_type]:
-                                if getattr(a, s):
-                                    subannotations[s] = getattr(a, s)[0]
-                        segment_mapping.add_file_segment(
-                            file_path,
-                            a.begin,
-                            a.end,
-                            label=a.label,
-                            id=a.id,
-                            utterance_id=utt_id,
-                            discourse=discourse,
-                            channel=channel,
-                            speaker=s,
-                            annotation_type=annotation_type,
-                            padding=padding,
-                            subannotations=subannotations,
-                        )
-                    else:
-                        segment_mapping.add_file_segment(
-                            file_path,
-                            a.begin,
-                            a.end,
-                            label=a.label,
-                            id=a.id,
-                            utterance_id=utt_id,
-                            discourse=discourse,
-                            channel=channel,
-                            speaker=s,
-                            annotation_type=annotation_type,
-                            padding=padding,
-                        )
+    for s in corpus_context.speakers:
+        if not discourses.get(s):
+            continue
+        if fetch_subannotations:
+            for discourse, channel, file_path, discourse_duration in discourses[s]:
+                _add_subannotation_segments(
+                    corpus_context,
+                    segment_mapping,
+                    annotation_type,
+                    subset,
+                    duration_threshold,
+                    padding,
+                    s,
+                    discourse,
+                    channel,
+                    file_path,
+                    discourse_duration,
+                )
+            continue
+        at = getattr(corpus_context, annotation_type)
+        qr = corpus_context.query_graph(at)
+        if subset is not None:
+            qr = qr.filter(at.subset == subset)
+        qr = qr.filter(at.speaker.name == s)
+        qr = qr.filter(at.discourse.name.in_([x[0] for x in discourses[s]]))
+        qr = qr.filter(at.begin != at.end)  # Skip zero duration segments if they exist
+        if duration_threshold is not None:
+            qr = qr.filter(at.duration >= duration_threshold)
+        columns = [
+            at.discourse.name.column_name("discourse"),
+            at.id.column_name("id"),
+            at.begin.column_name("begin"),
+            at.end.column_name("end"),
+            at.label.column_name("label"),
+        ]
+        if (
+            annotation_type != "utterance"
+            and "utterance" in corpus_context.hierarchy.annotation_types
+        ):
+            columns.append(at.utterance.id.column_name("utterance_id"))
+        qr = qr.columns(*columns).order_by(at.begin)
+        by_discourse = {}
+        for r in qr.all():
+            by_discourse.setdefault(r["discourse"], []).append(r)
+        for discourse, channel, file_path, discourse_duration in discourses[s]:
+            for r in by_discourse.get(discourse, []):
+                if r["end"] > discourse_duration:
+                    continue
+                segment_mapping.add_file_segment(
+                    file_path,
+                    r["begin"],
+                    r["end"],
+                    label=r["label"],
+                    id=r["id"],
+                    utterance_id=(
+                        r["id"] if annotation_type == "utterance" else r.get("utterance_id")
+                    ),
+                    discourse=discourse,
+                    channel=channel,
+                    speaker=s,
+                    annotation_type=annotation_type,
+                    padding=padding,
+                )
     return segment_mapping
 
 
+def _speaker_discourse_files(corpus_context, file_type):
+    """
+    Get the sound files of every discourse that each speaker speaks in, with a single query
+
+    Parameters
+    ----------
+    corpus_context : :class:`~polyglot.corpus.context.CorpusContext`
+        The CorpusContext object of the corpus
+    file_type : str
+        One of 'low_freq', 'vowel', or 'consonant', specifies the type of audio file to use
+
+    Returns
+    -------
+    dict
+        Lists of discourse names, channels, file paths and durations keyed by speaker name
+    """
+    if file_type == "vowel":
+        file_property = "vowel_file_path"
+    elif file_type == "low_freq":
+        file_property = "low_freq_file_path"
+    else:
+        file_property = "consonant_file_path"
+    statement = """MATCH (s:Speaker:{corpus_name})-[r:speaks_in]->(d:Discourse:{corpus_name})
+                RETURN s.name as speaker, d.name as discourse, r.channel as channel,
+                d.{file_property} as file_path, d.duration as duration
+                ORDER BY speaker, discourse""".format(
+        corpus_name=corpus_context.cypher_safe_name, file_property=file_property
+    )
+    discourses = {}
+    for r in corpus_context.execute_cypher(statement):
+        if r["file_path"] is None:
+            print("Skipping discourse {} because no wav file exists.".format(r["discourse"]))
+            continue
+        discourses.setdefault(r["speaker"], []).append(
+            (r["discourse"], r["channel"], r["file_path"], r["duration"])
+        )
+    return discourses
+
+
+def _add_subannotation_segments(
+    corpus_context,
+    segment_mapping,
+    annotation_type,
+    subset,
+    duration_threshold,
+    padding,
+    speaker,
+    discourse,
+    channel,
+    file_path,
+    discourse_duration,
+):
+    """
+    Add segments for a speaker in a discourse along with their subannotations, which requires
+    hydrating annotation models
+    """
+    at = getattr(corpus_context, annotation_type)
+    qr = corpus_context.query_graph(at)
+    if subset is not None:
+        qr = qr.filter(at.subset == subset)
+    qr = qr.filter(at.discourse.name == discourse)
+    qr = qr.filter(at.end <= discourse_duration)
+    qr = qr.filter(at.begin != at.end)  # Skip zero duration segments if they exist
+    if duration_threshold is not None:
+        qr = qr.filter(at.duration >= duration_threshold)
+    qr = qr.filter(at.speaker.name == speaker)
+    if annotation_type != "utterance" and "utterance" in corpus_context.hierarchy.annotation_types:
+        qr.preload(at.utterance)
+    else:
+        qr.preload(at.discourse)
+    for t in corpus_context.hierarchy.annotation_types:
+        if t in corpus_context.hierarchy.subannotations:
+            for sub in corpus_context.hierarchy.subannotations[t]:
+                if t == "utterance":
+                    qr = qr.preload(getattr(corpus_context.utterance, sub))
+                else:
+                    qr = qr.preload(getattr(getattr(corpus_context.utterance, t), sub))
+    for a in qr.all():
+        if annotation_type == "utterance":
+            utt_id = a.id
+        elif "utterance" not in corpus_context.hierarchy.annotation_types:
+            utt_id = None
+        else:
+            utt_id = a.utterance.id
+        subannotations = {}
+        if (
+            annotation_type in corpus_context.hierarchy.subannotations
+            and corpus_context.hierarchy.subannotations[annotation_type]
+        ):
+            for sub in corpus_context.hierarchy.subannotations[annotation_type]:
+                if getattr(a, sub):
+                    subannotations[sub] = getattr(a, sub)[0]
+        segment_mapping.add_file_segment(
+            file_path,
+            a.begin,
+            a.end,
+            label=a.label,
+            id=a.id,
+            utterance_id=utt_id,
+            discourse=discourse,
+            channel=channel,
+            speaker=speaker,
+            annotation_type=annotation_type,
+            padding=padding,
+            subannotations=subannotations,
+        )
+
+
 def generate_vowel_segments(
     corpus_context, duration_threshold=None, padding=0, vowel_label="vowel"
 ):
@@ -0,0 +1,215 @@
+import math
+
+import numpy as np
+
+AVAILABLE_STATISTICS = ["mean", "median", "stddev", "sum", "mode", "count"]
+
+
+def group_indices(keys):
+    """
+    Map group keys to consecutive integer indices
+
+    Parameters
+    ----------
+    keys : iterable
+        Hashable group key for each point
+
+    Returns
+    -------
+    dict
+        Index of each unique key, in order of first appearance
+    numpy.array
+        Group index of each point
+    """
+    index = {}
+    inverse = np.fromiter((index.setdefault(k, len(index)) for k in keys), dtype=np.int64)
+    return index, inverse
+
+
+class GroupedStatistics(object):
+    """
+    Summary statistics of several acoustic measures for groups of points (e.g., speakers, phones or
+    speaker-phone pairs), accumulated one chunk of points at a time.
+
+    Counts, sums, means and sums of squared deviations are merged across chunks with Chan et al.'s
+    parallel update, so means and standard deviations never require holding all points in memory.
+    Medians and modes require the values themselves, so are only available when ``keep_values`` is set.
+
+    Parameters
+    ----------
+    measures : list
+        Names of the measures
+    keep_values : bool
+        Flag for keeping the values of each group, needed for medians and modes
+    """
+
+    def __init__(self, measures, keep_values=False):
+        self.measures = list(measures)
+        self.keep_values = keep_values
+        self.counts = {}
+        self.sums = {}
+        self.means = {}
+        self.m2s = {}
+        self.values = {}
+
+    def __contains__(self, key):
+        return key in self.counts
+
+    def keys(self):
+        return self.counts.keys()
+
+    def update(self, keys, values):
+        """
+        Add a chunk of points
+
+        Parameters
+        ----------
+        keys : list
+            Group key for each point, points with a key of None are ignored
+        values : numpy.array
+            Array of shape (number of points, number of measures), with NaN for missing values
+        """
+        values = np.asarray(values, dtype=np.float64).reshape(-1, len(self.measures))
+        index, inverse = group_indices(keys)
+        n_groups = len(index)
+        index.pop(None, None)
+        if not index:
+            return
+        present = ~np.isnan(values)
+        filled = np.where(present, values, 0.0)
+        shape = (n_groups, len(self.measures))
+        counts, sums, m2s = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+        for j in range(len(self.measures)):
+            counts[:, j] = np.bincount(inverse, weights=present[:, j], minlength=n_groups)
+            sums[:, j] = np.bincount(inverse, weights=filled[:, j], minlength=n_groups)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(counts > 0, sums / counts, 0.0)
+        deviations = np.where(present, filled - means[inverse], 0.0) ** 2
+        for j in range(len(self.measures)):
+            m2s[:, j] = np.bincount(inverse, weights=deviations[:, j], minlength=n_groups)
+        if self.keep_values:
+            order = np.argsort(inverse, kind="stable")
+            bounds = np.cumsum(np.bincount(inverse, minlength=n_groups))[:-1]
+            group_values = np.split(values[order], bounds)
+        for key, g in index.items():
+            self._merge(key, counts[g], sums[g], means[g], m2s[g])
+            if self.keep_values:
+                self.values.setdefault(key, []).append(group_values[g])
+
+    def _merge(self, key, count, total, mean, m2):
+        if key not in self.counts:
+            self.counts[key], self.sums[key], self.means[key], self.m2s[key] = (
+                count,
+                total,
+                mean,
+                m2,
+            )
+            return
+        old_count, old_mean = self.counts[key], self.means[key]
+        new_count = old_count + count
+        delta = mean - old_mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(new_count > 0, count / new_count, 0.0)
+            self.m2s[key] = self.m2s[key] + m2 + delta**2 * old_count * weight
+        self.means[key] = old_mean + delta * weight
+        self.sums[key] = self.sums[key] + total
+        self.counts[key] = new_count
+
+    def _statistic_array(self, key, statistic):
+        count = self.counts[key]
+        if statistic == "count":
+            return count
+        if statistic == "sum":
+            return np.where(count > 0, self.sums[key], np.nan)
+        if statistic == "mean":
+            return np.where(count > 0, self.means[key], np.nan)
+        if statistic == "stddev":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return np.where(count > 1, np.sqrt(self.m2s[key] / (count - 1)), np.nan)
+        if statistic in ["median", "mode"]:
+            if not self.keep_values:
+                raise ValueError("Values must be kept to calculate the {}.".format(statistic))
+            values = np.concatenate(self.values[key])
+            output = np.full(len(self.measures), np.nan)
+            for j in range(len(self.measures)):
+                column = values[:, j][~np.isnan(values[:, j])]
+                if not len(column):
+                    continue
+                if statistic == "median":
+                    output[j] = np.median(column)
+                else:
+                    unique, unique_counts = np.unique(column, return_counts=True)
+                    output[j] = unique[np.argmax(unique_counts)]
+            return output
+        raise ValueError(
+            "Statistic name should be one of: {}.".format(", ".join(AVAILABLE_STATISTICS))
+        )
+
+    def statistic(self, key, statistic):
+        """
+        Get a summary statistic of each measure for a group
+
+        Parameters
+        ----------
+        key : object
+            Group key
+        statistic : str
+            One of `mean`, `median`, `stddev`, `sum`, `mode`, `count`
+
+        Returns
+        -------
+        dict
+            Statistic for each measure, None where it is not defined
+        """
+        values = self._statistic_array(key, statistic)
+        if statistic == "count":
+            return {m: int(v) for m, v in zip(self.measures, values)}
+        return {m: None if math.isnan(v) else float(v) for m, v in zip(self.measures, values)}
+
+    def lookup(self, keys):
+        """
+        Get the means and standard deviations of the groups of each point
+
+        Parameters
+        ----------
+        keys : list
+            Group key for each point
+
+        Returns
+        -------
+        numpy.array
+            Means for each point and measure, NaN for unknown groups
+        numpy.array
+            Standard deviations for each point and measure, NaN for unknown groups or where undefined
+        """
+        index, inverse = group_indices(keys)
+        means = np.full((len(index), len(self.measures)), np.nan)
+        sds = np.full((len(index), len(self.measures)), np.nan)
+        for key, g in index.items():
+            if key in self.counts:
+                means[g] = self._statistic_array(key, "mean")
+                sds[g] = self._statistic_array(key, "stddev")
+        return means[inverse], sds[inverse]
+
+
+def z_scores(values, means, sds):
+    """
+    Relativize values as z-scores
+
+    Parameters
+    ----------
+    values : numpy.array
+        Values to relativize
+    means : numpy.array
+        Means to use for each value
+    sds : numpy.array
+        Standard deviations to use for each value
+
+    Returns
+    -------
+    numpy.array
+        Z-scores, NaN where the value is missing or the standard deviation is not defined or zero
+    """
+    sds = np.where(sds == 0, np.nan, sds)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (np.asarray(values, dtype=np.float64) - means) / sds
@@ -1,13 +1,135 @@
-from functools import partial
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
 import librosa
 import numpy as np
+import soundfile
 from librosa.core.spectrum import stft
-from scipy.signal import lfilter
+from scipy.signal import lfilter, windows
 
 PADDING = 0.1
 
 
+class SoundFileCache(object):
+    """
+    Cache of open sound files, so that reading many short slices of long recordings only needs a seek and a read
+    rather than opening and decoding the file each time
+
+    Handles are only reused within the process that opened them, and a file is reopened if it has changed on disk.
+    Reads through the cache should hold its ``lock``, since handles keep a read position.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of files to keep open
+    """
+
+    def __init__(self, max_size=32):
+        self.max_size = max_size
+        self.lock = threading.RLock()
+        self._files = OrderedDict()
+        self._pid = os.getpid()
+
+    def get(self, file_path):
+        """
+        Get an open handle for a sound file
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the sound file
+
+        Returns
+        -------
+        :class:`soundfile.SoundFile`
+            Open sound file
+        """
+        with self.lock:
+            if self._pid != os.getpid():
+                # Handles inherited from a parent process share its read positions, so are never used
+                self._files = OrderedDict()
+                self._pid = os.getpid()
+            stat = os.stat(file_path)
+            version = (stat.st_mtime_ns, stat.st_size)
+            if file_path in self._files:
+                cached_version, f = self._files[file_path]
+                if cached_version == version:
+                    self._files.move_to_end(file_path)
+                    return f
+                del self._files[file_path]
+                f.close()
+            f = soundfile.SoundFile(file_path)
+            self._files[file_path] = (version, f)
+            while len(self._files) > self.max_size:
+                _, (_, old) = self._files.popitem(last=False)
+                old.close()
+            return f
+
+    def clear(self):
+        """
+        Close all open sound files
+        """
+        with self.lock:
+            for _, f in self._files.values():
+                f.close()
+            self._files = OrderedDict()
+
+
+sound_file_cache = SoundFileCache()
+
+
+def read_waveform(file_path, begin=None, end=None):
+    """
+    Read a segment of an audio file at its original sampling rate, mixed down to mono
+
+    Files that can be read with ``soundfile`` are read by seeking to the segment in a cached open handle, so
+    reading a short segment of a long recording does not depend on the length of the recording.  Other files
+    fall back to ``librosa``.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to audio file
+    begin : float, optional
+        Time stamp of beginning of segment, defaults to the beginning of the file
+    end : float, optional
+        Time stamp of end of segment, defaults to the end of the file
+
+    Returns
+    -------
+    numpy.array
+        Signal data
+    int
+        Sample rate
+    """
+    file_path = os.path.expanduser(file_path)
+    if begin is None:
+        begin = 0.0
+    try:
+        with sound_file_cache.lock:
+            f = sound_file_cache.get(file_path)
+            sr = f.samplerate
+            # Sample positions are truncated as librosa does
+            start = min(max(int(begin * sr), 0), f.frames)
+            stop = f.frames
+            if end is not None:
+                stop = min(start + int((end - begin) * sr), f.frames)
+            f.seek(start)
+            signal = f.read(max(stop - start, 0), dtype="float32", always_2d=True)
+    except RuntimeError:
+        duration = None
+        if end is not None:
+            duration = end - begin
+        return librosa.load(file_path, sr=None, offset=begin, duration=duration)
+    if signal.shape[1] == 1:
+        signal = signal[:, 0]
+    else:
+        signal = signal.mean(axis=1)
+    return signal, sr
+
+
 def load_waveform(file_path, begin=None, end=None):
     """
     Load a waveform segment from an audio file
@@ -28,16 +150,41 @@ def load_waveform(file_path, begin=None, end=None):
     int
         Sample rate
     """
-    if begin is None:
-        begin = 0.0
-    duration = None
-    if end is not None:
-        duration = end - begin
-    signal, sr = librosa.load(file_path, sr=None, offset=begin, duration=duration)
+    signal, sr = read_waveform(file_path, begin, end)
     signal = lfilter([1.0, -0.95], 1, signal, axis=0)
     return signal, sr
 
 
+def waveform_envelope(signal, width):
+    """
+    Decimate a signal to the minimum and maximum amplitudes of consecutive bins of samples, so that it can be
+    plotted at a given width without drawing every sample
+
+    Parameters
+    ----------
+    signal : numpy.array
+        Signal to decimate
+    width : int
+        Number of bins (i.e., pixels) to decimate to, signals with no more samples than this are not decimated
+
+    Returns
+    -------
+    numpy.array
+        Minimum amplitude of each bin
+    numpy.array
+        Maximum amplitude of each bin
+    numpy.array
+        Index of the first sample of each bin
+    """
+    if width < 1:
+        raise ValueError("The width of a waveform envelope must be at least 1.")
+    num_samples = signal.shape[0]
+    if num_samples <= width:
+        return signal, signal, np.arange(num_samples)
+    starts = (np.arange(width) * num_samples) // width
+    return np.minimum.reduceat(signal, starts), np.maximum.reduceat(signal, starts), starts
+
+
 def generate_spectrogram(signal, sr, log_color_scale=True):
     """
     Generate a spectrogram
@@ -60,8 +207,6 @@ def generate_spectrogram(signal, sr, log_color_scale=True):
     float
         Frequency step between bins
     """
-    from scipy.signal import gaussian, lfilter
-
     n_fft = 256
     # if len(self._signal) / self._sr > 30:
     window_length = 0.005
@@ -74,22 +219,40 @@ def generate_spectrogram(signal, sr, log_color_scale=True):
     step_samp = int(len(signal) / num_steps)
     time_step = step_samp / sr
     freq_step = sr / n_fft
-    # if step_samp < 28:
-    #    step_samp = 28
-    #    step = step_samp / self._sr
-    # self._n_fft = 512
-    # window = partial(gaussian, std = 250/12)
-    window = "gaussian"
-    # win_len = None
-    if window == "gaussian":
-        window = partial(gaussian, std=0.45 * win_len / 2)
-    data = stft(signal, n_fft, step_samp, center=True, win_length=win_len, window=window)
+    data = stft(
+        signal,
+        n_fft=n_fft,
+        hop_length=step_samp,
+        center=True,
+        win_length=win_len,
+        window=spectrogram_window(win_len),
+    )
     data = np.abs(data)
     if log_color_scale:
         data = 20 * np.log10(data)
     return data, time_step, freq_step
 
 
+@lru_cache(maxsize=32)
+def spectrogram_window(win_len):
+    """
+    Get the Gaussian window used for spectrograms, which is only computed once for each length
+
+    Parameters
+    ----------
+    win_len : int
+        Length of the window in samples
+
+    Returns
+    -------
+    numpy.array
+        Read-only window
+    """
+    window = windows.gaussian(win_len, std=0.45 * win_len / 2)
+    window.flags.writeable = False
+    return window
+
+
 def make_path_safe(path):
     """
     Make a path safe for use in Cypher
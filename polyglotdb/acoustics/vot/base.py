@@ -1,11 +1,14 @@
+import math
 from uuid import uuid1
 
-from conch import analyze_segments
-from conch.analysis.autovot import AutoVOTAnalysisFunction
-from conch.analysis.segments import SegmentMapping
+from conch.analysis.segments import FileSegment
 
+from polyglotdb.acoustics.scheduling import FileSegmentPool
 from polyglotdb.acoustics.segments import generate_segments
 from polyglotdb.acoustics.utils import PADDING
+from polyglotdb.acoustics.vot.helper import AutoVOTBatchFunction
+
+SAVE_BATCH_SIZE = 1000
 
 
 def get_default_for_type(t):
@@ -32,10 +35,14 @@ def analyze_vot(
     call_back=None,
     stop_check=None,
     multiprocessing=False,
+    num_jobs=None,
 ):
     """
     Analyze VOT for stops using a pretrained AutoVOT classifier.
 
+    Discourses are analyzed in parallel, with one run of AutoVOT for all the speakers in a discourse, and VOTs are
+    saved in batches as discourses finish.
+
     Parameters
     ----------
     corpus_context : :class:`~polyglotdb.corpus.AudioContext`
@@ -59,6 +66,8 @@ def analyze_vot(
         stop check function, optional
     multiprocessing : bool
         Flag to use multiprocessing, otherwise will use threading
+    num_jobs : int, optional
+        Number of discourses to analyze at once, defaults to three quarters of the available cores
     """
     if not corpus_context.hierarchy.has_token_subset(
         "phone", stop_label
@@ -75,8 +84,8 @@ def analyze_vot(
         file_type="consonant",
         fetch_subannotations=True,
     ).grouped_mapping("discourse")
-    segment_mapping = SegmentMapping()
-    vot_func = AutoVOTAnalysisFunction(
+    discourse_segments = {}
+    vot_func = AutoVOTBatchFunction(
         classifier_to_use=classifier,
         min_vot_length=vot_min,
         max_vot_length=vot_max,
@@ -116,21 +125,56 @@ def analyze_vot(
                     speaker_mapped_stops[x["speaker"]] = [stop_info]
             for speaker in speaker_mapped_stops:
                 channel = corpus_context.get_channel_of_speaker(speaker, discourse)
-                segment_mapping.add_file_segment(
-                    sf["consonant_file_path"],
-                    0,
-                    sf["duration"],
-                    channel,
-                    name="{}-{}".format(speaker, discourse),
-                    vot_marks=speaker_mapped_stops[speaker],
+                discourse_segments.setdefault(discourse, []).append(
+                    FileSegment(
+                        sf["consonant_file_path"],
+                        0,
+                        sf["duration"],
+                        channel,
+                        name="{}-{}".format(speaker, discourse),
+                        vot_marks=speaker_mapped_stops[speaker],
+                    )
                 )
-    output = analyze_segments(
-        segment_mapping.segments,
-        vot_func,
-        stop_check=stop_check,
+
+    if call_back is not None:
+        call_back("Analyzing VOTs in {} discourses...".format(len(discourse_segments)))
+    # Each discourse is a single batch, so that AutoVOT only loads the classifier once for all its speakers
+    with FileSegmentPool(
+        num_jobs=num_jobs,
         multiprocessing=multiprocessing,
-    )
+        max_duration=math.inf,
+        stop_check=stop_check,
+    ) as pool:
+        for discourse, segments in discourse_segments.items():
+            pool.submit(discourse, segments, vot_func)
+        output = {}
+        num_stops = 0
+        for i, (discourse, discourse_output) in enumerate(pool.completed()):
+            if call_back is not None:
+                call_back(i + 1, len(discourse_segments))
+            output.update(discourse_output)
+            num_stops += sum(len(x) for x in discourse_output.values())
+            if num_stops >= SAVE_BATCH_SIZE:
+                save_vot_output(corpus_context, output, already_encoded_vots)
+                output = {}
+                num_stops = 0
+    if output:
+        save_vot_output(corpus_context, output, already_encoded_vots)
+
+
+def save_vot_output(corpus_context, output, already_encoded_vots):
+    """
+    Save VOTs measured by AutoVOT as subannotations of their stops
 
+    Parameters
+    ----------
+    corpus_context : :class:`~polyglotdb.corpus.AudioContext`
+    output : dict
+        AutoVOT output keyed by segment
+    already_encoded_vots : bool
+        Whether the corpus had VOT subannotations before the analysis, in which case the stop information in the
+        output includes the ID of the stop's existing VOT or ``new_vot``
+    """
     if already_encoded_vots:
         new_data = []
         updated_data = []
@@ -141,8 +185,8 @@ def analyze_vot(
         ]
         all_props = [x[0] for x in custom_props] + ["id", "begin", "end", "confidence"]
 
-        for discourse, discourse_output in output.items():
-            for begin, end, confidence, stop_id, vot_id in discourse_output:
+        for segment, segment_output in output.items():
+            for begin, end, confidence, stop_id, vot_id in segment_output:
                 if vot_id == "new_vot":
                     props = {
                         "id": str(uuid1()),
@@ -168,30 +212,26 @@ def analyze_vot(
                     updated_data.append(props)
         if updated_data:
             statement = """
-            UNWIND {{data}} as d
+            UNWIND $data as d
             MERGE (n:vot:{corpus_name} {{id: d.id}})
             SET n += d.props
-            """.format(
-                corpus_name=corpus_context.cypher_safe_name
-            )
+            """.format(corpus_name=corpus_context.cypher_safe_name)
             corpus_context.execute_cypher(statement, data=updated_data)
 
         if new_data:
             default_node = ", ".join(["{}: d.{}".format(p, p) for p in all_props])
             statement = """
-            UNWIND {{data}} as d
+            UNWIND $data as d
             MATCH (annotated:phone:{corpus_name} {{id: d.annotated_id}})
             CREATE (annotated) <-[:annotates]-(annotation:vot:{corpus_name}
                 {{{default_node}}})
-            """.format(
-                corpus_name=corpus_context.cypher_safe_name, default_node=default_node
-            )
+            """.format(corpus_name=corpus_context.cypher_safe_name, default_node=default_node)
             corpus_context.execute_cypher(statement, data=new_data)
     else:
         list_of_stops = []
         property_types = [("begin", float), ("end", float), ("confidence", float)]
-        for discourse, discourse_output in output.items():
-            for begin, end, confidence, stop_id in discourse_output:
+        for segment, segment_output in output.items():
+            for begin, end, confidence, stop_id in segment_output:
                 list_of_stops.append(
                     {
                         "begin": begin,
@@ -201,5 +241,5 @@ def analyze_vot(
                         "annotated_id": stop_id,
                     }
                 )
-
-        corpus_context.import_subannotations(list_of_stops, property_types, "vot", "phone")
+        if list_of_stops:
+            corpus_context.import_subannotations(list_of_stops, property_types, "vot", "phone")
@@ -0,0 +1,129 @@
+import os
+import shutil
+import subprocess
+import tempfile
+
+from conch.analysis.autovot import (
+    AutoVOTAnalysisFunction,
+    is_autovot_friendly_file,
+    resample_for_autovot,
+)
+from praatio import textgrid
+
+from polyglotdb.exceptions import AcousticError
+
+
+class AutoVOTBatchFunction(AutoVOTAnalysisFunction):
+    """
+    AutoVOT analysis function that can also measure the stops of several segments with a single run of AutoVOT,
+    so that the classifier is only loaded once for all of them
+
+    Parameters are the same as for :class:`~conch.analysis.autovot.AutoVOTAnalysisFunction`.
+    """
+
+    def analyze_batch(self, segments):
+        """
+        Measure VOTs for the stops of every segment in one run of AutoVOT
+
+        Parameters
+        ----------
+        segments : iterable
+            :class:`~conch.analysis.segments.FileSegment` objects with ``vot_marks`` to measure
+
+        Returns
+        -------
+        dict
+            VOT measurements of each segment, in the same format as calling the function on the segment
+        """
+        settings = self._function
+        segments = list(segments)
+        vot_marks = [sorted(x["vot_marks"], key=lambda x: x[0]) for x in segments]
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            sound_files = {}
+            wav_paths = []
+            grid_paths = []
+            for i, (segment, marks) in enumerate(zip(segments, vot_marks)):
+                file_path = os.path.expanduser(segment.file_path)
+                if file_path not in sound_files:
+                    if is_autovot_friendly_file(file_path):
+                        sound_files[file_path] = file_path
+                    else:
+                        resample_directory = os.path.join(tmpdirname, str(len(sound_files)))
+                        os.makedirs(resample_directory)
+                        sound_files[file_path] = resample_for_autovot(
+                            file_path, resample_directory
+                        )
+                # Each segment gets its own sound file name, so that AutoVOT's output can be mapped back to it
+                wav_path = os.path.join(tmpdirname, "{}.wav".format(i))
+                try:
+                    os.symlink(os.path.abspath(sound_files[file_path]), wav_path)
+                except OSError:
+                    shutil.copy(sound_files[file_path], wav_path)
+                wav_paths.append(wav_path)
+
+                grid = textgrid.Textgrid()
+                grid.minTimestamp = 0
+                grid.maxTimestamp = segment.end
+                vots = [(vot_begin, vot_end, "vot") for vot_begin, vot_end, *_ in marks]
+                grid.addTier(textgrid.IntervalTier("vot", vots, minT=0, maxT=segment.end))
+                grid_path = os.path.join(tmpdirname, "{}.TextGrid".format(i))
+                grid.save(grid_path, includeBlankSpaces=True, format="long_textgrid")
+                grid_paths.append(grid_path)
+
+            wav_filenames = os.path.join(tmpdirname, "wavs.txt")
+            textgrid_filenames = os.path.join(tmpdirname, "textgrids.txt")
+            csv_path = os.path.join(tmpdirname, "file.csv")
+            with open(wav_filenames, "w") as f:
+                f.writelines("{}\n".format(x) for x in wav_paths)
+            with open(textgrid_filenames, "w") as f:
+                f.writelines("{}\n".format(x) for x in grid_paths)
+            result = subprocess.run(
+                [
+                    "auto_vot_decode.py",
+                    wav_filenames,
+                    textgrid_filenames,
+                    settings.classifier_to_use,
+                    "--vot_tier",
+                    "vot",
+                    "--vot_mark",
+                    "vot",
+                    "--csv_file",
+                    csv_path,
+                    "--min_vot_length",
+                    str(settings.min_vot_length),
+                    "--max_vot_length",
+                    str(settings.max_vot_length),
+                    "--window_max",
+                    str(settings.window_max),
+                    "--window_min",
+                    str(settings.window_min),
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                encoding="UTF-8",
+            )
+            if result.returncode != 0:
+                raise AcousticError(
+                    "AutoVOT failed with exit code {}: {}".format(result.returncode, result.stderr)
+                )
+            with open(csv_path, "r") as f:
+                f.readline()
+                lines = f.readlines()
+
+        # AutoVOT writes one line per stop, starting with the file name of its segment
+        rows = {}
+        for line in lines:
+            if not line.strip():
+                continue
+            file_name, time, vot, confidence = line.rstrip("\n").rsplit(",", 3)
+            index = int(os.path.splitext(os.path.basename(file_name.strip()))[0])
+            rows.setdefault(index, []).append((time, vot, confidence))
+        output = {}
+        for i, (segment, marks) in enumerate(zip(segments, vot_marks)):
+            return_list = []
+            for (time, vot, confidence), (b, e, *extra_data) in zip(rows.get(i, []), marks):
+                if confidence == "neg 0":
+                    confidence = 0
+                return_list.append((float(time), float(vot), float(confidence), *extra_data))
+            output[segment] = return_list
+        return output
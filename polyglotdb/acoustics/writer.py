@@ -0,0 +1,157 @@
+import atexit
+import queue
+import threading
+import time
+import warnings
+import weakref
+
+from influxdb import InfluxDBClient
+
+_STOP = object()
+
+_running_writers = weakref.WeakSet()
+
+
+@atexit.register
+def _close_running_writers():
+    """
+    Write the points still queued in writers that were not closed before the interpreter exits
+    """
+    for writer in list(_running_writers):
+        try:
+            writer.close()
+        except Exception as e:
+            warnings.warn("Could not write queued acoustic points: {}".format(e))
+
+
+class AcousticWriter(object):
+    """
+    Background writer for InfluxDB points.
+
+    Points are queued and written by a separate thread in batches, once enough points have accumulated or
+    the flush interval has passed since the last write.  The queue is bounded, so callers block once the
+    writer falls behind rather than buffering points without limit.  Errors from the database are raised
+    in the calling thread on the next call to :meth:`write`, :meth:`flush` or :meth:`close`.
+
+    Callers must call :meth:`close` once they are done writing, so that queued points are written and the
+    thread is stopped.  The writer thread does not keep the interpreter from exiting, so writers that are
+    not closed are closed when the interpreter exits, as a fallback.
+
+    Parameters
+    ----------
+    connection_kwargs : dict
+        Parameters for connecting to InfluxDB
+    batch_size : int
+        Number of points to send in each request
+    flush_interval : float
+        Maximum time in seconds to hold queued points before writing them
+    max_queue_size : int
+        Maximum number of batches waiting to be written before :meth:`write` blocks
+    """
+
+    def __init__(self, connection_kwargs, batch_size=10000, flush_interval=1.0, max_queue_size=20):
+        self.connection_kwargs = connection_kwargs
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = None
+        self._error = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _start(self):
+        with self._lock:
+            if not self.running:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+                _running_writers.add(self)
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def write(self, points, time_precision=None):
+        """
+        Queue points to be written
+
+        Parameters
+        ----------
+        points : list
+            Points in the format of :meth:`influxdb.InfluxDBClient.write_points`
+        time_precision : str, optional
+            Precision of the point times, defaults to nanoseconds
+        """
+        self._raise_error()
+        if not points:
+            return
+        self._start()
+        for i in range(0, len(points), self.batch_size):
+            self._queue.put((points[i : i + self.batch_size], time_precision))
+
+    def flush(self):
+        """
+        Block until all queued points have been written
+        """
+        if self.running:
+            done = threading.Event()
+            self._queue.put(done)
+            while not done.wait(0.1):
+                if not self.running:
+                    break
+        self._raise_error()
+
+    def close(self):
+        """
+        Write any queued points and stop the writer thread
+        """
+        if self.running:
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._thread = None
+        _running_writers.discard(self)
+        self._raise_error()
+
+    def _run(self):
+        client = InfluxDBClient(**self.connection_kwargs)
+        pending = {}
+        pending_count = 0
+        last_write = time.monotonic()
+        try:
+            while True:
+                timeout = max(0.0, self.flush_interval - (time.monotonic() - last_write))
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+                if isinstance(item, tuple):
+                    points, time_precision = item
+                    pending.setdefault(time_precision, []).extend(points)
+                    pending_count += len(points)
+                    elapsed = time.monotonic() - last_write
+                    if pending_count < self.batch_size and elapsed < self.flush_interval:
+                        continue
+                elif item is None and not pending_count:
+                    last_write = time.monotonic()
+                    continue
+                for time_precision, points in pending.items():
+                    try:
+                        client.write_points(
+                            points, batch_size=self.batch_size, time_precision=time_precision
+                        )
+                    except Exception as e:
+                        self._error = e
+                pending = {}
+                pending_count = 0
+                last_write = time.monotonic()
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is _STOP:
+                    break
+        except Exception as e:
+            self._error = e
+        finally:
+            client.close()
@@ -64,6 +64,25 @@ class CorpusConfig(object):
         Host for the graph database
     graph_port : int
         Port for connecting to the graph database
+    query_batch_size : int
+        Number of records fetched from the graph database at a time when streaming query results
+    query_jobs : int
+        Number of queries split by speaker or discourse that are run at once, each with its own session with the
+        graph database, defaults to 1 (run one after another)
+    acoustic_write_batch_size : int
+        Number of acoustic points to send to InfluxDB in each request
+    acoustic_write_flush_interval : float
+        Maximum time in seconds that queued acoustic points wait before being written
+    acoustic_write_queue_size : int
+        Maximum number of batches of acoustic points waiting to be written before saving blocks
+    acoustic_cache_size : int
+        Maximum number of acoustic time points kept in memory for reuse across queries
+    spectrogram_cache_size : int
+        Maximum number of spectrogram cells (frequency by time bins) kept in memory for reuse
+    audio_cache_dir : str
+        Directory of resampled sound files to share across corpora, keyed by the contents of the original
+        recordings, defaults to None to resample every sound file.  Discourses get copies of the cached files,
+        and the cache is never cleared by PolyglotDB, so it can be deleted at any time to free up space
     engine : str
         Type of SQL database
     base_dir : str
@@ -76,10 +95,18 @@ class CorpusConfig(object):
         self.acoustic_user = None
         self.acoustic_password = None
         self.acoustic_http_port = 8086
+        self.acoustic_write_batch_size = 10000
+        self.acoustic_write_flush_interval = 1.0
+        self.acoustic_write_queue_size = 20
+        self.acoustic_cache_size = 2000000
+        self.spectrogram_cache_size = 10000000
+        self.audio_cache_dir = None
         self.graph_user = None
         self.graph_password = None
         self.host = "localhost"
         self.query_behavior = "speaker"
+        self.query_batch_size = 1000
+        self.query_jobs = 1
         self.graph_http_port = 7474
         self.graph_bolt_port = 7687
         self.debug = False
@@ -1,10 +1,11 @@
 import os
 import re
 import subprocess
+import threading
 from datetime import datetime
 from decimal import Decimal
 
-import librosa
+import numpy as np
 from influxdb import InfluxDBClient
 from influxdb.exceptions import InfluxDBClientError
 
@@ -19,11 +20,16 @@ from polyglotdb.acoustics import (
     analyze_vot,
     update_utterance_pitch_track,
 )
-from polyglotdb.acoustics.classes import TimePoint, Track
+from polyglotdb.acoustics.cache import AcousticCache, SpectrogramCache
+from polyglotdb.acoustics.checkpoints import AnalysisCheckpoint
+from polyglotdb.acoustics.classes import Spectrogram, Track
 from polyglotdb.acoustics.formants.helper import save_formant_point_data
-from polyglotdb.acoustics.utils import generate_spectrogram, load_waveform
+from polyglotdb.acoustics.statistics import GroupedStatistics, z_scores
+from polyglotdb.acoustics.utils import generate_spectrogram, load_waveform, read_waveform
+from polyglotdb.acoustics.writer import AcousticWriter
 from polyglotdb.corpus.syllabic import SyllabicContext
 from polyglotdb.io.importer.from_csv import import_track_csv, import_track_csvs
+from polyglotdb.query.annotations import GraphQuery
 
 
 def sanitize_value(value, type):
@@ -52,7 +58,7 @@ def sanitize_value(value, type):
     return value
 
 
-def generate_filter_string(discourse, begin, end, channel, num_points, kwargs):
+def generate_filter_string(discourse, begin, end, channel, num_points, kwargs, measure=None):
     """
     Constructs a filter string in InfluxDB query language (i.e., WHERE clause) based on relevant information from
     the Neo4j database
@@ -71,6 +77,8 @@ def generate_filter_string(discourse, begin, end, channel, num_points, kwargs):
         Number of points in the track to return, if 0 will return all raw measurements
     kwargs : dict
         Any extra filters
+    measure : str, optional
+        Name of a measure to leave out missing values (saved as -1) of
 
     Returns
     -------
@@ -78,6 +86,8 @@ def generate_filter_string(discourse, begin, end, channel, num_points, kwargs):
         InfluxDB query language WHERE clause to specify a track
     """
     extra_filters = [""""{}" = '{}' """.format(k, v) for k, v in kwargs.items()]
+    if measure is not None:
+        extra_filters.append(""""{}" != -1 """.format(measure))
     filter_string = """WHERE "discourse" = '{}'
                             AND "time" >= {}
                             AND "time" <= {}
@@ -97,6 +107,23 @@ def generate_filter_string(discourse, begin, end, channel, num_points, kwargs):
     return filter_string
 
 
+def resolution_to_ms(resolution):
+    """
+    Converts a downsampling step in seconds to a whole number of milliseconds for InfluxDB ``group by time``
+
+    Parameters
+    ----------
+    resolution : float
+        Step in seconds
+
+    Returns
+    -------
+    int
+        Step in milliseconds, at least 1
+    """
+    return max(1, int(round(float(resolution) * 1000)))
+
+
 def s_to_nano(seconds):
     """
     Converts seconds (as a float or Decimal) to nanoseconds (as an int)
@@ -135,6 +162,105 @@ def s_to_ms(seconds):
     return int(seconds * Decimal("1e3"))
 
 
+def align_time_points(times, begins):
+    """
+    Find the interval that each time point falls into, where an interval is the last one beginning at or before the
+    time point
+
+    Parameters
+    ----------
+    times : iterable
+        Time points in seconds
+    begins : numpy.array
+        Sorted begin times of the intervals in seconds
+
+    Returns
+    -------
+    numpy.array
+        Index of the interval for each time point, or -1 if the time point precedes all intervals
+    """
+    times = np.asarray([float(x) for x in times], dtype=np.float64)
+    if not len(begins):
+        return np.full(times.shape, -1, dtype=np.int64)
+    return np.searchsorted(begins, times, side="right") - 1
+
+
+def result_columns(result, measurement, names):
+    """
+    Get the times and values from an InfluxDB result as columns, without constructing a dictionary per point
+
+    Parameters
+    ----------
+    result : :class:`influxdb.resultset.ResultSet`
+        Result of a query run with ``epoch='ms'``
+    measurement : str
+        Name of the measurement
+    names : list
+        Names of the value columns to get
+
+    Returns
+    -------
+    numpy.array
+        Times in milliseconds
+    dict
+        :class:`numpy.array` of values for each name, as floats (with NaN for missing values) for numeric columns
+    """
+    times = []
+    columns = {x: [] for x in names}
+    for series in result.raw.get("series", []):
+        if series.get("name") != measurement or not series.get("values"):
+            continue
+        series_columns = list(zip(*series["values"]))
+        index = {x: i for i, x in enumerate(series["columns"])}
+        times.extend(series_columns[index["time"]])
+        for name in names:
+            if name in index:
+                columns[name].extend(series_columns[index[name]])
+            else:
+                columns[name].extend([None] * len(series["values"]))
+    values = {}
+    for name, column in columns.items():
+        if all(
+            isinstance(x, (int, float)) and not isinstance(x, bool)
+            for x in column
+            if x is not None
+        ):
+            values[name] = np.array(column, dtype=np.float64)
+        else:
+            values[name] = np.array(column, dtype=object)
+    return np.array(times, dtype=np.int64), values
+
+
+def merge_result_columns(results, measurement, names):
+    """
+    Get the times and values from InfluxDB results with one statement per value column as columns, aligning the
+    values of each column on the times of all of them
+
+    Parameters
+    ----------
+    results : list
+        :class:`influxdb.resultset.ResultSet` for each name, run with ``epoch='ms'``
+    measurement : str
+        Name of the measurement
+    names : list
+        Names of the value columns, in the same order as ``results``
+
+    Returns
+    -------
+    numpy.array
+        Times in milliseconds
+    dict
+        :class:`numpy.array` of values for each name, with NaN where a column has no value at a time
+    """
+    columns = [result_columns(result, measurement, [name]) for result, name in zip(results, names)]
+    times = np.unique(np.concatenate([np.zeros(0, dtype=np.int64)] + [x[0] for x in columns]))
+    values = {}
+    for name, (column_times, column_values) in zip(names, columns):
+        values[name] = np.full(len(times), np.nan)
+        values[name][np.searchsorted(times, column_times)] = column_values[name]
+    return times, values
+
+
 def to_seconds(time_string):
     """
     Converts a time string from InfluxDB into number of seconds to generate a time point in an audio file
@@ -173,6 +299,23 @@ class AudioContext(SyllabicContext):
     Class that contains methods for dealing with audio files for corpora
     """
 
+    def __init__(self, *args, **kwargs):
+        super(AudioContext, self).__init__(*args, **kwargs)
+        self._acoustic_clients = {}
+        self._acoustic_lock = threading.Lock()
+        self._acoustic_writer = None
+        self._acoustic_cache = None
+        self._spectrogram_cache = None
+        self._acoustic_database_exists = False
+
+    def __exit__(self, exc_type, exc, exc_tb):
+        try:
+            self.close_acoustics()
+        except Exception:
+            super(AudioContext, self).__exit__(exc_type, exc, exc_tb)
+            raise
+        return super(AudioContext, self).__exit__(exc_type, exc, exc_tb)
+
     def load_audio(self, discourse, file_type):
         """
         Loads a given audio file at the specified sampling rate type (``consonant``, ``vowel`` or ``low_freq``).
@@ -195,15 +338,14 @@ class AudioContext(SyllabicContext):
         """
         sound_file = self.discourse_sound_file(discourse)
         if file_type == "consonant":
-            path = os.path.expanduser(sound_file.consonant_file_path)
+            path = sound_file["consonant_file_path"]
         elif file_type == "vowel":
-            path = os.path.expanduser(sound_file.vowel_file_path)
+            path = sound_file["vowel_file_path"]
         elif file_type == "low_freq":
-            path = os.path.expanduser(sound_file.low_freq_file_path)
+            path = sound_file["low_freq_file_path"]
         else:
-            path = os.path.expanduser(sound_file.file_path)
-        signal, sr = librosa.load(path, sr=None)
-        return signal, sr
+            path = sound_file["file_path"]
+        return read_waveform(path)
 
     def load_waveform(self, discourse, file_type="consonant", begin=None, end=None):
         """
@@ -258,14 +400,51 @@ class AudioContext(SyllabicContext):
         Returns
         -------
         numpy.array
-            Spectrogram information
+            Spectrogram information, as a copy that can be modified without changing the cached spectrogram
+            (see :meth:`spectrogram` for the cached values themselves)
         float
             Time step between each window
         float
             Frequency step between each frequency bin
         """
-        signal, sr = self.load_waveform(discourse, file_type, begin, end)
-        return generate_spectrogram(signal, sr)
+        spectrogram = self.spectrogram(discourse, file_type, begin, end)
+        return spectrogram.values.copy(), spectrogram.time_step, spectrogram.freq_step
+
+    def spectrogram(self, discourse, file_type="consonant", begin=None, end=None):
+        """
+        Get the spectrogram of an audio file, which is cached for reuse.  If ``begin`` is unspecified, the segment
+        will start at the beginning of the audio file, and if ``end`` is unspecified, the segment will end at the end
+        of the audio file.
+
+        Parameters
+        ----------
+        discourse : str
+            Name of the audio file to load
+        file_type : str
+            One of ``consonant``, ``vowel`` or ``low_freq``
+        begin : float
+            Timestamp in seconds
+        end : float
+            Timestamp in seconds
+
+        Returns
+        -------
+        :class:`~polyglotdb.acoustics.classes.Spectrogram`
+            Spectrogram, with read-only values
+        """
+        key = (discourse, file_type, begin, end)
+        if self._spectrogram_cache is None:
+            self._spectrogram_cache = SpectrogramCache(self.config.spectrogram_cache_size)
+        spectrogram = self._spectrogram_cache.get(key)
+        if spectrogram is None:
+            signal, sr = self.load_waveform(discourse, file_type, begin, end)
+            values, time_step, freq_step = generate_spectrogram(signal, sr)
+            values.flags.writeable = False
+            if begin is None:
+                begin = 0.0
+            spectrogram = Spectrogram(values, time_step, freq_step, begin)
+            self._spectrogram_cache[key] = spectrogram
+        return spectrogram
 
     def analyze_pitch(
         self,
@@ -277,6 +456,8 @@ class AudioContext(SyllabicContext):
         stop_check=None,
         call_back=None,
         multiprocessing=True,
+        resume=False,
+        first_pass_cache=None,
     ):
         """
         Analyze pitch tracks and save them to the database.
@@ -286,7 +467,8 @@ class AudioContext(SyllabicContext):
         Parameters
         ----------
         source : str
-            Program to use for analyzing pitch, either ``praat`` or ``reaper``
+            Program to use for analyzing pitch, either ``praat``, ``reaper`` or ``native`` (which runs in
+            Python without calling an external program)
         algorithm : str
             Algorithm to use, ``base``, ``gendered``, or ``speaker_adjusted``
         absolute_min_pitch : int
@@ -301,6 +483,11 @@ class AudioContext(SyllabicContext):
             Function to report progress
         multiprocessing : bool
             Flag whether to use multiprocessing or threading
+        resume : bool
+            Flag for skipping utterances already analyzed with the same settings
+        first_pass_cache : str, optional
+            For ``speaker_adjusted``, ``memory`` or ``disk`` to save first pass tracks that already fall within
+            the adjusted pitch range rather than analyzing them again
         """
         analyze_pitch(
             self,
@@ -312,6 +499,8 @@ class AudioContext(SyllabicContext):
             absolute_min_pitch=absolute_min_pitch,
             absolute_max_pitch=absolute_max_pitch,
             adjusted_octaves=adjusted_octaves,
+            resume=resume,
+            first_pass_cache=first_pass_cache,
         )
 
     def analyze_utterance_pitch(self, utterance, source="praat", **kwargs):
@@ -325,7 +514,8 @@ class AudioContext(SyllabicContext):
         utterance : str
             Utterance ID from Neo4j
         source : str
-            Program to use for analyzing pitch, either ``praat`` or ``reaper``
+            Program to use for analyzing pitch, either ``praat``, ``reaper`` or ``native`` (which runs in
+            Python without calling an external program)
         kwargs
             Additional settings to use in analyzing pitch
 
@@ -368,6 +558,7 @@ class AudioContext(SyllabicContext):
         vot_max=100,
         window_min=-30,
         window_max=30,
+        num_jobs=None,
     ):
         """
         Compute VOTs for stops and save them to the database.
@@ -396,6 +587,8 @@ class AudioContext(SyllabicContext):
             stop check function, optional
         multiprocessing : bool
             Flag to use multiprocessing, otherwise will use threading
+        num_jobs : int, optional
+            Number of discourses to analyze at once, defaults to three quarters of the available cores
         """
         analyze_vot(
             self,
@@ -409,10 +602,16 @@ class AudioContext(SyllabicContext):
             vot_max=vot_max,
             window_min=window_min,
             window_max=window_max,
+            num_jobs=num_jobs,
         )
 
     def analyze_formant_points(
-        self, stop_check=None, call_back=None, multiprocessing=True, vowel_label=None
+        self,
+        stop_check=None,
+        call_back=None,
+        multiprocessing=True,
+        vowel_label=None,
+        source="praat",
     ):
         """
         Compute formant tracks and save them to the database
@@ -429,6 +628,8 @@ class AudioContext(SyllabicContext):
             Flag to use multiprocessing, defaults to True, if False uses threading
         vowel_label : str, optional
             Optional subset of phones to compute tracks over.  If None, then tracks over utterances are computed.
+        source : str
+            Program to compute formants, ``praat`` or ``native`` (which runs in Python without calling Praat)
         """
         data = analyze_formant_points(
             self,
@@ -436,6 +637,7 @@ class AudioContext(SyllabicContext):
             call_back=call_back,
             multiprocessing=multiprocessing,
             vowel_label=vowel_label,
+            source=source,
         )
         save_formant_point_data(self, data)
 
@@ -446,6 +648,7 @@ class AudioContext(SyllabicContext):
         call_back=None,
         multiprocessing=True,
         vowel_label=None,
+        resume=False,
     ):
         """
         Compute formant tracks and save them to the database
@@ -455,7 +658,7 @@ class AudioContext(SyllabicContext):
         Parameters
         ----------
         source : str
-            Program to compute formants
+            Program to compute formants, ``praat`` or ``native`` (which runs in Python without calling Praat)
         stop_check : callable
             Function to check whether to terminate early
         call_back : callable
@@ -464,6 +667,8 @@ class AudioContext(SyllabicContext):
             Flag to use multiprocessing, defaults to True, if False uses threading
         vowel_label : str, optional
             Optional subset of phones to compute tracks over.  If None, then tracks over utterances are computed.
+        resume : bool
+            Flag for skipping segments already analyzed with the same settings
         """
         analyze_formant_tracks(
             self,
@@ -472,10 +677,11 @@ class AudioContext(SyllabicContext):
             call_back=call_back,
             multiprocessing=multiprocessing,
             vowel_label=vowel_label,
+            resume=resume,
         )
 
     def analyze_intensity(
-        self, source="praat", stop_check=None, call_back=None, multiprocessing=True
+        self, source="praat", stop_check=None, call_back=None, multiprocessing=True, resume=False
     ):
         """
         Compute intensity tracks and save them to the database
@@ -485,15 +691,20 @@ class AudioContext(SyllabicContext):
         Parameters
         ----------
         source : str
-            Program to compute intensity (only ``praat`` is supported)
+            Program to compute intensity, either ``praat`` or ``native`` (which runs in Python without
+            calling an external program)
         stop_check : callable
             Function to check whether to terminate early
         call_back : callable
             Function to report progress
         multiprocessing : bool
             Flag to use multiprocessing, defaults to True, if False uses threading
+        resume : bool
+            Flag for skipping utterances already analyzed with the same settings
         """
-        analyze_intensity(self, source, stop_check, call_back, multiprocessing=multiprocessing)
+        analyze_intensity(
+            self, source, stop_check, call_back, multiprocessing=multiprocessing, resume=resume
+        )
 
     def analyze_script(
         self,
@@ -507,6 +718,7 @@ class AudioContext(SyllabicContext):
         call_back=None,
         multiprocessing=True,
         file_type="consonant",
+        resume=False,
     ):
         """
         Use a Praat script to analyze annotation types in the corpus.  The Praat script must return properties per phone (i.e.,
@@ -534,6 +746,8 @@ class AudioContext(SyllabicContext):
             Flag to use multiprocessing, defaults to True, if False uses threading
         file_type : str
             Sampling rate type to use, one of ``consonant``, ``vowel``, or ``low_freq``
+        resume : bool
+            Flag for skipping annotations already analyzed with the same script and settings
 
         Returns
         -------
@@ -551,6 +765,7 @@ class AudioContext(SyllabicContext):
             stop_check=stop_check,
             call_back=call_back,
             multiprocessing=multiprocessing,
+            resume=resume,
         )
 
     def analyze_track_script(
@@ -654,6 +869,10 @@ class AudioContext(SyllabicContext):
         Reset all acoustic measures currently encoded
         """
         self.acoustic_client().drop_database(self.corpus_name)
+        self._acoustic_database_exists = False
+        self.clear_acoustic_cache()
+        for acoustic_name in self.hierarchy.acoustics:
+            AnalysisCheckpoint(self, acoustic_name).clear()
         if self.hierarchy.acoustics:
             self.hierarchy.acoustic_properties = {}
             self.encode_hierarchy()
@@ -668,6 +887,8 @@ class AudioContext(SyllabicContext):
             Name of the acoustic measurement to reset
         """
         self.acoustic_client().query("""DROP MEASUREMENT "{}";""".format(acoustic_type))
+        self.clear_acoustic_cache()
+        AnalysisCheckpoint(self, acoustic_type).clear()
         if acoustic_type in self.hierarchy.acoustics:
             self.hierarchy.acoustic_properties = {
                 k: v for k, v in self.hierarchy.acoustic_properties.items() if k != acoustic_type
@@ -691,19 +912,118 @@ class AudioContext(SyllabicContext):
 
     def acoustic_client(self):
         """
-        Generate a client to connect to the InfluxDB for the corpus
+        Get the client to connect to the InfluxDB for the corpus, creating the database if needed
+
+        The client is created once per context and thread (so that split queries running on other threads
+        do not share connections) and reuses its connections.  Any points queued in the :meth:`acoustic_writer`
+        are written before the client is returned, so that queries see them.
 
         Returns
         -------
         InfluxDBClient
             Client through which to run queries and writes
         """
-        client = InfluxDBClient(**self.config.acoustic_connection_kwargs)
-        databases = client.get_list_database()
-        if self.corpus_name not in databases:
-            client.create_database(self.corpus_name)
+        thread_id = threading.get_ident()
+        with self._acoustic_lock:
+            client = self._acoustic_clients.get(thread_id)
+            if client is None:
+                client = InfluxDBClient(**self.config.acoustic_connection_kwargs)
+                self._acoustic_clients[thread_id] = client
+        if not self._acoustic_database_exists:
+            databases = [x["name"] for x in client.get_list_database()]
+            if self.corpus_name not in databases:
+                client.create_database(self.corpus_name)
+            self._acoustic_database_exists = True
+        if self._acoustic_writer is not None:
+            self._acoustic_writer.flush()
+        return client
+
+    def _acoustic_stream_client(self):
+        """
+        Get the client for streaming chunked query responses from the InfluxDB for the corpus
+
+        Chunked responses can only be streamed as JSON, while the default msgpack responses are read all at once,
+        so this client asks for JSON.  Like :meth:`acoustic_client`, it is created once per context and thread,
+        and any queued points are written before it is returned.
+
+        Returns
+        -------
+        InfluxDBClient
+            Client through which to run chunked queries
+        """
+        self.acoustic_client()
+        key = threading.get_ident(), "json"
+        with self._acoustic_lock:
+            client = self._acoustic_clients.get(key)
+            if client is None:
+                client = InfluxDBClient(
+                    headers={"Accept": "application/json"},
+                    **self.config.acoustic_connection_kwargs,
+                )
+                self._acoustic_clients[key] = client
         return client
 
+    def acoustic_writer(self):
+        """
+        Get the background writer for saving points to the InfluxDB for the corpus
+
+        The writer is created once per context and shared by its threads.  Queued points are written when the
+        context exits, through :meth:`close_acoustics`.
+
+        Returns
+        -------
+        :class:`~polyglotdb.acoustics.writer.AcousticWriter`
+            Writer that batches points and saves them in a separate thread
+        """
+        with self._acoustic_lock:
+            if self._acoustic_writer is None:
+                self._acoustic_writer = AcousticWriter(
+                    self.config.acoustic_connection_kwargs,
+                    batch_size=self.config.acoustic_write_batch_size,
+                    flush_interval=self.config.acoustic_write_flush_interval,
+                    max_queue_size=self.config.acoustic_write_queue_size,
+                )
+            writer = self._acoustic_writer
+        if not self._acoustic_database_exists:
+            self.acoustic_client()
+        self.clear_acoustic_cache()
+        return writer
+
+    def acoustic_cache(self):
+        """
+        Get the cache of acoustic tracks shared by queries on the corpus
+
+        Returns
+        -------
+        :class:`~polyglotdb.acoustics.cache.AcousticCache`
+            Cache of tracks, bounded by ``acoustic_cache_size`` in the config
+        """
+        with self._acoustic_lock:
+            if self._acoustic_cache is None:
+                self._acoustic_cache = AcousticCache(self.config.acoustic_cache_size)
+        return self._acoustic_cache
+
+    def clear_acoustic_cache(self):
+        """
+        Remove all cached acoustic tracks, so that subsequent queries see changes to the InfluxDB
+        """
+        if self._acoustic_cache is not None:
+            self._acoustic_cache.clear()
+
+    def close_acoustics(self):
+        """
+        Write any queued acoustic points and close the connections to the InfluxDB for the corpus
+        """
+        writer, self._acoustic_writer = self._acoustic_writer, None
+        with self._acoustic_lock:
+            clients, self._acoustic_clients = self._acoustic_clients, {}
+        try:
+            if writer is not None:
+                writer.close()
+        finally:
+            for client in clients.values():
+                client.close()
+
     def discourse_audio_directory(self, discourse):
         """
         Return the directory for the stored audio files for a discourse
@@ -828,7 +1148,7 @@ class AudioContext(SyllabicContext):
                     break
         return self._has_sound_files
 
-    def execute_influxdb(self, query):
+    def execute_influxdb(self, query, epoch=None):
         """
         Execute an InfluxDB query for the corpus
 
@@ -836,22 +1156,87 @@ class AudioContext(SyllabicContext):
         ----------
         query : str
             Query to run
+        epoch : str, optional
+            Precision of epoch timestamps to return (i.e., ``ms``), defaults to returning time strings
 
         Returns
         -------
         :class:`influxdb.resultset.ResultSet`
-            Results of the query
+            Results of the query, or a list of results for queries with multiple statements
         """
         client = self.acoustic_client()
+        if not query.lstrip().lower().startswith(("select", "show")):
+            self.clear_acoustic_cache()
         try:
-            result = client.query(query)
+            result = client.query(query, epoch=epoch)
         except InfluxDBClientError:
             print("There was an issue with the following query:")
             print(query)
             raise
         return result
 
-    def get_utterance_acoustics(self, acoustic_name, utterance_id, discourse, speaker):
+    def _utterance_acoustics_query(
+        self,
+        acoustic_name,
+        properties,
+        utterance_id,
+        discourse,
+        speaker,
+        resolution=None,
+        begin=None,
+        end=None,
+    ):
+        """
+        Construct an InfluxDB query for the acoustics of an utterance, or of a speaker in a discourse when the
+        utterance ID is None, optionally averaged over windows of ``resolution`` seconds between ``begin`` and
+        ``end``
+
+        Downsampled queries have a statement per property, so that the -1 saved for missing values is left out
+        of the means without dropping the other properties measured at the same time points
+        """
+        speaker = speaker.replace("'", r"\'")  # Escape apostrophes
+        discourse = discourse.replace("'", r"\'")  # Escape apostrophes
+        filter_string = """WHERE "discourse" = '{}'
+                        AND "speaker" = '{}'""".format(discourse, speaker)
+        if utterance_id is not None:
+            filter_string += """\n                        AND "utterance_id" = '{}'""".format(
+                utterance_id
+            )
+        if begin is not None:
+            filter_string += """\n                        AND "time" >= {}""".format(
+                s_to_nano(begin)
+            )
+        if end is not None:
+            filter_string += """\n                        AND "time" <= {}""".format(
+                s_to_nano(end)
+            )
+        if not resolution:
+            return """select "time", {} from "{}"
+                        {};""".format(", ".join(properties), acoustic_name, filter_string)
+        return "\n".join(
+            """select mean("{0}") as "{0}" from "{1}"
+                        {2}
+                        AND "{0}" != -1
+                        group by time({3}ms) fill(none);""".format(
+                x, acoustic_name, filter_string, resolution_to_ms(resolution)
+            )
+            for x in properties
+        )
+
+    def _utterance_spans(self, utterance_ids):
+        """
+        Get the begin and end times of utterances with a single query, keyed by utterance ID
+        """
+        statement = """MATCH (u:utterance:{corpus_name}) WHERE u.id IN $utterance_ids
+                    RETURN u.id AS id, u.begin AS begin, u.end AS end""".format(
+            corpus_name=self.cypher_safe_name
+        )
+        results = self.execute_cypher(statement, utterance_ids=list(utterance_ids))
+        return {r["id"]: (r["begin"], r["end"]) for r in results}
+
+    def get_utterance_acoustics(
+        self, acoustic_name, utterance_id, discourse, speaker, resolution=None
+    ):
         """
         Get acoustic for a given utterance and time range
 
@@ -865,6 +1250,9 @@ class AudioContext(SyllabicContext):
             Name of the discourse
         speaker : str
             Name of the speaker
+        resolution : float, optional
+            Step in seconds to downsample the track to in InfluxDB, each point being the mean of the
+            measurements in its window, defaults to returning all measurements
 
         Returns
         -------
@@ -872,32 +1260,145 @@ class AudioContext(SyllabicContext):
             Track object
         """
         properties = [x[0] for x in self.hierarchy.acoustic_properties[acoustic_name]]
-        property_names = ["{}".format(x) for x in properties]
-        columns = '"time", {}'.format(", ".join(property_names))
-        speaker = speaker.replace("'", r"\'")  # Escape apostrophes
-        discourse = discourse.replace("'", r"\'")  # Escape apostrophes
-        if utterance_id is not None:
-            query = """select {} from "{}"
-                            WHERE "utterance_id" = '{}'
-                            AND "discourse" = '{}'
-                            AND "speaker" = '{}';""".format(
-                columns, acoustic_name, utterance_id, discourse, speaker
+        if not resolution:
+            query = self._utterance_acoustics_query(
+                acoustic_name, properties, utterance_id, discourse, speaker
             )
+            result = self.execute_influxdb(query, epoch="ms")
+            return Track.from_ms(*result_columns(result, acoustic_name, properties))
+        if utterance_id is None:
+            begin, end = 0, self.discourse_sound_file(discourse).get("duration")
         else:
-            query = """select {} from "{}"
-                            WHERE "discourse" = '{}'
-                            AND "speaker" = '{}';""".format(
-                columns, acoustic_name, discourse, speaker
+            begin, end = self._utterance_spans([utterance_id]).get(utterance_id, (None, None))
+        query = self._utterance_acoustics_query(
+            acoustic_name, properties, utterance_id, discourse, speaker, resolution, begin, end
+        )
+        results = self.execute_influxdb(query, epoch="ms")
+        if not isinstance(results, list):
+            results = [results]
+        times, values = merge_result_columns(results, acoustic_name, properties)
+        return Track.from_ms(times + resolution_to_ms(resolution) // 2, values)
+
+    def get_utterances_acoustics(self, acoustic_name, utterances, batch_size=500, resolution=None):
+        """
+        Get acoustics for many utterances at once, with one query per speaker and discourse (per batch of
+        utterances), rather than one query per utterance
+
+        Parameters
+        ----------
+        acoustic_name : str
+            Name of acoustic track
+        utterances : iterable
+            Tuples of utterance ID, discourse name and speaker name, the utterance ID can be None to get the
+            whole track for the speaker in the discourse
+        batch_size : int
+            Maximum number of utterances to match in a single query
+        resolution : float, optional
+            Step in seconds to downsample the tracks to in InfluxDB, see :meth:`get_utterance_acoustics`
+
+        Returns
+        -------
+        dict
+            :class:`polyglotdb.acoustics.classes.Track` objects keyed by utterance ID, or by discourse and
+            speaker for utterances without an ID
+        """
+        properties = [x[0] for x in self.hierarchy.acoustic_properties[acoustic_name]]
+        columns = '"time", "utterance_id", {}'.format(", ".join(properties))
+        grouped = {}
+        for utterance_id, discourse, speaker in utterances:
+            grouped.setdefault((discourse, speaker), set()).add(utterance_id)
+        tracks = {}
+        for (discourse, speaker), utterance_ids in grouped.items():
+            if None in utterance_ids:
+                utterance_ids.discard(None)
+                tracks[discourse, speaker] = self.get_utterance_acoustics(
+                    acoustic_name, None, discourse, speaker, resolution=resolution
+                )
+            utterance_ids = sorted(utterance_ids)
+            for i in range(0, len(utterance_ids), batch_size):
+                batch = utterance_ids[i : i + batch_size]
+                if resolution:
+                    # Windows must not mix utterances, so each utterance gets its own statement
+                    tracks.update(
+                        self._resampled_utterances_acoustics(
+                            acoustic_name, properties, batch, discourse, speaker, resolution
+                        )
+                    )
+                    continue
+                pattern = "|".join(re.escape(x).replace("/", r"\/") for x in batch)
+                query = """select {} from "{}"
+                                WHERE "utterance_id" =~ /^({})$/
+                                AND "discourse" = '{}'
+                                AND "speaker" = '{}';""".format(
+                    columns,
+                    acoustic_name,
+                    pattern,
+                    discourse.replace("'", r"\'"),
+                    speaker.replace("'", r"\'"),
+                )
+                result = self.execute_influxdb(query, epoch="ms")
+                times, values = result_columns(
+                    result, acoustic_name, properties + ["utterance_id"]
+                )
+                ids = values.pop("utterance_id")
+                for utterance_id in batch:
+                    tracks[utterance_id] = Track()
+                if not len(ids):
+                    continue
+                order = np.argsort(ids.astype(str), kind="stable")
+                ids = ids[order]
+                bounds = np.r_[np.flatnonzero(ids[1:] != ids[:-1]) + 1, len(ids)]
+                begin = 0
+                for end in bounds:
+                    index = order[begin:end]
+                    tracks[ids[begin]] = Track.from_ms(
+                        times[index], {k: v[index] for k, v in values.items()}
+                    )
+                    begin = end
+        return tracks
+
+    def _resampled_utterances_acoustics(
+        self,
+        acoustic_name,
+        properties,
+        utterance_ids,
+        discourse,
+        speaker,
+        resolution,
+        batch_size=50,
+    ):
+        """
+        Get downsampled acoustics for utterances of a speaker in a discourse, with one statement per utterance
+        and a single request per batch of statements
+        """
+        offset = resolution_to_ms(resolution) // 2
+        tracks = {}
+        for i in range(0, len(utterance_ids), batch_size):
+            batch = utterance_ids[i : i + batch_size]
+            spans = self._utterance_spans(batch)
+            query = "\n".join(
+                self._utterance_acoustics_query(
+                    acoustic_name,
+                    properties,
+                    x,
+                    discourse,
+                    speaker,
+                    resolution,
+                    *spans.get(x, (None, None)),
+                )
+                for x in batch
             )
-        result = self.execute_influxdb(query)
-        track = Track()
-        for r in result.get_points(acoustic_name):
-            s = to_seconds(r["time"])
-            p = TimePoint(s)
-            for name in properties:
-                p.add_value(name, r[name])
-            track.add(p)
-        return track
+            results = self.execute_influxdb(query, epoch="ms")
+            if not isinstance(results, list):
+                results = [results]
+            for j, utterance_id in enumerate(batch):
+                times, values = merge_result_columns(
+                    results[j * len(properties) : (j + 1) * len(properties)],
+                    acoustic_name,
+                    properties,
+                )
+                tracks[utterance_id] = Track.from_ms(times + offset, values)
+        return tracks
 
     def get_acoustic_measure(
         self,
@@ -937,123 +1438,231 @@ class AudioContext(SyllabicContext):
         begin = Decimal(begin).quantize(Decimal("0.001"))
         end = Decimal(end).quantize(Decimal("0.001"))
         num_points = kwargs.pop("num_points", 0)
-        filter_string = generate_filter_string(discourse, begin, end, channel, num_points, kwargs)
 
         properties = [x[0] for x in self.hierarchy.acoustic_properties[acoustic_name]]
         property_names = ["{}".format(x) for x in properties]
         if num_points:
-            columns = ", ".join(["mean({})".format(x) for x in property_names])
+            # One statement per measure, so missing values can be left out of each mean
+            query = "\n".join(
+                """select mean("{0}") as "{0}" from "{1}"
+                        {2};""".format(
+                    x,
+                    acoustic_name,
+                    generate_filter_string(
+                        discourse, begin, end, channel, num_points, kwargs, measure=x
+                    ),
+                )
+                for x in property_names
+            )
+            results = self.execute_influxdb(query, epoch="ms")
+            if not isinstance(results, list):
+                results = [results]
+            times, values = merge_result_columns(results, acoustic_name, properties)
         else:
-            columns = '"time", {}'.format(", ".join(property_names))
-        query = """select {} from "{}"
-                        {};""".format(
-            columns, acoustic_name, filter_string
-        )
-        result = self.execute_influxdb(query)
-        track = Track()
-        for r in result.get_points(acoustic_name):
-            s = to_seconds(r["time"])
-            if relative_time:
-                s = (s - begin) / (end - begin)
-            p = TimePoint(s)
-            for name in properties:
-                p.add_value(name, r[name])
-            track.add(p)
+            filter_string = generate_filter_string(
+                discourse, begin, end, channel, num_points, kwargs
+            )
+            query = """select "time", {} from "{}"
+                        {};""".format(", ".join(property_names), acoustic_name, filter_string)
+            result = self.execute_influxdb(query, epoch="ms")
+            times, values = result_columns(result, acoustic_name, properties)
+        track = Track.from_ms(times, values)
+        if relative_time:
+            track = track.relative_time(begin, end)
         return track
 
+    def _phone_intervals(self, discourse, speaker=None, begin=None, end=None):
+        """
+        Get the phones in a discourse with a single query, as columns sorted by begin time
+
+        Parameters
+        ----------
+        discourse : str
+            Name of the discourse
+        speaker : str, optional
+            Restrict phones to a single speaker
+        begin : float, optional
+            Restrict phones to those ending at or after this time
+        end : float, optional
+            Restrict phones to those beginning at or before this time
+
+        Returns
+        -------
+        dict
+            Lists of phone labels, word labels, speakers and (if encoded) utterance IDs and syllable labels, along
+            with :class:`numpy.array` columns of begin and end times
+        """
+        phone_type = getattr(self, self.phone_name)
+        q = GraphQuery(self, phone_type).filter(phone_type.discourse.name == discourse)
+        if speaker is not None:
+            q = q.filter(phone_type.speaker.name == speaker)
+        if begin is not None:
+            q = q.filter(phone_type.end >= begin)
+        if end is not None:
+            q = q.filter(phone_type.begin <= end)
+        columns = [
+            phone_type.label.column_name("label"),
+            phone_type.begin.column_name("begin"),
+            phone_type.end.column_name("end"),
+            phone_type.word.label.column_name("word_label"),
+            phone_type.speaker.name.column_name("speaker"),
+        ]
+        column_labels = ["label", "begin", "end", "word_label", "speaker"]
+        if "utterance" in self.annotation_types:
+            columns.append(phone_type.utterance.id.column_name("utterance_id"))
+            column_labels.append("utterance_id")
+        if "syllable" in self.annotation_types:
+            columns.append(phone_type.syllable.label.column_name("syllable_label"))
+            column_labels.append("syllable_label")
+        q = q.columns(*columns).order_by(phone_type.begin)
+        intervals = {x: [] for x in column_labels}
+        for r in q.all():
+            for x in column_labels:
+                intervals[x].append(r[x])
+        for x in ["begin", "end"]:
+            intervals[x] = np.array([float(y) for y in intervals[x]], dtype=np.float64)
+        return intervals
+
+    def _track_points(
+        self,
+        acoustic_name,
+        track,
+        intervals,
+        tag_dict,
+        utterance_id=None,
+        phone_indices=None,
+        fill_missing=False,
+        time_precision=None,
+    ):
+        """
+        Generate InfluxDB points for a track, labelling each time point with the phone it falls in, and leaving
+        out time points that do not fall in any phone
+
+        Parameters
+        ----------
+        acoustic_name : str
+            Name of the acoustic measure
+        track : dict
+            Measurement values keyed by time point
+        intervals : dict
+            Phone intervals from :meth:`_phone_intervals`
+        tag_dict : dict
+            Tags to save with each point
+        utterance_id : str, optional
+            Utterance ID to use for all points, otherwise taken from each point's phone
+        phone_indices : :class:`numpy.array`, optional
+            Indices of the phones in ``intervals`` that points can fall in, defaults to all of them
+        fill_missing : bool
+            Flag for saving missing numeric values as -1 rather than leaving them out
+        time_precision : str, optional
+            Set to "ms" for time stamps in milliseconds rather than nanoseconds
+
+        Returns
+        -------
+        list
+            Points to write to InfluxDB
+        """
+        measures = self.hierarchy.acoustic_properties[acoustic_name]
+        has_syllables = "syllable" in self.annotation_types
+        to_time = s_to_ms if time_precision == "ms" else s_to_nano
+        begins, ends = intervals["begin"], intervals["end"]
+        if phone_indices is not None:
+            begins, ends = begins[phone_indices], ends[phone_indices]
+        items = list(track.items())
+        matched = align_time_points([x[0] for x in items], begins)
+        data = []
+        for (time_point, value), i in zip(items, matched):
+            # Time points before the first phone, in pauses or after the last phone are not saved
+            if i < 0 or float(time_point) > ends[i]:
+                continue
+            if phone_indices is not None:
+                i = phone_indices[i]
+            fields = {}
+            for name, type in measures:
+                v = sanitize_value(value[name], type)
+                if v is not None:
+                    fields[name] = v
+                elif fill_missing and type in [int, float]:
+                    fields[name] = type(-1)
+            if not fields:
+                continue
+            t_dict = {"speaker": intervals["speaker"][i]}
+            t_dict.update(tag_dict)
+            point_utterance_id = utterance_id
+            if point_utterance_id is None and "utterance_id" in intervals:
+                point_utterance_id = intervals["utterance_id"][i]
+            if point_utterance_id is not None:
+                fields["utterance_id"] = point_utterance_id
+            fields["phone"] = intervals["label"][i]
+            fields["word"] = intervals["word_label"][i]
+            if has_syllables:
+                fields["syllable"] = intervals["syllable_label"][i]
+            data.append(
+                {
+                    "measurement": acoustic_name,
+                    "tags": t_dict,
+                    "time": to_time(time_point),
+                    "fields": fields,
+                }
+            )
+        return data
+
     def _save_measurement_tracks(self, acoustic_name, tracks, speaker):
         data = []
 
-        measures = self.hierarchy.acoustic_properties[acoustic_name]
+        file_discourses = {}
+        discourse_phones = {}
         for seg, track in tracks.items():
             if not len(track.keys()):
                 continue
-            file_path, _, _, channel, utterance_id = (
+            file_path, channel, utterance_id = (
                 seg.file_path,
-                seg.begin,
-                seg.end,
                 seg.channel,
                 seg["utterance_id"],
             )
-            res = self.execute_cypher(
-                "MATCH (d:Discourse:{corpus_name}) where d.low_freq_file_path = $file_path OR "
-                "d.vowel_file_path = $file_path OR "
-                "d.consonant_file_path = $file_path "
-                "RETURN d.name as name".format(corpus_name=self.cypher_safe_name),
-                file_path=file_path,
-            )
-            for r in res:
-                discourse = r["name"]
-            phone_type = getattr(self, self.phone_name)
-            min_time = min(track.keys())
-            max_time = max(track.keys())
-            q = self.query_graph(phone_type).filter(phone_type.discourse.name == discourse)
-            q = q.filter(phone_type.utterance.id == utterance_id)
-            q = q.filter(phone_type.end >= min_time).filter(phone_type.begin <= max_time)
-            columns = [
-                phone_type.label.column_name("label"),
-                phone_type.begin.column_name("begin"),
-                phone_type.end.column_name("end"),
-                phone_type.word.label.column_name("word_label"),
-            ]
-            if "syllable" in self.annotation_types:
-                columns.append(phone_type.syllable.label.column_name("syllable_label"))
-                q = q.columns(*columns).order_by(phone_type.begin)
-                phones = [
-                    (
-                        x["label"],
-                        x["begin"],
-                        x["end"],
-                        x["word_label"],
-                        x["syllable_label"],
+            discourse = seg["discourse"]
+            if discourse is None:
+                if file_path not in file_discourses:
+                    res = self.execute_cypher(
+                        "MATCH (d:Discourse:{corpus_name}) where d.low_freq_file_path = $file_path OR "
+                        "d.vowel_file_path = $file_path OR "
+                        "d.consonant_file_path = $file_path "
+                        "RETURN d.name as name".format(corpus_name=self.cypher_safe_name),
+                        file_path=file_path,
                     )
-                    for x in q.all()
-                ]
-            else:
-                q = q.columns(*columns).order_by(phone_type.begin)
-                phones = [(x["label"], x["begin"], x["end"], x["word_label"]) for x in q.all()]
-            for time_point, value in track.items():
-                fields = {}
-                for name, type in measures:
-                    v = sanitize_value(value[name], type)
-                    if v is not None:
-                        fields[name] = v
-                    elif type in [int, float]:
-                        fields[name] = type(-1)
-                if not fields:
-                    continue
-                label = None
-                for i, p in enumerate(phones):
-                    if p[1] > time_point:
-                        break
-                    label = p[0]
-                    if "syllable" in self.annotation_types:
-                        syllable_label = p[4]
-                    word_label = p[3]
-                    if i == len(phones) - 1:
-                        break
-                else:
-                    label = None
-                if label is None:
-                    continue
-                t_dict = {
-                    "speaker": speaker,
-                    "discourse": discourse,
-                    "channel": channel,
-                }
-                fields["phone"] = label
-                fields["word"] = word_label
-                fields["utterance_id"] = utterance_id
-                if "syllable" in self.annotation_types:
-                    fields["syllable"] = syllable_label
-                d = {
-                    "measurement": acoustic_name,
-                    "tags": t_dict,
-                    "time": s_to_ms(time_point),
-                    "fields": fields,
-                }
-                data.append(d)
-        self.acoustic_client().write_points(data, batch_size=1000, time_precision="ms")
+                    for r in res:
+                        file_discourses[file_path] = r["name"]
+                discourse = file_discourses.get(file_path)
+            if discourse not in discourse_phones:
+                # One phone lookup per discourse for the speaker, split up by utterance
+                intervals = self._phone_intervals(discourse, speaker=speaker)
+                utterances = {}
+                for i, u in enumerate(
+                    intervals.get("utterance_id", [None] * len(intervals["label"]))
+                ):
+                    utterances.setdefault(u, []).append(i)
+                discourse_phones[discourse] = (
+                    intervals,
+                    {k: np.array(v, dtype=np.int64) for k, v in utterances.items()},
+                )
+            intervals, utterances = discourse_phones[discourse]
+            phone_indices = utterances.get(utterance_id)
+            if phone_indices is None:
+                continue
+            tag_dict = {"speaker": speaker, "discourse": discourse, "channel": channel}
+            data.extend(
+                self._track_points(
+                    acoustic_name,
+                    track,
+                    intervals,
+                    tag_dict,
+                    utterance_id=utterance_id,
+                    phone_indices=phone_indices,
+                    fill_missing=True,
+                    time_precision="ms",
+                )
+            )
+        self.acoustic_writer().write(data, time_precision="ms")
 
     def _save_measurement(self, sound_file, track, acoustic_name, **kwargs):
         if not len(track.keys()):
@@ -1062,10 +1671,8 @@ class AudioContext(SyllabicContext):
             sound_file = self.discourse_sound_file(sound_file)
         if sound_file is None:
             return
-        measures = self.hierarchy.acoustic_properties[acoustic_name]
         if kwargs.get("channel", None) is None:
             kwargs["channel"] = 0
-        data = []
         tag_dict = {}
         if isinstance(sound_file, str):
             kwargs["discourse"] = sound_file
@@ -1073,69 +1680,13 @@ class AudioContext(SyllabicContext):
             kwargs["discourse"] = sound_file["name"]
         utterance_id = kwargs.pop("utterance_id", None)
         tag_dict.update(kwargs)
-        phone_type = getattr(self, self.phone_name)
         min_time = min(track.keys())
         max_time = max(track.keys())
-        q = self.query_graph(phone_type).filter(phone_type.discourse.name == kwargs["discourse"])
-        q = q.filter(phone_type.end >= min_time).filter(phone_type.begin <= max_time)
-        columns = [
-            phone_type.label.column_name("label"),
-            phone_type.begin.column_name("begin"),
-            phone_type.end.column_name("end"),
-            phone_type.word.label.column_name("word_label"),
-            phone_type.speaker.name.column_name("speaker"),
-        ]
-        column_labels = ["label", "begin", "end", "word_label", "speaker"]
-        if "utterance" in self.annotation_types:
-            columns.append(phone_type.syllable.label.column_name("utterance_id"))
-            column_labels.append("utterance_id")
-        if "syllable" in self.annotation_types:
-            columns.append(phone_type.syllable.label.column_name("syllable_label"))
-            column_labels.append("syllable_label")
-        q = q.columns(*columns).order_by(phone_type.begin)
-        phones = [{y: x[y] for y in column_labels} for x in q.all()]
-        for time_point, value in track.items():
-            fields = {}
-            for name, type in measures:
-                v = sanitize_value(value[name], type)
-                if v is not None:
-                    fields[name] = v
-            if not fields:
-                continue
-            label = None
-            speaker = None
-            word_label = None
-            syllable_label = None
-            for i, p in enumerate(phones):
-                if p["begin"] > time_point:
-                    break
-                label = p["label"]
-                speaker = p["speaker"]
-                if "syllable" in self.annotation_types:
-                    syllable_label = p["syllable_label"]
-                word_label = p["word_label"]
-                if utterance_id is None:
-                    utterance_id = p.get("utterance_id", None)
-                if i == len(phones) - 1:
-                    break
-            if speaker is None:
-                continue
-            t_dict = {"speaker": speaker}
-            t_dict.update(tag_dict)
-            if utterance_id is not None:
-                fields["utterance_id"] = utterance_id
-            fields["phone"] = label
-            fields["word"] = word_label
-            if "syllable" in self.annotation_types:
-                fields["syllable"] = syllable_label
-            d = {
-                "measurement": acoustic_name,
-                "tags": t_dict,
-                "time": s_to_nano(time_point),
-                "fields": fields,
-            }
-            data.append(d)
-        self.acoustic_client().write_points(data, batch_size=1000)
+        intervals = self._phone_intervals(kwargs["discourse"], begin=min_time, end=max_time)
+        data = self._track_points(
+            acoustic_name, track, intervals, tag_dict, utterance_id=utterance_id
+        )
+        self.acoustic_writer().write(data)
 
     def save_acoustic_track(self, acoustic_name, discourse, track, **kwargs):
         """
@@ -1195,6 +1746,111 @@ class AudioContext(SyllabicContext):
             return False
         return True
 
+    def _acoustic_tag_keys(self, acoustic_name):
+        """
+        Get the tags used for an acoustic measure
+
+        Parameters
+        ----------
+        acoustic_name : str
+            Name of the acoustic measure
+
+        Returns
+        -------
+        list
+            Tag keys
+        """
+        result = self.execute_influxdb('SHOW TAG KEYS FROM "{}";'.format(acoustic_name))
+        return [x["tagKey"] for x in result.get_points()]
+
+    def _iterate_acoustic_points(self, acoustic_name, speaker, fields=None, chunk_size=50000):
+        """
+        Stream the points of an acoustic measure for a speaker
+
+        Parameters
+        ----------
+        acoustic_name : str
+            Name of the acoustic measure
+        speaker : str
+            Name of the speaker
+        fields : list, optional
+            Fields to return, defaults to all tags and fields
+        chunk_size : int
+            Number of points to request at a time
+
+        Yields
+        ------
+        list
+            Points as dictionaries, with times in milliseconds
+        """
+        if fields is None:
+            select = "*"
+        else:
+            select = ", ".join('"{}"'.format(x) for x in fields)
+        query = """select {} from "{}" where "speaker" = '{}';""".format(
+            select, acoustic_name, speaker.replace("'", r"\'")
+        )
+        client = self._acoustic_stream_client()
+        results = client.query(query, epoch="ms", chunked=True, chunk_size=chunk_size)
+        for result in results:
+            points = list(result.get_points())
+            if points:
+                yield points
+
+    def _grouped_acoustic_statistics(
+        self,
+        acoustic_name,
+        measures,
+        annotation_field,
+        by_speaker=True,
+        by_label=True,
+        speakers=None,
+        keep_values=False,
+    ):
+        """
+        Accumulate summary statistics of acoustic measures grouped by speaker and/or annotation label, streaming
+        each speaker's points once
+
+        Parameters
+        ----------
+        acoustic_name : str
+            Name of the acoustic measure
+        measures : list
+            Names of the measures to summarize
+        annotation_field : str
+            Annotation field of the points (i.e., `phone`, `word` or `syllable`), points without a label are skipped
+        by_speaker : bool
+            Flag for grouping by speaker
+        by_label : bool
+            Flag for grouping by annotation label
+        speakers : list, optional
+            Speakers to include, defaults to all speakers
+        keep_values : bool
+            Flag for keeping values, needed for medians and modes
+
+        Returns
+        -------
+        :class:`~polyglotdb.acoustics.statistics.GroupedStatistics`
+            Statistics keyed by (speaker, label) pairs, labels or speakers
+        """
+        summary = GroupedStatistics(measures, keep_values=keep_values)
+        if speakers is None:
+            speakers = self.speakers
+        for s in speakers:
+            for points in self._iterate_acoustic_points(
+                acoustic_name, s, [annotation_field] + measures
+            ):
+                labels = [p.get(annotation_field) or None for p in points]
+                if by_speaker and by_label:
+                    keys = [(s, x) if x is not None else None for x in labels]
+                elif by_label:
+                    keys = labels
+                else:
+                    keys = [s if x is not None else None for x in labels]
+                values = np.array([[p.get(m) for m in measures] for p in points], dtype=np.float64)
+                summary.update(keys, values)
+        return summary
+
     def encode_acoustic_statistic(
         self, acoustic_name, statistic, by_annotation=None, by_speaker=True
     ):
@@ -1248,52 +1904,26 @@ class AudioContext(SyllabicContext):
             for x in self.hierarchy.acoustic_properties[acoustic_name]
             if x[1] in [int, float]
         }
+        set_statements = [
+            statistic_template.format(statistic=statistic, measure=measure)
+            for measure in measures.keys()
+        ]
+        if by_annotation:
+            neo4j_label = "{}_type".format(by_annotation)
+            db_field = by_annotation
+            summary = self._grouped_acoustic_statistics(
+                acoustic_name,
+                list(measures.keys()),
+                by_annotation,
+                by_speaker=by_speaker,
+                keep_values=statistic in ["median", "mode"],
+            )
         if by_speaker and by_annotation:
             results = []
-            annotation_map = {
-                "phone": {
-                    "attr": self.phones,
-                    "field": "phone",
-                    "neo4j_label": "phone_type",
-                },
-                "word": {
-                    "attr": self.words,
-                    "field": "word",
-                    "neo4j_label": "word_type",
-                },
-                "syllable": {
-                    "attr": self.syllables,
-                    "field": "syllable",
-                    "neo4j_label": "syllable_type",
-                },
-            }
-
-            annotation_data = annotation_map[by_annotation]
-            items = annotation_data["attr"]
-            db_field = annotation_data["field"]
-            neo4j_label = annotation_data["neo4j_label"]
-
-            for item in items:
-                query = """select {} from "{}"
-                        where "{}" = '{}' group by "speaker";""".format(
-                    ", ".join(measures),
-                    acoustic_name,
-                    db_field,
-                    item.replace("'", r"\'"),
-                )
-                influx_result = self.execute_influxdb(query)
-
-                for k, v in influx_result.items():
-                    v_dict = list(v)[0]
-                    result = {"speaker": k[1]["speaker"], db_field: item}
-                    for measure in measures.keys():
-                        result[measure] = v_dict[measure]
-                    results.append(result)
-
-            set_statements = [
-                statistic_template.format(statistic=statistic, measure=measure)
-                for measure in measures.keys()
-            ]
+            for speaker, item in summary.keys():
+                result = {"speaker": speaker, db_field: item}
+                result.update(summary.statistic((speaker, item), statistic))
+                results.append(result)
 
             statement = """WITH $data as data
                         UNWIND data as d
@@ -1310,53 +1940,15 @@ class AudioContext(SyllabicContext):
             )
 
         elif by_annotation:
-            annotation_map = {
-                "phone": {
-                    "list_attr": self.phones,
-                    "db_field": "phone",
-                    "neo4j_label": "phone_type",
-                },
-                "word": {
-                    "list_attr": self.words,
-                    "db_field": "word",
-                    "neo4j_label": "word_type",
-                },
-                "syllable": {
-                    "list_attr": self.syllables,
-                    "db_field": "syllable",
-                    "neo4j_label": "syllable_type",
-                },
-            }
-
-            annotation_data = annotation_map[by_annotation]
-            items = annotation_data["list_attr"]
-            db_field = annotation_data["db_field"]
-            neo4j_label = annotation_data["neo4j_label"]
-
             results = []
-            for item in items:
-                query = """select {} from "{}"
-                        where "{}" = '{}';""".format(
-                    ", ".join(measures.values()),
-                    acoustic_name,
-                    db_field,
-                    item.replace("'", r"\'"),
-                )
-
-                influx_result = self.execute_influxdb(query)
-
+            for item in getattr(self, by_annotation + "s"):
                 result = {db_field: item}
-                for k, v in influx_result.items():
-                    v_dict = list(v)[0]
-                    for measure in measures.keys():
-                        result[measure] = v_dict[measure]
+                if item in summary:
+                    result.update(summary.statistic(item, statistic))
+                else:
+                    result.update({measure: None for measure in measures.keys()})
                 results.append(result)
 
-            set_statements = [
-                statistic_template.format(statistic=statistic, measure=measure)
-                for measure in measures.keys()
-            ]
-
             statement = """WITH $data as data
                         UNWIND data as d
                         MATCH (n:{neo4j_label}:{corpus_name})
@@ -1387,11 +1979,6 @@ class AudioContext(SyllabicContext):
                     result[measure] = v_dict[measure]
                 results.append(result)
 
-            set_statements = []
-            for measure in measures.keys():
-                set_statements.append(
-                    statistic_template.format(statistic=statistic, measure=measure)
-                )
             statement = """WITH $data as data
                             UNWIND data as d
                             MATCH (n:Speaker:{corpus_name})
@@ -1572,10 +2159,13 @@ class AudioContext(SyllabicContext):
         client.query('DROP MEASUREMENT "{}"'.format(acoustic_name))
         client.query('SELECT * INTO "{0}" FROM "{0}_copy" GROUP BY *'.format(acoustic_name))
         client.query('DROP MEASUREMENT "{}_copy"'.format(acoustic_name))
+        self.clear_acoustic_cache()
         self.hierarchy.remove_acoustic_properties(self, acoustic_name, to_remove)
         self.encode_hierarchy()
 
-    def relativize_acoustic_measure(self, acoustic_name, by_annotation=None, by_speaker=True):
+    def relativize_acoustic_measure(
+        self, acoustic_name, by_annotation=None, by_speaker=True, chunk_size=50000
+    ):
         """
         Relativize acoustic tracks by taking the z-score of the points (using by speaker or by annotation means and standard
         deviations, or both by-speaker, by annotation) and save them as separate measures, i.e., F0_relativized from F0.
@@ -1588,6 +2178,8 @@ class AudioContext(SyllabicContext):
             Flag for relativizing by speaker
         by_annotation : str, defaults to None
             Flag for relativizing by annotation
+        chunk_size : int, defaults to 50000
+            Number of points to relativize at a time
         """
         if acoustic_name not in self.hierarchy.acoustics:
             raise ValueError(
@@ -1603,114 +2195,66 @@ class AudioContext(SyllabicContext):
                 f'Annotation type must be one of: {", ".join(valid_annotation_types)}.'
             )
 
-        client = self.acoustic_client()
-
-        template = 'mean("{0}") as mean_{0}, stddev("{0}") as sd_{0}'
+        writer = self.acoustic_writer()
         props = [
             x
             for x in self.hierarchy.acoustic_properties[acoustic_name]
             if x[1] in [int, float] and not x[0].endswith("relativized")
         ]
-        statistics = {x[0]: template.format(x[0]) for x in props}
-        aliases = {x[0]: ("mean_{}".format(x[0]), "sd_{}".format(x[0])) for x in props}
-
-        summary_data = {}
-
-        if by_annotation:
-            db_field = by_annotation
-        else:
-            db_field = "phone"
-        if by_annotation:
-            for item in getattr(self, by_annotation + "s", []):
-                if by_speaker:
-                    query = """select {} from "{}"
-                                where "{}" = '{}' group by "speaker";""".format(
-                        ", ".join(statistics.values()),
-                        acoustic_name,
-                        db_field,
-                        item.replace("'", r"\'"),
-                    )
-                    result = client.query(query)
-                    for k, v in result.items():
-                        v = list(v)
-                        for measure, (mean_name, sd_name) in aliases.items():
-                            summary_data[(k[1]["speaker"], item, measure)] = v[0].get(
-                                mean_name
-                            ), v[0].get(sd_name)
-                else:
-                    query = """select {} from "{}"
-                                where "{}" = '{}';""".format(
-                        ", ".join(statistics.values()),
-                        acoustic_name,
-                        db_field,
-                        item.replace("'", r"\'"),
-                    )
-                    result = client.query(query)
-                    for k, v in result.items():
-                        v = list(v)
-                        for measure, (mean_name, sd_name) in aliases.items():
-                            summary_data[(item, measure)] = v[0].get(mean_name), v[0].get(sd_name)
-        else:
-            query = """select {} from "{}"
-                        where "{}" != '' group by "speaker";""".format(
-                ", ".join(statistics.values()), acoustic_name, db_field
+        measures = [x[0] for x in props]
+        relativized_names = ["{}_relativized".format(x) for x in measures]
+        db_field = by_annotation if by_annotation else "phone"
+        tag_keys = self._acoustic_tag_keys(acoustic_name)
+
+        summary = None
+        if by_annotation and not by_speaker:
+            summary = self._grouped_acoustic_statistics(
+                acoustic_name, measures, by_annotation, by_speaker=False
             )
-            result = client.query(query)
-            for k, v in result.items():
-                v = list(v)
-                for measure, (mean_name, sd_name) in aliases.items():
-                    summary_data[(k[1]["speaker"], measure)] = v[0].get(mean_name), v[0].get(
-                        sd_name
-                    )
 
         for s in self.speakers:
-            safe_speaker = s.replace("'", r"\'")
-            all_query = """select * from "{}"
-                            where '{}' != '' and "speaker" = '{}';""".format(
-                acoustic_name, db_field, safe_speaker
-            )
-            all_results = client.query(all_query)
-            data = []
-            for _, records in all_results.items():
-                for t_dict in records:
-                    annotation_value = t_dict.pop(db_field)
-                    time_point = t_dict.pop("time")
-                    t_dict.pop("utterance_id", "")
-                    t_dict.pop("syllable", "")
-                    t_dict.pop("word", "")
-                    t_dict.pop("phone", "")
-                    fields = {}
-
-                    for measure, (mean_name, sd_name) in aliases.items():
-                        if by_speaker and by_annotation:
-                            mean_value, sd_value = summary_data[
-                                (t_dict["speaker"], annotation_value, measure)
-                            ]
-                        elif by_annotation and not by_speaker:
-                            mean_value, sd_value = summary_data[(annotation_value, measure)]
-                        elif by_speaker:
-                            mean_value, sd_value = summary_data[(t_dict["speaker"], measure)]
-                        if sd_value is None:
-                            continue
-                        value = t_dict.pop(measure)
-                        if value is None:
-                            continue
-                        new_value = t_dict.pop("{}_relativized".format(measure), None)
-                        new_value = (value - mean_value) / sd_value
-                        fields["{}_relativized".format(measure)] = new_value
-                    if not fields:
+            if summary is None:
+                # Statistics involving the speaker only need that speaker's points
+                speaker_summary = self._grouped_acoustic_statistics(
+                    acoustic_name,
+                    measures,
+                    db_field,
+                    by_label=bool(by_annotation),
+                    speakers=[s],
+                )
+            else:
+                speaker_summary = summary
+            for points in self._iterate_acoustic_points(acoustic_name, s, chunk_size=chunk_size):
+                labels = [p.get(db_field) or None for p in points]
+                if by_speaker and by_annotation:
+                    keys = [(s, x) for x in labels]
+                elif by_annotation:
+                    keys = labels
+                else:
+                    keys = [s] * len(points)
+                values = np.array([[p.get(m) for m in measures] for p in points], dtype=np.float64)
+                means, sds = speaker_summary.lookup(keys)
+                relativized = z_scores(values, means, sds)
+                valid = ~np.isnan(relativized)
+                data = []
+                for p, row, row_valid in zip(points, relativized.tolist(), valid.tolist()):
+                    if not any(row_valid):
                         continue
-                    time_point = s_to_ms(to_seconds(time_point))
+                    fields = {
+                        name: value
+                        for name, value, is_valid in zip(relativized_names, row, row_valid)
+                        if is_valid
+                    }
+                    tags = {k: p[k] for k in tag_keys if p.get(k) is not None}
                     data.append(
                         {
                             "measurement": acoustic_name,
-                            "tags": t_dict,
-                            "time": time_point,
+                            "tags": tags,
+                            "time": p["time"],
                             "fields": fields,
                         }
                     )
-
-            client.write_points(data, batch_size=1000, time_precision="ms")
+                writer.write(data, time_precision="ms")
         self.hierarchy.add_acoustic_properties(
             self, acoustic_name, [(x[0] + "_relativized", float) for x in props]
         )
@@ -1765,7 +2309,7 @@ class AudioContext(SyllabicContext):
                                 where "phone" != '' and
                                 "discourse" = '{discourse_name}' and
                                 "speaker" = '{s}';"""
-                all_results = client.query(all_query)
+                all_results = client.query(all_query, epoch="ms")
                 cur_index = 0
                 for _, r in all_results.items():
                     for t_dict in r:
@@ -1776,12 +2320,12 @@ class AudioContext(SyllabicContext):
                         for m in props:
                             _ = t_dict.pop(m, None)
 
-                        time_point = to_seconds(t_dict.pop("time"))
+                        time_point = t_dict.pop("time")
+                        seconds = time_point / 1000
                         for i in range(cur_index, len(utterances)):
-                            if utterances[i]["begin"] <= time_point <= utterances[i]["end"]:
+                            if utterances[i]["begin"] <= seconds <= utterances[i]["end"]:
                                 cur_index = i
                                 break
-                        time_point = s_to_ms(time_point)
                         d = {
                             "measurement": acoustic_name,
                             "tags": t_dict,
@@ -1789,45 +2333,67 @@ class AudioContext(SyllabicContext):
                             "fields": {"utterance_id": utterances[cur_index]["utterance_id"]},
                         }
                         data.append(d)
-            client.write_points(data, batch_size=1000, time_precision="ms")
+            self.acoustic_writer().write(data, time_precision="ms")
 
-    def save_track_from_csv(self, acoustic_name, path, properties):
+    def save_track_from_csv(self, acoustic_name, path, properties, chunk_size=50000):
         """
-        Reads a CSV file containing measurement tracks and saves each track using the _save_measurement API.
+        Reads a CSV file containing measurement tracks and saves them to the acoustic database.
+
+        The file is streamed in chunks of rows, with a single phone lookup for the discourse.  Points are
+        written in batches of the ``acoustic_write_batch_size`` of the config.
 
         Parameters:
-        corpus_context : object
-            The corpus context for accessing the database and helper methods.
         acoustic_name : str
             The name of the acoustic measure.
         path : str
-            Path to the CSV file containing the measurement data.
+            Path to the CSV file containing the measurement data, named after its discourse.
         properties : list
             list of properties to read from the csv
-        discourse : str
-            Name of the discourse to store the track.
-        time_column : str
-            Name of the column in the CSV that contains time.
+        chunk_size : int
+            Number of rows to read from the csv before saving them, defaults to 50000
         """
-        import_track_csv(self, acoustic_name=acoustic_name, path=path, properties=properties)
+        import_track_csv(
+            self,
+            acoustic_name=acoustic_name,
+            path=path,
+            properties=properties,
+            chunk_size=chunk_size,
+        )
 
-    def save_track_from_csvs(self, acoustic_name, directory_path, properties):
+    def save_track_from_csvs(
+        self,
+        acoustic_name,
+        directory_path,
+        properties,
+        num_jobs=None,
+        multiprocessing=True,
+        chunk_size=50000,
+    ):
         """
-        Reads a directory of CSV files containing measurement tracks, identifies the corresponding utterance,
-        and saves each track using the _save_measurement_tracks API.
+        Reads a directory of CSV files containing measurement tracks and saves them to the acoustic database,
+        importing several files at once.  Points are written in batches of the ``acoustic_write_batch_size`` of
+        the config.
 
         Parameters:
-        corpus_context : object
-            The corpus context for accessing the database and helper methods.
         acoustic_name : str
             The name of the acoustic measure.
-        path : str
-            Path to the CSV file containing the measurement data.
+        directory_path : str
+            Path to the directory of CSV files, each named after its discourse.
         properties : list
             list of properties to read from the csv
-        discourse : str
-            Name of the discourse to store the track.
-        time_column : str
-            Name of the column in the CSV that contains time.
+        num_jobs : int
+            Number of files to import at once, defaults to three quarters of the available CPUs
+        multiprocessing : bool
+            Flag to use multiprocessing, otherwise will use threading
+        chunk_size : int
+            Number of rows to read from each csv before saving them, defaults to 50000
         """
-        import_track_csvs(self, acoustic_name, directory_path, properties)
+        import_track_csvs(
+            self,
+            acoustic_name,
+            directory_path,
+            properties,
+            num_jobs=num_jobs,
+            multiprocessing=multiprocessing,
+            chunk_size=chunk_size,
+        )
@@ -110,6 +110,39 @@ class BaseContext(object):
         except Exception:
             raise
 
+    def stream_cypher(self, statement, batch_size=None, **parameters):
+        """
+        Executes a cypher query and generates its records as they are fetched from the graph database, rather
+        than loading them all at once
+
+        The session is kept open until every record has been generated or the generator is closed.
+
+        Parameters
+        ----------
+        statement : str
+            the cypher statement
+        batch_size : int, optional
+            Number of records to fetch at a time, defaults to the ``query_batch_size`` of the config
+        parameters : kwargs
+            keyword arguments to execute a cypher statement
+
+        Yields
+        ------
+        dict
+            Record of the Cypher query
+        """
+        if batch_size is None:
+            batch_size = self.config.query_batch_size
+        for k, v in parameters.items():
+            if isinstance(v, Decimal):
+                parameters[k] = float(v)
+        with self.graph_driver.session(fetch_size=batch_size) as session:
+            if self.config.debug:
+                print("Statement:", statement)
+                print("Parameters:", parameters)
+            for record in session.run(statement, **parameters):
+                yield record.data()
+
     @property
     def cypher_safe_name(self):
         """
@@ -4,10 +4,15 @@ import os
 import re
 import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 import neo4j
 
-from polyglotdb.acoustics.io import setup_audio
+from polyglotdb.acoustics.io import (
+    prepare_discourse_audio,
+    save_discourse_sound_info,
+    setup_audio,
+)
 from polyglotdb.corpus.structured import StructuredContext
 from polyglotdb.exceptions import ParseError
 from polyglotdb.io.importer import (
@@ -109,7 +114,7 @@ class ImportContext(StructuredContext):
         import_csvs(self, speakers, token_headers, hierarchy, call_back, stop_check)
         self.encode_hierarchy()
 
-    def add_discourse(self, data):
+    def add_discourse(self, data, setup_sound=True):
         """
         Set up a discourse to be imported to the Neo4j database
 
@@ -117,6 +122,8 @@ class ImportContext(StructuredContext):
         ----------
         data : :class:`~polyglotdb.io.helper.DiscourseData`
             Data for the discourse to be added
+        setup_sound : bool
+            Flag for generating the discourse's resampled sound files, defaults to True
         """
         if data.name in self.discourses:
             raise (
@@ -154,12 +161,13 @@ class ImportContext(StructuredContext):
         data.corpus_name = self.corpus_name
         data_to_graph_csvs(self, data)
         self.hierarchy.update(data.hierarchy)
-        setup_audio(self, data)
+        if setup_sound:
+            setup_audio(self, data)
 
         log.info("Finished adding discourse {}!".format(data.name))
         log.debug("Total time taken: {} seconds".format(time.time() - begin))
 
-    def load(self, parser, path):
+    def load(self, parser, path, multiprocessing=False):
         """
         Use a specified parser on a path to either a directory or a single
         file
@@ -172,6 +180,9 @@ class ImportContext(StructuredContext):
         path : str
             The location of the corpus
 
+        multiprocessing : bool
+            Flag for preparing the sound files of a directory in other processes, see :meth:`load_directory`
+
         Returns
         -------
         could_not_parse : list
@@ -180,7 +191,7 @@ class ImportContext(StructuredContext):
 
         if os.path.isdir(path):
             print("loading {} with {}".format(path, parser))
-            could_not_parse = self.load_directory(parser, path)
+            could_not_parse = self.load_directory(parser, path, multiprocessing=multiprocessing)
         else:
             could_not_parse = self.load_discourse(parser, path)
         return could_not_parse
@@ -221,7 +232,7 @@ class ImportContext(StructuredContext):
         )
         return []
 
-    def load_directory(self, parser, path):
+    def load_directory(self, parser, path, multiprocessing=False):
         """
         Checks if it can parse each file in dir,
         initializes, adds types, adds data, and finalizes import
@@ -232,6 +243,9 @@ class ImportContext(StructuredContext):
                 the type of parser used for corpus
         path : str
             the location of the directory
+        multiprocessing : bool
+            Flag for resampling sound files in other processes while the remaining files are parsed, otherwise
+            each discourse's sound files are prepared as it is added
 
         Returns
         -------
@@ -306,20 +320,45 @@ class ImportContext(StructuredContext):
         if call_back is not None:
             call_back("Parsing files...")
             call_back(0, len(file_tuples))
-        for i, t in enumerate(file_tuples):
-            if parser.stop_check is not None and parser.stop_check():
-                return
-            root, filename = t
-            name = os.path.splitext(filename)[0]
-            if call_back is not None:
-                call_back("Parsing file {} of {} ({})...".format(i + 1, len(file_tuples), name))
-                call_back(i)
-            path = os.path.join(root, filename)
-            try:
-                data = parser.parse_discourse(path)
-            except ParseError:
-                continue
-            self.add_discourse(data)
+        executor = None
+        if multiprocessing:
+            # Sound files are resampled in other processes while the remaining files are parsed
+            executor = ProcessPoolExecutor(max_workers=max(1, int(3 * os.cpu_count() / 4)))
+        try:
+            sound_jobs = {}
+            for i, t in enumerate(file_tuples):
+                if parser.stop_check is not None and parser.stop_check():
+                    return
+                root, filename = t
+                name = os.path.splitext(filename)[0]
+                if call_back is not None:
+                    call_back(
+                        "Parsing file {} of {} ({})...".format(i + 1, len(file_tuples), name)
+                    )
+                    call_back(i)
+                path = os.path.join(root, filename)
+                try:
+                    data = parser.parse_discourse(path)
+                except ParseError:
+                    continue
+                if executor is None:
+                    self.add_discourse(data)
+                    continue
+                self.add_discourse(data, setup_sound=False)
+                if data.wav_path is not None and os.path.exists(data.wav_path):
+                    sound_jobs[data.name] = executor.submit(
+                        prepare_discourse_audio,
+                        data.wav_path,
+                        self.discourse_audio_directory(data.name),
+                        self.config.audio_cache_dir,
+                    )
+            if call_back is not None and sound_jobs:
+                call_back("Processing sound files...")
+            for name, job in sound_jobs.items():
+                save_discourse_sound_info(self, name, job.result())
+        finally:
+            if executor is not None:
+                executor.shutdown()
         self.finalize_import(
             speakers, token_headers, parser.hierarchy, call_back, parser.stop_check
         )
@@ -3,6 +3,7 @@ import logging
 import os
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import neo4j
 import numpy as np
@@ -1703,9 +1704,13 @@ def import_token_csv_with_timestamp(
     corpus_context.execute_cypher(statement)
 
 
-def import_track_csv(corpus_context, acoustic_name, path, properties):
+def import_track_csv(corpus_context, acoustic_name, path, properties, chunk_size=50000):
     """
-    Reads a CSV file containing measurement tracks, and saves each track using the _save_measurement API.
+    Reads a CSV file containing measurement tracks and saves them to the acoustic database.
+
+    The file is read in chunks of rows, the phones of the discourse are looked up once for the whole file,
+    and points are written through the corpus's acoustic writer, in batches of the ``acoustic_write_batch_size``
+    of its config.
 
     Parameters:
     corpus_context : object
@@ -1716,32 +1721,54 @@ def import_track_csv(corpus_context, acoustic_name, path, properties):
         Path to the CSV file containing the measurement data.
     properties : list
         list of properties to read from the csv
+    chunk_size : int
+        Number of rows to read from the csv before saving them, defaults to 50000
     """
     if acoustic_name not in corpus_context.hierarchy.acoustics:
         corpus_context.hierarchy.add_acoustic_properties(
             corpus_context, acoustic_name, [(p, float) for p in properties]
         )
         corpus_context.encode_hierarchy()
+    discourse = os.path.splitext(os.path.basename(path))[0]
+    if corpus_context.discourse_sound_file(discourse) is None:
+        return
+    tag_dict = {"discourse": discourse, "channel": 0}
+    intervals = corpus_context._phone_intervals(discourse)
+    writer = corpus_context.acoustic_writer()
     with open(path, "r", newline="", encoding="utf-8") as csvfile:
         reader = csv.DictReader(csvfile)
-        discourse = os.path.splitext(os.path.basename(path))[0]
+        track = {}
         for row in reader:
-            time = float(row["time"])
+            track[float(row["time"])] = {p: float(row[p]) for p in properties}
+            if len(track) >= chunk_size:
+                data = corpus_context._track_points(acoustic_name, track, intervals, tag_dict)
+                writer.write(data)
+                track = {}
+        if track:
+            data = corpus_context._track_points(acoustic_name, track, intervals, tag_dict)
+            writer.write(data)
 
-            track = {}
 
-            measurements = {}
-            for p in properties:
-                measurements[p] = float(row[p])
+def _import_track_csv_worker(config, acoustic_name, path, properties, chunk_size):
+    from polyglotdb.corpus import CorpusContext
 
-            track[time] = measurements
-            corpus_context._save_measurement(discourse, track, acoustic_name)
+    with CorpusContext(config) as c:
+        import_track_csv(c, acoustic_name, path, properties, chunk_size=chunk_size)
 
 
-def import_track_csvs(self, acoustic_name, directory_path, properties):
+def import_track_csvs(
+    corpus_context,
+    acoustic_name,
+    directory_path,
+    properties,
+    num_jobs=None,
+    multiprocessing=True,
+    chunk_size=50000,
+):
     """
-    Reads a directory of CSV files containing measurement tracks, identifies the corresponding utterance,
-    and saves each track using the _save_measurement_tracks API.
+    Reads a directory of CSV files containing measurement tracks and saves them to the acoustic database,
+    importing files in parallel.  Points are written in batches of the ``acoustic_write_batch_size`` of the
+    corpus's config, as for :func:`import_track_csv`.
 
     Parameters
     corpus_context : object
@@ -1752,9 +1779,56 @@ def import_track_csvs(self, acoustic_name, directory_path, properties):
         Path to the CSV file containing the measurement data.
     properties : list
         list of properties to read from the csv
+    num_jobs : int
+        Number of files to import at once, defaults to three quarters of the available CPUs
+    multiprocessing : bool
+        Flag to use multiprocessing, otherwise will use threading
+    chunk_size : int
+        Number of rows to read from each csv before saving them, defaults to 50000
     """
     directory_path = os.path.expanduser(directory_path)
-    for file_name in os.listdir(directory_path):
-        if file_name.endswith(".csv"):
-            full_path = os.path.join(directory_path, file_name)
-            import_track_csv(self, acoustic_name, full_path, properties)
+    paths = [
+        os.path.join(directory_path, x)
+        for x in sorted(os.listdir(directory_path))
+        if x.endswith(".csv")
+    ]
+    if not paths:
+        return
+    if acoustic_name not in corpus_context.hierarchy.acoustics:
+        corpus_context.hierarchy.add_acoustic_properties(
+            corpus_context, acoustic_name, [(p, float) for p in properties]
+        )
+        corpus_context.encode_hierarchy()
+    if num_jobs is None:
+        num_jobs = max(1, int(3 * os.cpu_count() / 4))
+    num_jobs = min(num_jobs, len(paths))
+    if num_jobs == 1:
+        for path in paths:
+            import_track_csv(
+                corpus_context,
+                acoustic_name,
+                path,
+                properties,
+                chunk_size=chunk_size,
+            )
+        return
+    if multiprocessing:
+        executor = ProcessPoolExecutor(max_workers=num_jobs)
+    else:
+        executor = ThreadPoolExecutor(max_workers=num_jobs)
+    with executor:
+        futures = [
+            executor.submit(
+                _import_track_csv_worker,
+                corpus_context.config,
+                acoustic_name,
+                path,
+                properties,
+                chunk_size,
+            )
+            for path in paths
+        ]
+        for f in futures:
+            f.result()
+    # The files were saved through other contexts, so tracks cached before the import are out of date
+    corpus_context.clear_acoustic_cache()
@@ -1,5 +1,6 @@
-from decimal import Decimal
-from statistics import mean, median, stdev
+import math
+
+import numpy as np
 
 from polyglotdb.query.annotations.attributes.base import AnnotationAttribute
 
@@ -19,6 +20,7 @@ class AcousticAttribute(AnnotationAttribute):
         self.cached_settings = None
         self.relative = False
         self.relative_time = False
+        self.resolution = None
 
     def __repr__(self):
         return "<AcousticAttribute '{}'>".format(str(self))
@@ -47,7 +49,7 @@ class AcousticAttribute(AnnotationAttribute):
     def output_columns(self):
         return sorted(x[0] for x in self.node.hierarchy.acoustic_properties[self.label])
 
-    def hydrate(self, corpus, utterance_id, begin, end, padding=0):
+    def hydrate(self, corpus, utterance_id, begin, end, padding=0, utterance_data=None):
         """
         Gets all formants from a discourse
 
@@ -63,13 +65,17 @@ class AcousticAttribute(AnnotationAttribute):
             The end time of the annotation
         padding : float
             Extra time at begin and end
+        utterance_data : :class:`~polyglotdb.acoustics.classes.Track`, optional
+            Track of the whole utterance, looked up in the corpus's acoustic cache if not specified
 
         Returns
         -------
         :class:`~polyglotdb.acoustics.classes.Track`
             A Track object with formant TimePoints
         """
-        utterance_data = self.cache[utterance_id]
+        if utterance_data is None:
+            cache = corpus.acoustic_cache().view(self.label, self.resolution)
+            utterance_data = cache[utterance_id]
         if self.node.node_type == "utterance":
             return utterance_data
         if padding:
@@ -139,23 +145,21 @@ class AggregationAttribute(AcousticAttribute):
             return [self.output_label]
         return ["{}_{}".format(self.agg_prefix, x) for x in self.attribute.output_columns]
 
-    def hydrate(self, corpus, utterance_id, begin, end):
-        data = self.attribute.hydrate(corpus, utterance_id, begin, end)
+    def hydrate(self, corpus, utterance_id, begin, end, utterance_data=None):
+        data = self.attribute.hydrate(
+            corpus, utterance_id, begin, end, utterance_data=utterance_data
+        )
         agg_data = {}
-        for i, c in enumerate(self.output_columns):
-            gen = [
-                x[self.attribute.output_columns[i]]
-                for x in data
-                if self.attribute.output_columns[i] in x
-            ]
-            gen = [x for x in gen if x is not None]
-            if not gen:
+        for c, name in zip(self.output_columns, self.attribute.output_columns):
+            values = data.column(name)
+            if values.dtype == object:
+                values = np.array([x for x in values if x is not None])
+            else:
+                values = values[~np.isnan(values)]
+            if not len(values):
                 agg_data[c] = None
             else:
-                if gen:
-                    agg_data[c] = self.function(gen)
-                else:
-                    agg_data[c] = None
+                agg_data[c] = self.function(values)
         return agg_data
 
 
@@ -166,7 +170,7 @@ class Min(AggregationAttribute):
         return "<Min '{}'>".format(str(self))
 
     def function(self, data):
-        return min(data)
+        return np.min(data).item()
 
 
 class Max(AggregationAttribute):
@@ -176,7 +180,7 @@ class Max(AggregationAttribute):
         return "<Max '{}'>".format(str(self))
 
     def function(self, data):
-        return max(data)
+        return np.max(data).item()
 
 
 class Mean(AggregationAttribute):
@@ -186,7 +190,7 @@ class Mean(AggregationAttribute):
         return "<Mean '{}'>".format(str(self))
 
     def function(self, data):
-        return mean(data)
+        return math.fsum(data) / len(data)
 
 
 class Median(AggregationAttribute):
@@ -196,7 +200,7 @@ class Median(AggregationAttribute):
         return "<Median '{}'>".format(str(self))
 
     def function(self, data):
-        return median(data)
+        return np.median(data).item()
 
 
 class Stdev(AggregationAttribute):
@@ -207,7 +211,7 @@ class Stdev(AggregationAttribute):
 
     def function(self, data):
         if len(data) > 1:
-            return stdev(data)
+            return np.std(data, ddof=1).item()
         return None
 
 
@@ -216,16 +220,32 @@ class Track(AggregationAttribute):
     def output_columns(self):
         return ["time"] + [x for x in self.attribute.output_columns]
 
-    def hydrate(self, corpus, utterance_id, begin, end):
-        data = self.attribute.hydrate(corpus, utterance_id, begin, end)
+    def hydrate(self, corpus, utterance_id, begin, end, utterance_data=None):
+        data = self.attribute.hydrate(
+            corpus, utterance_id, begin, end, utterance_data=utterance_data
+        )
         if self.attribute.relative_time:
-            begin = Decimal(begin)
-            end = Decimal(end)
-            duration = end - begin
-            for p in data:
-                p.time = (p.time - begin) / duration
+            data = data.relative_time(begin, end)
         return data
 
+    def resample(self, step):
+        """
+        Downsample the track in InfluxDB, so that each point is the mean of the measurements in a window of
+        ``step`` seconds.  Other aggregations of the same acoustic attribute use the downsampled track as well.
+
+        Parameters
+        ----------
+        step : float
+            Size of the windows in seconds
+
+        Returns
+        -------
+        :class:`~polyglotdb.query.annotations.attributes.acoustic.Track`
+            The same track attribute
+        """
+        self.attribute.resolution = step
+        return self
+
     def __repr__(self):
         return "<Track '{}'>".format(str(self))
 
@@ -238,47 +258,45 @@ class InterpolatedTrack(Track):
     def __repr__(self):
         return "<InterpolatedTrack '{}'>".format(str(self))
 
-    def hydrate(self, corpus, utterance_id, begin, end):
-        from scipy import interpolate
-
-        from ....acoustics.classes import TimePoint as RawTimePoint
+    def hydrate(self, corpus, utterance_id, begin, end, utterance_data=None):
         from ....acoustics.classes import Track as RawTrack
 
-        data = self.attribute.hydrate(corpus, utterance_id, begin, end, padding=0.01)
+        data = self.attribute.hydrate(
+            corpus, utterance_id, begin, end, padding=0.01, utterance_data=utterance_data
+        )
+        begin, end = float(begin), float(end)
 
         duration = end - begin
         time_step = duration / (self.num_points - 1)
 
-        new_times = [begin + x * time_step for x in range(0, self.num_points)]
-        x = data.times()
-        undef_regions = []
-        for i, x1 in enumerate(x):
-            if i != len(x) - 1:
-                if x[i + 1] - x1 > 0.015:
-                    undef_regions.append((x1, x[i + 1]))
-        new_data = RawTrack()
+        new_times = begin + np.arange(self.num_points) * time_step
+        x = data.seconds
+        # Times falling in gaps of more than 15 ms (or one and a half resampled steps) between measurements
+        # are undefined
+        max_gap = 0.015
+        if self.attribute.resolution:
+            max_gap = max(max_gap, 1.5 * float(self.attribute.resolution))
+        following = np.searchsorted(x, new_times, side="right")
+        inside = (following > 0) & (following < len(x))
+        undefined = np.zeros(len(new_times), dtype=bool)
+        following = following[inside]
+        undefined[inside] = (np.round(x[following] - x[following - 1], 9) > max_gap) & (
+            new_times[inside] > x[following - 1]
+        )
+        new_values = {}
         for o in self.attribute.output_columns:
-            y = [data[x1][o] for x1 in x if data[x1][o] and data[x1][o] > 0]
-            if len(y) > 1:
-                f = interpolate.interp1d(
-                    [float(x1) for x1 in x if data[x1][o] and data[x1][o] > 0], y
-                )
-            for k in new_times:
-                out_time = k
-                if self.attribute.relative_time:
-                    out_time = (k - begin) / duration
-                point = RawTimePoint(out_time)
-                if len(y) < 2:
-                    point.add_value(o, None)
-                else:
-                    for r in undef_regions:
-                        if k > r[0] and k < r[1]:
-                            point.add_value(o, None)
-                            break
-                    else:
-                        try:
-                            point.add_value(o, f([k])[0])
-                        except ValueError:
-                            point.add_value(o, None)
-                new_data.add(point)
-        return new_data
+            y = data.column(o)
+            if y.dtype == object:
+                y = np.array([np.nan if v is None else v for v in y], dtype=np.float64)
+            with np.errstate(invalid="ignore"):
+                voiced = y > 0
+            valid_x, y = x[voiced], y[voiced]
+            if len(y) < 2:
+                new_values[o] = np.full(len(new_times), np.nan)
+                continue
+            interpolated = np.interp(new_times, valid_x, y)
+            interpolated[undefined | (new_times < valid_x[0]) | (new_times > valid_x[-1])] = np.nan
+            new_values[o] = interpolated
+        if self.attribute.relative_time:
+            new_times = (new_times - begin) / duration
+        return RawTrack.from_columns(new_times.tolist(), new_values)
@@ -1,6 +1,8 @@
-from decimal import Decimal
 from uuid import uuid1
 
+import numpy as np
+
+from polyglotdb.acoustics.utils import waveform_envelope
 from polyglotdb.exceptions import GraphModelError
 from polyglotdb.query.base.helper import value_for_cypher
 
@@ -78,6 +80,7 @@ class LinguisticAnnotation(BaseAnnotation):
         self._speaker = None
         self._discourse = None
         self._tracks = {}
+        self._waveform = None
 
         self._preloaded = False
 
@@ -125,19 +128,14 @@ class LinguisticAnnotation(BaseAnnotation):
         """Returns sorted untion of node property keys and type_node property keys"""
         return sorted(set(self._node.keys()) | set(self._type_node.keys()))
 
-    def _load_track(self, track_attribute):
+    def _load_track(self, track_attribute, utterance_data=None):
         if self._type == "utterance":
             utt_id = self.id
         else:
             utt_id = self.utterance.id
-        results = track_attribute.hydrate(self.corpus_context, utt_id, self.begin, self.end)
-        if track_attribute.attribute.relative_time:
-            begin = Decimal(self.begin)
-            end = Decimal(self.end)
-            duration = end - begin
-            for p in results:
-                p.time = (p.time - begin) / duration
-
+        results = track_attribute.hydrate(
+            self.corpus_context, utt_id, self.begin, self.end, utterance_data=utterance_data
+        )
         self._tracks[track_attribute.attribute.label] = results
 
     @property
@@ -149,39 +147,60 @@ class LinguisticAnnotation(BaseAnnotation):
 
     @property
     def waveform(self):
-        signal, sr = self.corpus_context.load_waveform(
-            self.discourse.name, "low_freq", begin=self.begin, end=self.end
-        )
-        step = 1 / sr
-        data = [
-            {"amplitude": float(p), "time": i * step + self.begin} for i, p in enumerate(signal)
-        ]
-        return data
+        signal, sr, begin = self.waveform_array
+        times = (begin + np.arange(signal.shape[0]) / sr).tolist()
+        return [{"amplitude": p, "time": t} for p, t in zip(signal.tolist(), times)]
+
+    @property
+    def waveform_array(self):
+        """
+        Get the waveform of the annotation from the low frequency sound file, which is loaded once and shared
+        (without copying) by later accesses
+
+        Returns
+        -------
+        numpy.array
+            Read-only signal
+        int
+            Sampling rate
+        float
+            Time of the first sample
+        """
+        if self._waveform is None:
+            signal, sr = self.corpus_context.load_waveform(
+                self.discourse.name, "low_freq", begin=self.begin, end=self.end
+            )
+            signal.flags.writeable = False
+            self._waveform = signal, sr, self.begin
+        return self._waveform
+
+    def waveform_envelope(self, width):
+        """
+        Get the minimum and maximum amplitudes of the waveform decimated to a given width for plotting
+
+        Parameters
+        ----------
+        width : int
+            Number of bins (i.e., pixels) to decimate the waveform to
+
+        Returns
+        -------
+        numpy.array
+            Minimum amplitude of each bin
+        numpy.array
+            Maximum amplitude of each bin
+        numpy.array
+            Time of the beginning of each bin
+        """
+        signal, sr, begin = self.waveform_array
+        minimums, maximums, starts = waveform_envelope(signal, width)
+        return minimums, maximums, begin + starts / sr
 
     @property
     def spectrogram(self):
-        orig, time_step, freq_step = self.corpus_context.generate_spectrogram(
+        return self.corpus_context.spectrogram(
             self.discourse.name, "consonant", begin=self.begin, end=self.end
-        )
-        reshaped = []
-
-        for i in range(orig.shape[0]):
-            for j in range(orig.shape[1]):
-                reshaped.append(
-                    {
-                        "time": j * time_step + self.begin,
-                        "frequency": i * freq_step,
-                        "power": float(orig[i, j]),
-                    }
-                )
-        data = {
-            "values": reshaped,
-            "time_step": time_step,
-            "freq_step": freq_step,
-            "num_time_bins": orig.shape[1],
-            "num_freq_bins": orig.shape[0],
-        }
-        return data
+        ).to_dict()
 
     @property
     def spectrogram_fast(self):
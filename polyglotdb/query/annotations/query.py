@@ -1,4 +1,12 @@
 import copy
+import itertools
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from polyglotdb.exceptions import GraphQueryError
 from polyglotdb.query.annotations.attributes import HierarchicalAnnotation
@@ -8,7 +16,7 @@ from polyglotdb.query.annotations.elements import (
     NotRightAlignedClauseElement,
     RightAlignedClauseElement,
 )
-from polyglotdb.query.annotations.results import QueryResults
+from polyglotdb.query.annotations.results import QueryResults, SplitCursor
 from polyglotdb.query.base import BaseQuery
 
 
@@ -175,27 +183,49 @@ class GraphQuery(BaseQuery):
         self._preload_acoustics.extend(args)
         return self
 
-    def all(self):
+    def all(self, stream=False):
         """
         Returns all results for the query
 
+        Parameters
+        ----------
+        stream : bool
+            Flag for fetching results from the graph database in batches as they are iterated over, rather than
+            all at once, see :class:`~polyglotdb.query.base.results.BaseQueryResults`
+
         Returns
         -------
         res_list : list
             a list of results from the query
         """
+        self._add_acoustic_requirements()
+        return QueryResults(self, stream=stream)
+
+    def cursor(self, batch_size=None):
+        self._add_acoustic_requirements()
+        return super(GraphQuery, self).cursor(batch_size)
+
+    def _add_acoustic_requirements(self):
+        """
+        Preload the annotations and add the hidden columns that are needed to look up acoustics
+        """
         if self._preload_acoustics:
             discourse_found = False
             speaker_found = False
+            utterance_found = self.to_find.node_type == "utterance"
             for p in self._preload:
                 if p.node_type == "Discourse":
                     discourse_found = True
                 elif p.node_type == "Speaker":
                     speaker_found = True
+                elif p.node_type == "utterance":
+                    utterance_found = True
             if not discourse_found:
                 self.preload(getattr(self.to_find, "discourse"))
             if not speaker_found:
                 self.preload(getattr(self.to_find, "speaker"))
+            if not utterance_found and "utterance" in self.corpus.annotation_types:
+                self.preload(getattr(self.to_find, "utterance"))
         if self._acoustic_columns:
             for a in self._acoustic_columns:
                 discourse_found = False
@@ -236,7 +266,6 @@ class GraphQuery(BaseQuery):
                         self._hidden_columns.append(
                             a.node.utterance.id.column_name(a.utterance_alias)
                         )
-        return QueryResults(self)
 
     def create_subset(self, label):
         labels_to_add = []
@@ -291,12 +320,24 @@ class GraphQuery(BaseQuery):
 
 
 class SplitQuery(GraphQuery):
+    """
+    Query that is run as separate queries for each speaker or discourse, depending on the ``query_behavior``
+    of the corpus's config
+
+    If the ``query_jobs`` of the config is more than one, that many of the split queries are run at once on a
+    pool of threads, each with its own session with the graph database.
+    """
+
     def __init__(self, corpus, to_find, stop_check=None):
         super(SplitQuery, self).__init__(corpus, to_find, stop_check)
         try:
             self.splitter = self.corpus.config.query_behavior
         except (AttributeError, GraphQueryError):
             self.splitter = "speaker"
+        try:
+            self.num_jobs = self.corpus.config.query_jobs
+        except (AttributeError, GraphQueryError):
+            self.num_jobs = 1
 
     def base_query(self, filters=None):
         """sets up base query
@@ -390,63 +431,223 @@ class SplitQuery(GraphQuery):
 
     def set_pause(self):
         """sets a pause in queries"""
-        for q in self.split_queries():
+        for _ in self.map_split_queries(lambda q: q.set_pause()):
+            pass
+
+    def map_split_queries(self, function, ordered=True):
+        """
+        Apply a function to each split query, running up to ``num_jobs`` of them at once
+
+        The first split query is always run on its own, so that any changes it makes to the hierarchy (i.e.,
+        adding token properties) are made before the other split queries run.
+
+        Parameters
+        ----------
+        function : callable
+            Function that takes a split query
+        ordered : bool
+            Flag for generating the outputs in the order of the split queries, rather than as they finish
+
+        Yields
+        ------
+        object
+            Output of the function for each split query
+        """
+        queries = self.split_queries()
+        for q in queries:
             if self.stop_check():
                 return
-            q.set_pause()
+            yield function(q)
+            if self.num_jobs > 1:
+                break
+        else:
+            return
 
-    def all(self):
-        """returns all results from a query"""
-        results = None
-        for q in self.split_queries():
+        def pop_finished():
+            if ordered:
+                future = pending.pop(0)
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+            return future.result()
+
+        pending = []
+        with ThreadPoolExecutor(max_workers=self.num_jobs) as executor:
+            try:
+                for q in queries:
+                    if self.stop_check():
+                        break
+                    pending.append(executor.submit(function, q))
+                    # Only run a little ahead of the outputs being used, to bound the memory they take
+                    if len(pending) >= 2 * self.num_jobs:
+                        yield pop_finished()
+                while pending:
+                    yield pop_finished()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def split_records(self, batch_size=None):
+        """
+        Generate the records of each split query in turn
+
+        Records are streamed from each split query in turn, unless ``num_jobs`` is more than one, in which case
+        up to ``num_jobs`` split queries are streamed concurrently.  Each of them only fetches a couple of batches
+        ahead of the records being used, so whole split queries are never loaded at once.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            Number of records to fetch at a time, defaults to the corpus's ``query_batch_size``
+
+        Yields
+        ------
+        dict
+            Record of a split query
+        """
+        queries = self.split_queries()
+        for q in queries:
             if self.stop_check():
                 return
-            if results is None:
-                r = q.all()
-                results = r
-            else:
-                results.add_results(q)
-        return results
+            cursor = q.cursor(batch_size)
+            try:
+                for r in cursor:
+                    yield r
+            finally:
+                cursor.close()
+            # The first split query is always run on its own, as in map_split_queries
+            if self.num_jobs > 1:
+                break
+        else:
+            return
+        if batch_size is None:
+            batch_size = self.corpus.config.query_batch_size
+        stopped = threading.Event()
+        finished = object()
+
+        def put(batches, item):
+            while not stopped.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def fetch(q, batches):
+            cursor = q.cursor(batch_size)
+            try:
+                batch = []
+                for r in cursor:
+                    batch.append(r)
+                    if len(batch) == batch_size:
+                        if not put(batches, batch):
+                            return
+                        batch = []
+                if batch:
+                    put(batches, batch)
+            finally:
+                cursor.close()
+                put(batches, finished)
+
+        def records(future, batches):
+            while True:
+                batch = batches.get()
+                if batch is finished:
+                    break
+                for r in batch:
+                    yield r
+            future.result()
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.num_jobs) as executor:
+            try:
+                for q in queries:
+                    if self.stop_check():
+                        break
+                    batches = queue.Queue(maxsize=2)
+                    pending.append((executor.submit(fetch, q, batches), batches))
+                    # Only as many split queries as there are workers are fetched at once, so the earliest one
+                    # is always running
+                    if len(pending) >= self.num_jobs:
+                        for r in records(*pending.popleft()):
+                            yield r
+                while pending:
+                    for r in records(*pending.popleft()):
+                        yield r
+            finally:
+                stopped.set()
+
+    def cursor(self, batch_size=None):
+        self._add_acoustic_requirements()
+        return SplitCursor(self, batch_size)
+
+    def all(self, stream=False):
+        """returns all results from a query"""
+        if self.stop_check():
+            return
+        return super(SplitQuery, self).all(stream=stream)
 
     def count(self):
-        count = 0
-        for q in self.split_queries():
-            count += q.count()
-        return count
-
-    def to_csv(self, path):
-        for i, q in enumerate(self.split_queries()):
-            if i == 0:
-                mode = "w"
-            else:
-                mode = "a"
-            r = q.all()
+        return sum(self.map_split_queries(lambda q: q.count()))
+
+    def to_csv(self, path, ordered=True):
+        """
+        Export the results of each split query to a CSV file
+
+        When ``num_jobs`` is more than one, split queries are exported concurrently to separate shards, which are
+        merged into the CSV file.
 
-            r.to_csv(path, mode=mode)
+        Parameters
+        ----------
+        path : str
+            Path to the CSV file
+        ordered : bool
+            Flag for merging the shards in the order of the split queries, rather than as they finish
+        """
+        if self.num_jobs <= 1:
+            for i, q in enumerate(self.split_queries()):
+                if i == 0:
+                    mode = "w"
+                else:
+                    mode = "a"
+                r = q.all(stream=True)
+
+                r.to_csv(path, mode=mode)
+            return
+        with tempfile.TemporaryDirectory() as directory:
+            shard_indices = itertools.count()
+
+            def export_shard(q):
+                shard_path = os.path.join(directory, "{}.csv".format(next(shard_indices)))
+                q.all(stream=True).to_csv(shard_path)
+                return shard_path
+
+            with open(path, "w", encoding="utf8", newline="") as f:
+                shards = self.map_split_queries(export_shard, ordered=ordered)
+                for i, shard_path in enumerate(shards):
+                    with open(shard_path, "r", encoding="utf8", newline="") as shard:
+                        if i > 0:
+                            shard.readline()
+                        shutil.copyfileobj(shard, f)
+                    os.remove(shard_path)
 
     def delete(self):
         """deletes the query"""
-        for q in self.split_queries():
-            if self.stop_check():
-                return
-            q.delete()
+        for _ in self.map_split_queries(lambda q: q.delete()):
+            pass
 
     def cache(self, *args):
-        for q in self.split_queries():
-            if self.stop_check():
-                return
-            q.cache(*args)
+        for _ in self.map_split_queries(lambda q: q.cache(*args)):
+            pass
 
     def set_label(self, *args):
         """sets the query type"""
-        for q in self.split_queries():
-            if self.stop_check():
-                return
-            q.set_label(*args)
+        for _ in self.map_split_queries(lambda q: q.set_label(*args)):
+            pass
 
     def set_properties(self, **kwargs):
         """sets the query token"""
-        for q in self.split_queries():
-            if self.stop_check():
-                return
-            q.set_properties(**kwargs)
+        for _ in self.map_split_queries(lambda q: q.set_properties(**kwargs)):
+            pass
@@ -176,18 +176,61 @@ def hydrate_model(r, to_find, to_find_type, to_preload, to_preload_acoustics, co
             utterance_id = a.id
         else:
             utterance_id = a.utterance.id
-        if utterance_id not in pre.attribute.cache:
+        # The fetched track is passed on rather than looked up in the cache again, as another thread could
+        # evict it in between
+        cache = corpus.acoustic_cache().view(pre.attribute.label, pre.attribute.resolution)
+        data = cache.get(utterance_id)
+        if data is None:
             data = corpus.get_utterance_acoustics(
-                pre.attribute.label, utterance_id, a.discourse.name, a.speaker.name
+                pre.attribute.label,
+                utterance_id,
+                a.discourse.name,
+                a.speaker.name,
+                resolution=pre.attribute.resolution,
             )
-            pre.attribute.cache[utterance_id] = data
-        a._load_track(pre)
+            cache[utterance_id] = data
+        a._load_track(pre, data)
     return a
 
 
+class SplitCursor(object):
+    """
+    Records of the split queries of a :class:`~polyglotdb.query.annotations.query.SplitQuery`, which are
+    fetched when the first record is requested
+
+    Parameters
+    ----------
+    query : :class:`~polyglotdb.query.annotations.query.SplitQuery`
+        Query to get the records of
+    batch_size : int, optional
+        Number of records to fetch at a time, defaults to the corpus's ``query_batch_size``
+    """
+
+    def __init__(self, query, batch_size=None):
+        self.query = query
+        self.batch_size = batch_size
+        self._records = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._records is None:
+            self._records = self.query.split_records(self.batch_size)
+        return next(self._records)
+
+    def close(self):
+        """
+        Stop fetching records, discarding any that have not been fetched yet
+        """
+        if self._records is not None:
+            self._records.close()
+            self._records = None
+
+
 class QueryResults(BaseQueryResults):
-    def __init__(self, query):
-        super(QueryResults, self).__init__(query)
+    def __init__(self, query, stream=False):
+        super(QueryResults, self).__init__(query, stream=stream)
         self.speaker_discourse_channels = {}
         self.num_tracks = 0
         self.track_columns = []
@@ -209,21 +252,124 @@ class QueryResults(BaseQueryResults):
             results = self.corpus.execute_cypher(statement)
             for r in results:
                 self.speaker_discourse_channels[r["speaker"], r["discourse"]] = r["channel"]
-            self.acoustic_cache = {x: {} for x in sorted(query.corpus.hierarchy.acoustics)}
-            for a in self._acoustic_columns:
-                a.attribute.cache = self.acoustic_cache[a.attribute.label]
         if self.models:
             self._preload_acoustics = query._preload_acoustics
-            if self._preload_acoustics:
-                self.acoustic_cache = {x: {} for x in sorted(query.corpus.hierarchy.acoustics)}
-                for a in self._preload_acoustics:
-                    a.attribute.cache = self.acoustic_cache[a.attribute.label]
+        self._record_positions = {}
+
+    def _acoustic_utterances(self, records):
+        """
+        Collect the utterances whose acoustics are needed for records
+
+        Parameters
+        ----------
+        records : list
+            Records returned by Neo4j
+
+        Returns
+        -------
+        dict
+            Set of tuples of utterance ID (None if the corpus has no utterances), discourse name and speaker
+            name for each acoustic track name and resolution
+        """
+        utterances = {}
+        has_utterances = "utterance" in self.corpus.annotation_types
+        if self.models:
+            if not self._preload_acoustics:
+                return utterances
+            discourse_alias, speaker_alias, utterance_alias = None, None, None
+            for pre in self._preload:
+                if isinstance(pre, DiscourseAnnotation):
+                    discourse_alias = pre.alias
+                elif isinstance(pre, SpeakerAnnotation):
+                    speaker_alias = pre.alias
+                elif isinstance(pre, HierarchicalAnnotation) and pre.node_type == "utterance":
+                    utterance_alias = pre.alias
+            if self._to_find.replace("node_", "") == "utterance":
+                utterance_alias = self._to_find
+            if discourse_alias is None or speaker_alias is None or utterance_alias is None:
+                return utterances
+            for pre in self._preload_acoustics:
+                key = pre.attribute.label, pre.attribute.resolution
+                to_fetch = utterances.setdefault(key, set())
+                for r in records:
+                    to_fetch.add(
+                        (
+                            r[utterance_alias]["id"],
+                            r[discourse_alias]["name"],
+                            r[speaker_alias]["name"],
+                        )
+                    )
+        else:
+            for a in self._acoustic_columns:
+                key = a.attribute.label, a.attribute.resolution
+                to_fetch = utterances.setdefault(key, set())
+                for r in records:
+                    if r[a.begin_alias] is None:
+                        continue
+                    utterance_id = r[a.utterance_alias] if has_utterances else None
+                    to_fetch.add((utterance_id, r[a.discourse_alias], r[a.speaker_alias]))
+        return utterances
+
+    def _prefetch_acoustics(self, records):
+        """
+        Fetch the acoustics for records with batched queries, rather than one query per utterance as records
+        are sanitized
+
+        Parameters
+        ----------
+        records : list
+            Records returned by Neo4j
+        """
+        acoustic_cache = self.corpus.acoustic_cache()
+        for (label, resolution), utterances in self._acoustic_utterances(records).items():
+            cache = acoustic_cache.view(label, resolution)
+            to_fetch = []
+            for utterance_id, discourse, speaker in utterances:
+                key = utterance_id if utterance_id is not None else (discourse, speaker)
+                if key not in cache:
+                    to_fetch.append((utterance_id, discourse, speaker))
+            if to_fetch:
+                cache.update(
+                    self.corpus.get_utterances_acoustics(label, to_fetch, resolution=resolution)
+                )
+
+    def _following_records(self, r):
+        """
+        Get a record and the cached records following it, or just the record if it was streamed rather
+        than cached
+        """
+        for i in range(len(self._record_positions), len(self.cache)):
+            self._record_positions[id(self.cache[i])] = i
+        start = self._record_positions.get(id(r))
+        if start is None or self.cache[start] is not r:
+            return [r]
+        return self.cache[start : start + self.batch_size]
+
+    def _load_acoustics(self, r):
+        """
+        Ensure the acoustics needed for a record are cached, prefetching them along with those of the
+        following records on a cache miss
+        """
+        acoustic_cache = self.corpus.acoustic_cache()
+        for (label, resolution), utterances in self._acoustic_utterances([r]).items():
+            cache = acoustic_cache.view(label, resolution)
+            for utterance_id, discourse, speaker in utterances:
+                key = utterance_id if utterance_id is not None else (discourse, speaker)
+                if cache.get(key) is None:
+                    self._prefetch_acoustics(self._following_records(r))
+                    return
+
+    def _sanitize_records(self, records):
+        self._prefetch_acoustics(records)
+        return super(QueryResults, self)._sanitize_records(records)
 
     @property
     def columns(self):
         return self._columns + self.track_columns
 
     def _sanitize_record(self, r):
+        if isinstance(r, dict):
+            self._load_acoustics(r)
         if self.models:
             r = hydrate_model(
                 r,
@@ -242,21 +388,40 @@ class QueryResults(BaseQueryResults):
                 else:
                     discourse = r[a.discourse_alias]
                     speaker = r[a.speaker_alias]
+                    cache = self.corpus.acoustic_cache().view(
+                        a.attribute.label, a.attribute.resolution
+                    )
                     if "utterance" in self.corpus.annotation_types:
                         utterance_id = r[a.utterance_alias]
-                        if utterance_id not in a.attribute.cache:
+                        data = cache.get(utterance_id)
+                        if data is None:
                             data = self.corpus.get_utterance_acoustics(
-                                a.attribute.label, utterance_id, discourse, speaker
+                                a.attribute.label,
+                                utterance_id,
+                                discourse,
+                                speaker,
+                                resolution=a.attribute.resolution,
                             )
-                            a.attribute.cache[utterance_id] = data
+                            cache[utterance_id] = data
                     else:
                         utterance_id = (discourse, speaker)
-                        if utterance_id not in a.attribute.cache:
+                        data = cache.get(utterance_id)
+                        if data is None:
                             data = self.corpus.get_utterance_acoustics(
-                                a.attribute.label, None, discourse, speaker
+                                a.attribute.label,
+                                None,
+                                discourse,
+                                speaker,
+                                resolution=a.attribute.resolution,
                             )
-                            a.attribute.cache[utterance_id] = data
-                    t = a.hydrate(self.corpus, utterance_id, r[a.begin_alias], r[a.end_alias])
+                            cache[utterance_id] = data
+                    t = a.hydrate(
+                        self.corpus,
+                        utterance_id,
+                        r[a.begin_alias],
+                        r[a.end_alias],
+                        utterance_data=data,
+                    )
                     for k in a.output_columns:
                         if k == "time":
                             continue
@@ -309,9 +474,5 @@ class AnnotationRecord(BaseRecord):
         self.acoustic_values.append(value)
 
     def add_track(self, track):
-        for point in track:
-            if point.time not in self.track:
-                self.track.add(point)
-            else:
-                self.track[point.time].update(point)
+        self.track.merge(track)
         self.track_columns = self.track.keys()
@@ -1,6 +1,6 @@
 from polyglotdb.query.base.func import Count
 from polyglotdb.query.base.helper import key_for_cypher, value_for_cypher
-from polyglotdb.query.base.results import BaseQueryResults
+from polyglotdb.query.base.results import BaseQueryResults, CypherCursor
 
 
 class BaseQuery(object):
@@ -156,7 +156,7 @@ class BaseQuery(object):
         Same as ``all``, but the results of the query are output to the
         specified path as a CSV file.
         """
-        results = self.all()
+        results = self.all(stream=True)
         if self.stop_check is not None and self.stop_check():
             return
         results.to_csv(path)
@@ -301,8 +301,38 @@ class BaseQuery(object):
         self.corpus.execute_cypher(self.cypher(), **self.cypher_params())
         self._set_properties = {}
 
-    def all(self):
-        return BaseQueryResults(self)
+    def all(self, stream=False):
+        """
+        Returns all results for the query
+
+        Parameters
+        ----------
+        stream : bool
+            Flag for fetching results from the graph database in batches as they are iterated over, rather than
+            all at once, see :class:`~polyglotdb.query.base.results.BaseQueryResults`
+
+        Returns
+        -------
+        :class:`~polyglotdb.query.base.results.BaseQueryResults`
+            Results of the query
+        """
+        return BaseQueryResults(self, stream=stream)
+
+    def cursor(self, batch_size=None):
+        """
+        Get a cursor over the records of the query, which fetches them from the graph database in batches
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            Number of records to fetch at a time, defaults to the corpus's ``query_batch_size``
+
+        Returns
+        -------
+        :class:`~polyglotdb.query.base.results.CypherCursor`
+            Cursor over the records
+        """
+        return CypherCursor(self.corpus, self.cypher(), self.cypher_params(), batch_size)
 
     def get(self):
         r = BaseQueryResults(self)
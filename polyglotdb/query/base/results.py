@@ -1,3 +1,6 @@
+from polyglotdb.exceptions import GraphQueryError
+
+
 class BaseRecord(object):
     def __init__(self, result):
         self.columns = list(result.keys())
@@ -8,32 +11,107 @@ class BaseRecord(object):
             return self.values[self.columns.index(key)]
         raise KeyError("{} not in columns {}".format(key, self.columns))
 
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
     def __str__(self):
         return ", ".join("{}: {}".format(k, v) for k, v in zip(self.columns, self.values))
 
 
+class CypherCursor(object):
+    """
+    Records returned by a Cypher statement, which is executed when the first record is requested and whose
+    records are then fetched from the graph database in batches as they are needed
+
+    Parameters
+    ----------
+    corpus : :class:`~polyglotdb.corpus.CorpusContext`
+        Corpus to query
+    statement : str
+        Cypher statement
+    parameters : dict
+        Parameters of the Cypher statement
+    batch_size : int, optional
+        Number of records to fetch at a time, defaults to the corpus's ``query_batch_size``
+    """
+
+    def __init__(self, corpus, statement, parameters, batch_size=None):
+        self.corpus = corpus
+        self.statement = statement
+        self.parameters = parameters
+        self.batch_size = batch_size
+        self._records = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._records is None:
+            self._records = self.corpus.stream_cypher(
+                self.statement, batch_size=self.batch_size, **self.parameters
+            )
+        return next(self._records)
+
+    def close(self):
+        """
+        Close the connection to the graph database, discarding any records that have not been fetched yet
+        """
+        if self._records is not None:
+            self._records.close()
+            self._records = None
+
+
 class BaseQueryResults(object):
-    def __init__(self, query):
+    """
+    Results of a query
+
+    By default every record is fetched when the results are created, so the results can be indexed and
+    iterated over any number of times.  Results created with ``stream=True`` instead fetch records from the
+    graph database in batches as they are iterated over, without keeping them, so that exporting large queries
+    does not need memory for every record.  Streamed results open their connection to the graph database
+    when the first record is requested, and run the query again each time they are iterated over.
+
+    Parameters
+    ----------
+    query : :class:`~polyglotdb.query.base.query.BaseQuery`
+        Query to get the results of
+    batch_size : int, optional
+        Number of records to fetch from the graph database at a time, defaults to the corpus's
+        ``query_batch_size``
+    stream : bool
+        Flag for streaming records as they are iterated over rather than fetching them all up front
+    """
+
+    def __init__(self, query, batch_size=None, stream=False):
         self.corpus = query.corpus
         self.call_back = query.call_back
         self.stop_check = query.stop_check
+        if batch_size is None:
+            batch_size = self.corpus.config.query_batch_size
+        self.batch_size = batch_size
+        self.stream = stream
         self.cursors = []
         self.evaluated = []
         self.current_ind = 0
+        self._queries = [query]
         if query._columns:
-            self.cache = self.corpus.execute_cypher(query.cypher(), **query.cypher_params())
             self.models = False
             self._preload = None
             self._to_find = None
             self._to_find_type = None
             self._columns = [x.output_alias.replace("`", "") for x in query._columns]
         else:
-            self.cache = self.corpus.execute_cypher(query.cypher(), **query.cypher_params())
             self.models = True
             self._preload = query._preload
             self._to_find = query.to_find.alias
             self._to_find_type = query.to_find.type_alias
             self._columns = None
+        self.cache = []
+        if not stream:
+            self.cache.extend(self._records(query))
 
     @property
     def columns(self):
@@ -45,6 +123,8 @@ class BaseQueryResults(object):
     def __getitem__(self, key):
         if key < 0:
             raise (IndexError("Results do not support negative indexing."))
+        if self.stream:
+            raise GraphQueryError("Streamed results can only be iterated over.")
         cur_cache_len = len(self.cache)
         if key < cur_cache_len:
             return self._sanitize_record(self.cache[key])
@@ -73,10 +153,30 @@ class BaseQueryResults(object):
             if up_to is not None and len(self.cache) > up_to:
                 break
 
+    def _records(self, query):
+        """
+        Generate the records of a query as they are fetched from the graph database in batches, closing the
+        connection once they have all been generated or the generator is closed
+        """
+        cursor = query.cursor(self.batch_size)
+        try:
+            for r in cursor:
+                yield r
+        finally:
+            cursor.close()
+
     def add_results(self, query):
-        ## Add some validation
-        cursor = query.all().cache
-        self.cache.extend(cursor)
+        """
+        Add the results of another query after the current ones
+
+        Parameters
+        ----------
+        query : :class:`~polyglotdb.query.base.query.BaseQuery`
+            Query to add the results of
+        """
+        self._queries.append(query)
+        if not self.stream:
+            self.cache.extend(self._records(query))
 
     def next(self, number):
         next_ind = number + self.current_ind
@@ -97,8 +197,26 @@ class BaseQueryResults(object):
         return to_return
 
     def __iter__(self):
-        for r in self.cache:
-            yield self._sanitize_record(r)
+        if self.stream:
+            return self._iter_stream()
+        return self._iter_cache()
+
+    def _iter_cache(self):
+        for start in range(0, len(self.cache), self.batch_size):
+            for r in self._sanitize_records(self.cache[start : start + self.batch_size]):
+                yield r
+
+    def _iter_stream(self):
+        for query in self._queries:
+            batch = []
+            for r in self._records(query):
+                batch.append(r)
+                if len(batch) == self.batch_size:
+                    for x in self._sanitize_records(batch):
+                        yield x
+                    batch = []
+            for x in self._sanitize_records(batch):
+                yield x
 
     def rows_for_csv(self):
         header = self.columns
@@ -116,9 +234,15 @@ class BaseQueryResults(object):
             yield baseline
 
     def __len__(self):
+        if self.stream:
+            raise GraphQueryError("Streamed results can only be iterated over.")
         self._cache_cursor()
         return len(self.cache)
 
+    def _sanitize_records(self, records):
+        for r in records:
+            yield self._sanitize_record(r)
+
     def _sanitize_record(self, r):
         if self.models:
             raise NotImplementedError
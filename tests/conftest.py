@@ -1,8 +1,13 @@
+import json
 import os
 import shutil
 import sys
+import threading
 from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
 
+import msgpack
 import pytest
 
 from polyglotdb.config import CorpusConfig
@@ -487,6 +492,92 @@ def graph_db():
     return config
 
 
+class InfluxDBStubHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self, code, body=None):
+        self.send_response(code)
+        if body is not None:
+            data = json.dumps(body).encode("utf8")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        else:
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    def _respond_chunks(self, chunks):
+        # Like InfluxDB, chunks are sent one after another, as msgpack if the client accepts it
+        if "msgpack" in self.headers.get("Accept", ""):
+            content_type = "application/x-msgpack"
+            data = b"".join(msgpack.packb(x) for x in chunks)
+        else:
+            content_type = "application/json"
+            data = "".join(json.dumps(x) + "\n" for x in chunks).encode("utf8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.do_POST()
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length).decode("utf8") if length else ""
+        if url.path == "/write":
+            if self.server.fail_writes:
+                self._respond(500, {"error": "write failed"})
+                return
+            self.server.write_requests.append((params, body.splitlines()))
+            self._respond(204)
+        elif url.path == "/query":
+            query = params.get("q", [""])[0]
+            if query.lower().startswith("select"):
+                self.server.query_requests.append((params, dict(self.headers)))
+                self._respond_chunks(
+                    [
+                        {"results": [{"statement_id": 0, "series": x}]}
+                        for x in self.server.query_chunks
+                    ]
+                )
+                return
+            series = [
+                {"name": "databases", "columns": ["name"], "values": [[self.server.database]]}
+            ]
+            self._respond(200, {"results": [{"statement_id": 0, "series": series}]})
+        else:
+            self._respond(404, {"error": "not found"})
+
+
+@pytest.fixture(scope="function")
+def influxdb_stub():
+    """
+    Local stand-in for the InfluxDB HTTP API that records the points written to it
+    """
+    server = ThreadingHTTPServer(("localhost", 0), InfluxDBStubHandler)
+    server.database = "stub"
+    server.fail_writes = False
+    server.write_requests = []
+    server.query_requests = []
+    server.query_chunks = []
+    server.connection_kwargs = {
+        "host": "localhost",
+        "port": server.server_address[1],
+        "database": server.database,
+    }
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture(scope="session")
 def untimed_config(graph_db, corpus_data_untimed):
     config = CorpusConfig("untimed", **graph_db)
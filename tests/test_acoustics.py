@@ -1,9 +1,46 @@
 import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from types import SimpleNamespace
 
+import librosa
+import numpy as np
 import pytest
+import soundfile
+from conch import analyze_segments
+from conch.analysis.functions import BaseAnalysisFunction
+from conch.analysis.segments import FileSegment, SegmentMapping
+from influxdb import InfluxDBClient
+from influxdb.exceptions import InfluxDBServerError
+from influxdb.resultset import ResultSet
 
 from polyglotdb import CorpusContext
+from polyglotdb.acoustics.cache import AcousticCache, SpectrogramCache
+from polyglotdb.acoustics.checkpoints import AnalysisCheckpoint
+from polyglotdb.acoustics.classes import Spectrogram, TimePoint, Track
+from polyglotdb.acoustics.io import file_hash, prepare_discourse_audio
+from polyglotdb.acoustics.pitch.helper import generate_pitch_function
+from polyglotdb.acoustics.scheduling import (
+    FileSegmentPool,
+    analyze_file_segments,
+    file_segment_batches,
+)
+from polyglotdb.acoustics.segments import generate_segments
+from polyglotdb.acoustics.statistics import GroupedStatistics
+from polyglotdb.acoustics.utils import (
+    generate_spectrogram,
+    read_waveform,
+    sound_file_cache,
+    spectrogram_window,
+    waveform_envelope,
+)
+from polyglotdb.acoustics.writer import AcousticWriter
+from polyglotdb.config import CorpusConfig
+from polyglotdb.corpus.audio import AudioContext, align_time_points, result_columns
+from polyglotdb.query.annotations.attributes.acoustic import AcousticAttribute
 
 # def test_query(acoustic_utt_config, praat_path):
 #     with CorpusContext(acoustic_utt_config) as g:
@@ -20,3 +57,504 @@ def test_wav_info(acoustic_utt_config):
         sf = g.discourse_sound_file("acoustic_corpus")
         assert sf["sampling_rate"] == 16000
         assert sf["num_channels"] == 1
+
+
+@pytest.mark.parametrize("annotation_type, subset", [("utterance", None), ("phone", "syllabic")])
+def test_generate_segments(acoustic_utt_config, annotation_type, subset):
+    def key(segment):
+        properties = {k: v for k, v in segment.properties.items() if k != "subannotations"}
+        return (
+            segment.file_path,
+            segment.begin,
+            segment.end,
+            segment.channel,
+            sorted(properties.items()),
+        )
+
+    with CorpusContext(acoustic_utt_config) as g:
+        segments = generate_segments(g, annotation_type, subset, padding=0.1)
+        # Segments built from annotation models, with a query per speaker and discourse
+        expected = generate_segments(
+            g, annotation_type, subset, padding=0.1, fetch_subannotations=True
+        )
+    assert len(segments) > 0
+    assert sorted(map(key, segments)) == sorted(map(key, expected))
+
+
+def test_align_time_points():
+    begins = [0.0, 1.0, 2.0]
+    times = [Decimal("-0.5"), 0.0, Decimal("1.5"), 3.0]
+    assert align_time_points(times, begins).tolist() == [-1, 0, 1, 2]
+    assert align_time_points(times, []).tolist() == [-1, -1, -1, -1]
+
+
+def test_track_points():
+    context = SimpleNamespace(
+        hierarchy=SimpleNamespace(acoustic_properties={"pitch": [("F0", float)]}),
+        annotation_types=["phone", "word", "utterance"],
+    )
+    intervals = {
+        "label": ["a", "b", "c", "d"],
+        "begin": np.array([0.0, 0.5, 1.0, 1.5]),
+        "end": np.array([0.4, 1.0, 1.4, 1.8]),
+        "word_label": ["w1", "w1", "w2", "w2"],
+        "speaker": ["s", "s", "s", "s"],
+        "utterance_id": ["u1", "u1", "u2", "u2"],
+    }
+    track = {0.25: {"F0": 100}, 0.45: {"F0": 105}, 1.2: {"F0": None}, 1.7: {"F0": 120.3}}
+    track[1.9] = {"F0": 125}
+    points = AudioContext._track_points(context, "pitch", track, intervals, {"discourse": "d"})
+    # Points in the pause after the first phone and after the last phone are left out
+    assert [x["fields"]["phone"] for x in points] == ["a", "d"]
+    assert [x["fields"]["utterance_id"] for x in points] == ["u1", "u2"]
+    assert points[0]["time"] == 250000000
+    assert points[0]["tags"] == {"speaker": "s", "discourse": "d"}
+
+    # Points of an utterance only fall in that utterance's phones, with missing values filled in
+    track = {0.25: {"F0": 100}, 1.2: {"F0": None}, 1.7: {"F0": 120.3}}
+    points = AudioContext._track_points(
+        context,
+        "pitch",
+        track,
+        intervals,
+        {"speaker": "t"},
+        utterance_id="u2",
+        phone_indices=np.array([2, 3]),
+        fill_missing=True,
+        time_precision="ms",
+    )
+    assert [x["fields"]["phone"] for x in points] == ["c", "d"]
+    assert [x["fields"]["F0"] for x in points] == [-1.0, 120.3]
+    assert [x["time"] for x in points] == [1200, 1700]
+    assert points[0]["tags"] == {"speaker": "t"}
+
+
+def test_resampled_utterances_acoustics():
+    def series(name, values):
+        return ResultSet(
+            {"series": [{"name": "formants", "columns": ["time", name], "values": values}]}
+        )
+
+    queries = []
+
+    def execute_influxdb(query, epoch=None):
+        queries.append(query)
+        # All the F2 values in the second window were missing, so it only has a window for F1
+        return [series("F1", [[1000, 500.0], [1020, 510.0]]), series("F2", [[1000, 1500.0]])]
+
+    context = SimpleNamespace(
+        execute_influxdb=execute_influxdb,
+        _utterance_spans=lambda ids: {"u1": (1.0, 1.04)},
+    )
+    context._utterance_acoustics_query = lambda *args: AudioContext._utterance_acoustics_query(
+        context, *args
+    )
+    tracks = AudioContext._resampled_utterances_acoustics(
+        context, "formants", ["F1", "F2"], ["u1"], "d", "s", 0.02
+    )
+    assert len(queries) == 1
+    statements = queries[0].split(";")[:-1]
+    assert len(statements) == 2
+    for name, statement in zip(["F1", "F2"], statements):
+        assert 'mean("{0}")'.format(name) in statement
+        assert '"{}" != -1'.format(name) in statement
+        assert '"time" >= 1000000000' in statement
+        assert '"time" <= 1040000000' in statement
+    track = tracks["u1"]
+    assert [float(x.time) for x in track] == [1.01, 1.03]
+    assert [x["F1"] for x in track] == [500.0, 510.0]
+    assert [x["F2"] for x in track] == [1500.0, None]
+
+
+def test_grouped_statistics():
+    stats = GroupedStatistics(["F0"], keep_values=True)
+    stats.update(["a", "b", "a", None], [[100], [200], [110], [500]])
+    stats.update(["a", "b"], [[120], [float("nan")]])
+    assert stats.statistic("a", "count") == {"F0": 3}
+    assert stats.statistic("a", "mean") == {"F0": 110}
+    assert round(stats.statistic("a", "stddev")["F0"], 4) == 10
+    assert stats.statistic("a", "median") == {"F0": 110}
+    assert stats.statistic("b", "stddev") == {"F0": None}
+    assert None not in stats
+    means, sds = stats.lookup(["b", "a", "c"])
+    assert means[:2, 0].tolist() == [200, 110]
+
+
+def test_acoustic_writer(influxdb_stub):
+    points = [
+        {
+            "measurement": "pitch",
+            "tags": {"speaker": "s"},
+            "time": 1000 + i,
+            "fields": {"F0": 100.0 + i},
+        }
+        for i in range(5)
+    ]
+    writer = AcousticWriter(influxdb_stub.connection_kwargs, batch_size=2, flush_interval=10)
+    writer.write(points, time_precision="ms")
+    writer.flush()
+    assert [len(x[1]) for x in influxdb_stub.write_requests] == [2, 2, 1]
+    assert influxdb_stub.write_requests[0][0]["precision"] == ["ms"]
+
+    writer.write(points[:1])
+    writer.close()
+    assert not writer.running
+    assert len(influxdb_stub.write_requests) == 4
+
+    # Points queued in a writer that is never closed are written when the interpreter exits
+    script = (
+        "from polyglotdb.acoustics.writer import AcousticWriter\n"
+        "writer = AcousticWriter({!r}, flush_interval=10)\n"
+        "writer.write({!r})\n"
+    ).format(influxdb_stub.connection_kwargs, points[:1])
+    subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    assert len(influxdb_stub.write_requests) == 5
+
+
+def test_acoustic_writer_errors(influxdb_stub):
+    influxdb_stub.fail_writes = True
+    writer = AcousticWriter(influxdb_stub.connection_kwargs, flush_interval=0.01)
+    writer.write([{"measurement": "pitch", "time": 1, "fields": {"F0": 100.0}}])
+    with pytest.raises(InfluxDBServerError):
+        writer.flush()
+    writer.close()
+
+
+def test_iterate_acoustic_points(influxdb_stub):
+    columns = ["time", "F0", "phone"]
+    influxdb_stub.query_chunks = [
+        [
+            {
+                "name": "pitch",
+                "columns": columns,
+                "values": [[1000, 100.0, "a"], [1010, 110.0, "b"]],
+            }
+        ],
+        [{"name": "pitch", "columns": columns, "values": [[1020, 120.3, "c"]]}],
+    ]
+    # The default client asks for msgpack, which can't be read in chunks
+    client = InfluxDBClient(**influxdb_stub.connection_kwargs)
+    with pytest.raises(ValueError):
+        for result in client.query('select * from "pitch"', chunked=True, chunk_size=2):
+            list(result.get_points())
+    client.close()
+
+    context = SimpleNamespace(
+        config=SimpleNamespace(acoustic_connection_kwargs=influxdb_stub.connection_kwargs),
+        acoustic_client=lambda: None,
+        _acoustic_clients={},
+        _acoustic_lock=threading.Lock(),
+    )
+    context._acoustic_stream_client = lambda: AudioContext._acoustic_stream_client(context)
+    chunks = list(AudioContext._iterate_acoustic_points(context, "pitch", "s", chunk_size=2))
+    assert [[x["F0"] for x in chunk] for chunk in chunks] == [[100.0, 110.0], [120.3]]
+    assert chunks[1][0] == {"time": 1020, "F0": 120.3, "phone": "c"}
+    params, headers = influxdb_stub.query_requests[-1]
+    assert params["chunked"] == ["true"]
+    assert params["chunk_size"] == ["2"]
+    assert params["epoch"] == ["ms"]
+    assert headers["Accept"] == "application/json"
+
+    # The streaming client is reused by later iterations on the same thread
+    client = context._acoustic_clients[threading.get_ident(), "json"]
+    assert len(list(AudioContext._iterate_acoustic_points(context, "pitch", "s"))) == 2
+    assert list(context._acoustic_clients.values()) == [client]
+    client.close()
+
+
+def test_result_columns():
+    result = ResultSet(
+        {
+            "series": [
+                {
+                    "name": "pitch",
+                    "columns": ["time", "F0", "phone"],
+                    "values": [[4230, 100, "aa"], [4240, None, "aa"]],
+                }
+            ]
+        }
+    )
+    times, values = result_columns(result, "pitch", ["F0", "phone"])
+    assert times.tolist() == [4230, 4240]
+    track = Track.from_ms(times, values)
+    points = list(track)
+    assert points[0].time == Decimal("4.23")
+    assert points[0]["F0"] == 100
+    assert not points[1].has_value("F0")
+    assert points[1]["phone"] == "aa"
+
+
+def test_track():
+    track = Track()
+    for time in [Decimal("4.25"), Decimal("4.23"), Decimal("4.24")]:
+        point = TimePoint(time)
+        point.add_value("F0", 100)
+        track.add(point)
+    assert track.times() == [Decimal("4.23"), Decimal("4.24"), Decimal("4.25")]
+    assert Decimal("4.24") in track
+    assert track[Decimal("4.26")] is None
+
+    for point in track:
+        point["F0"] = 110
+    assert track[Decimal("4.23")]["F0"] == 110
+
+    sliced = track.slice(4.235, 4.25)
+    assert [x.time for x in sliced] == [Decimal("4.24"), Decimal("4.25")]
+
+    other = Track.from_ms([4230, 4260], {"F1": [500, None]})
+    track.merge(other)
+    assert len(track) == 4
+    assert track.keys() == ["F0", "F1"]
+    assert track[Decimal("4.23")].values == {"F0": 110, "F1": 500}
+    assert not track[Decimal("4.26")].has_value("F1")
+
+    relative = track.relative_time(Decimal("4.23"), Decimal("4.26"))
+    assert relative.times()[0] == 0
+    assert relative.times()[-1] == 1
+    assert track.times()[0] == Decimal("4.23")
+
+
+def test_interpolated_track():
+    node = SimpleNamespace(
+        alias="node_phone",
+        node_type="phone",
+        hierarchy=SimpleNamespace(acoustic_properties={"pitch": [("F0", float)]}),
+    )
+    attribute = AcousticAttribute(node, "pitch")
+    track = Track.from_ms([0, 10, 25, 50], {"F0": [100, 110, 125, 150]})
+    interpolated = attribute.interpolated_track.hydrate(None, "u", 0, 0.045, utterance_data=track)
+    values = [x["F0"] for x in interpolated]
+    # Gaps of exactly 15 ms are interpolated over, longer ones are undefined
+    assert values[:6] == pytest.approx([100, 105, 110, 115, 120, 125])
+    assert values[6:] == [None] * 4
+
+
+def test_acoustic_cache():
+    cache = AcousticCache(max_points=5)
+    pitch = cache.view("pitch")
+    pitch["a"] = Track.from_ms([0, 10], {"F0": [100, 110]})
+    pitch["b"] = Track.from_ms([0, 10], {"F0": [100, 110]})
+    assert pitch.get("a") is not None
+    assert pitch.get("c") is None
+    pitch["c"] = Track.from_ms([0, 10, 20], {"F0": [100, 110, 120]})
+    assert "a" in pitch
+    assert "b" not in pitch
+    assert "c" not in cache.view("formants")
+    assert cache.stats() == {"hits": 1, "misses": 1, "tracks": 2, "points": 5}
+    cache.clear()
+    assert len(cache) == 0
+
+    # Split queries on other threads share the cache while tracks are evicted
+    track = Track.from_ms([0], {"F0": [100]})
+
+    def use_cache(i):
+        for j in range(2000):
+            key = (i + j) % 10
+            if pitch.get(key) is None:
+                pitch[key] = track
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(use_cache, range(4)))
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 8002
+    assert cache.points == len(cache) == 5
+
+
+def test_analysis_checkpoint(tmp_path):
+    corpus_context = SimpleNamespace(config=CorpusConfig("checkpoints", data_dir=str(tmp_path)))
+    segments = [
+        FileSegment("a.wav", 0, 1, 0, id="u1"),
+        FileSegment("a.wav", 1, 2, 0, id="u2"),
+        FileSegment("b.wav", 0, 1, 0),
+    ]
+    checkpoint = AnalysisCheckpoint(corpus_context, "pitch")
+    assert checkpoint.missing(segments, {"min_pitch": 50}) == segments
+    checkpoint.mark_done(segments[:2], {"min_pitch": 50})
+
+    checkpoint = AnalysisCheckpoint(corpus_context, "pitch")
+    assert checkpoint.missing(segments, {"min_pitch": 50}) == segments[2:]
+    assert checkpoint.missing(segments, {"min_pitch": 75}) == segments
+    checkpoint.clear()
+    assert checkpoint.missing(segments, {"min_pitch": 50}) == segments
+
+
+def test_file_segment_batches(textgrid_test_dir):
+    path = os.path.join(textgrid_test_dir, "acoustic_corpus.wav")
+    other_path = os.path.join(textgrid_test_dir, "overlapped_speech", "overlapped.wav")
+    mapping = SegmentMapping()
+    for begin, end in [(1.5, 1.7), (0.1, 0.3), (0.5, 0.9)]:
+        mapping.add_file_segment(path, begin, end, 0, padding=0.1)
+    mapping.add_file_segment(other_path, 0.2, 0.4, 0)
+
+    batches = file_segment_batches(mapping)
+    assert [len(x) for x in batches] == [3, 1]
+    assert [x.begin for x in batches[0]] == [0.1, 0.5, 1.5]
+    assert batches[0].begin == 0 and batches[0].end == 1.8
+    assert [len(x) for x in file_segment_batches(mapping, max_duration=1)] == [2, 1, 1]
+
+    function = BaseAnalysisFunction()
+    function._function = lambda signal, sr: {0.1: signal.shape[-1] / sr}
+    expected = analyze_segments(mapping, function, num_jobs=1, multiprocessing=False)
+    output = analyze_file_segments(mapping, function, multiprocessing=False)
+    assert output.keys() == expected.keys()
+    for k, v in expected.items():
+        assert list(output[k].keys()) == pytest.approx(list(v.keys()))
+        assert list(output[k].values()) == pytest.approx(list(v.values()), abs=0.001)
+
+
+@pytest.mark.parametrize("multiprocessing", [False, True])
+def test_file_segment_pool(textgrid_test_dir, multiprocessing):
+    path = os.path.join(textgrid_test_dir, "acoustic_corpus.wav")
+    mapping = SegmentMapping()
+    for begin, end in [(1.5, 1.7), (0.1, 0.3), (0.5, 0.9)]:
+        mapping.add_file_segment(path, begin, end, 0, padding=0.1)
+    first_function = generate_pitch_function("native", 50, 500)
+    second_function = generate_pitch_function("native", 75, 300)
+
+    finished = []
+    with FileSegmentPool(num_jobs=2, multiprocessing=multiprocessing, max_duration=1) as pool:
+        pool.submit(("first", "a"), mapping, first_function)
+        pool.submit(("first", "b"), [], first_function)
+        for (stage, speaker), output in pool.completed():
+            finished.append((stage, speaker))
+            if stage == "first":
+                pool.submit(("second", speaker), list(output.keys()), second_function)
+            elif speaker == "a":
+                expected = analyze_file_segments(
+                    mapping, second_function, multiprocessing=False, max_duration=1
+                )
+                assert output == expected
+            else:
+                assert output == {}
+    assert sorted(finished) == [("first", "a"), ("first", "b"), ("second", "a"), ("second", "b")]
+
+    # Batches that have not started are cancelled when the pool exits
+    with FileSegmentPool(num_jobs=1, multiprocessing=multiprocessing, max_duration=0.1) as pool:
+        pool.submit("first", mapping, first_function)
+        futures = list(pool._futures)
+    assert len(futures) == 3
+    assert any(x.cancelled() for x in futures)
+
+
+def test_prepare_discourse_audio(textgrid_test_dir, tmp_path):
+    path = os.path.join(textgrid_test_dir, "acoustic_corpus.wav")
+    cache_dir = str(tmp_path / "cache")
+    first = prepare_discourse_audio(path, str(tmp_path / "first"), cache_dir)
+    with soundfile.SoundFile(path) as f:
+        assert first["duration"] == f.frames / f.samplerate
+        assert first["sampling_rate"] == f.samplerate
+    second = prepare_discourse_audio(path, str(tmp_path / "second"), cache_dir)
+    key = file_hash(path)
+    assert sorted(os.listdir(cache_dir)) == ["{}_11000.wav".format(key), "{}_2000.wav".format(key)]
+    for name in ["vowel", "low_freq"]:
+        first_path = first["{}_filepath".format(name)]
+        second_path = second["{}_filepath".format(name)]
+        assert not os.path.samefile(first_path, second_path)
+        with open(first_path, "rb") as f, open(second_path, "rb") as g:
+            assert f.read() == g.read()
+
+    # Files already in a discourse's directory are replaced from the cache
+    with open(first["vowel_filepath"], "wb") as f:
+        f.write(b"outdated")
+    prepare_discourse_audio(path, str(tmp_path / "first"), cache_dir)
+    with open(first["vowel_filepath"], "rb") as f, open(second["vowel_filepath"], "rb") as g:
+        assert f.read() == g.read()
+
+
+def test_read_waveform(textgrid_test_dir, tmp_path):
+    path = os.path.join(textgrid_test_dir, "acoustic_corpus.wav")
+    for begin, end in [(None, None), (1.23456, 1.28456), (0, 0.05), (26.7, 27.5), (None, 2.0)]:
+        signal, sr = read_waveform(path, begin, end)
+        duration = None if end is None else end - (begin or 0.0)
+        expected, expected_sr = librosa.load(path, sr=None, offset=begin or 0.0, duration=duration)
+        assert sr == expected_sr
+        assert np.array_equal(signal, expected)
+
+    stereo_path = str(tmp_path / "stereo.wav")
+    data = np.stack([np.linspace(-0.5, 0.5, 8000), np.zeros(8000)], axis=1)
+    soundfile.write(stereo_path, data, 8000)
+    signal, sr = read_waveform(stereo_path, 0.5, 0.625)
+    assert signal.shape == (1000,)
+    assert np.allclose(signal, data[4000:5000, 0] / 2, atol=1e-4)
+
+    # Changed files are reopened rather than read through a stale handle
+    soundfile.write(stereo_path, data[:4000], 8000)
+    signal, sr = read_waveform(stereo_path, 0.25)
+    assert signal.shape == (2000,)
+    sound_file_cache.clear()
+
+
+def test_spectrogram(textgrid_test_dir):
+    signal, sr = read_waveform(os.path.join(textgrid_test_dir, "acoustic_corpus.wav"), 1.0, 1.5)
+    values, time_step, freq_step = generate_spectrogram(signal, sr)
+    assert values.shape[0] == 129
+    assert freq_step == sr / 256
+    assert spectrogram_window(80) is spectrogram_window(80)
+
+    spectrogram = Spectrogram(values, time_step, freq_step, begin=1.0)
+    assert len(spectrogram) == values.size
+    expected = []
+    for i in range(values.shape[0]):
+        for j in range(values.shape[1]):
+            expected.append(
+                {
+                    "time": j * time_step + 1.0,
+                    "frequency": i * freq_step,
+                    "power": float(values[i, j]),
+                }
+            )
+    data = spectrogram.to_dict()
+    assert data["values"] == expected
+    assert data["num_time_bins"] == values.shape[1]
+    assert data["num_freq_bins"] == values.shape[0]
+    assert spectrogram.to_dict(rows=False)["values"] is values
+    payload = np.frombuffer(spectrogram.to_bytes(), dtype="<f4").reshape(values.shape)
+    assert np.allclose(payload, values)
+
+    cache = SpectrogramCache(max_cells=2 * values.size)
+    for i in range(3):
+        cache[i] = spectrogram
+    assert 0 not in cache
+    assert cache.get(2) is spectrogram
+
+    # Spectrogram values from a context are copies of the cached, read-only ones
+    values.flags.writeable = False
+    context = SimpleNamespace(spectrogram=lambda *args: spectrogram)
+    copied, _, _ = AudioContext.generate_spectrogram(context, "discourse")
+    assert copied.flags.writeable
+    assert not np.shares_memory(copied, values)
+    assert np.array_equal(copied, values)
+
+
+def test_waveform_envelope():
+    signal = np.array([0.1, -0.3, 0.2, 0.5, -0.1, 0.0, 0.4])
+    minimums, maximums, starts = waveform_envelope(signal, 3)
+    assert starts.tolist() == [0, 2, 4]
+    assert minimums.tolist() == [-0.3, 0.2, -0.1]
+    assert maximums.tolist() == [0.1, 0.5, 0.4]
+    minimums, maximums, starts = waveform_envelope(signal, 10)
+    assert minimums is signal and maximums is signal
+    assert starts.tolist() == list(range(7))
+    with pytest.raises(ValueError):
+        waveform_envelope(signal, 0)
+
+
+def test_waveform_array(acoustic_utt_config):
+    with CorpusContext(acoustic_utt_config) as g:
+        word = g.query_graph(g.word).order_by(g.word.begin).all()[0]
+        signal, sr, begin = word.waveform_array
+        assert word.waveform_array[0] is signal
+        assert not signal.flags.writeable
+        assert begin == word.begin
+        waveform = word.waveform
+        assert len(waveform) == len(signal)
+        assert waveform[1]["time"] == word.begin + 1 / sr
+        minimums, maximums, times = word.waveform_envelope(10)
+        assert len(minimums) == len(maximums) == len(times) == 10
+        assert times[0] == word.begin
+        assert minimums.min() == signal.min()
+        assert maximums.max() == signal.max()
@@ -1,15 +1,20 @@
 import os
 from decimal import Decimal
 
+import numpy as np
 import pytest
+from scipy.signal import lfilter
+from scipy.spatial.distance import mahalanobis
 
 from polyglotdb import CorpusContext
 from polyglotdb.acoustics.formants.base import analyze_formant_points
+from polyglotdb.acoustics.formants.helper import get_mahalanobis, get_mahalanobis_distances
 from polyglotdb.acoustics.formants.refined import (
     analyze_formant_points_refinement,
     get_mean_SD,
     save_formant_point_data,
 )
+from polyglotdb.acoustics.native import native_formant_track, native_variable_formant_points
 
 
 @pytest.mark.acoustic
@@ -263,3 +268,50 @@ def test_extract_formants_full(acoustic_utt_config, praat_path, export_test_dir)
         assert g.hierarchy.has_token_property("phone", "F1")
         g.reset_formant_points()
         assert not g.hierarchy.has_token_property("phone", "F1")
+
+
+def test_mahalanobis_candidates():
+    rng = np.random.RandomState(1234)
+    points = rng.randn(20, 4, 6) * [100, 200, 300, 50, 60, 70] + [500, 1500, 2500, 80, 100, 120]
+
+    class Segment(dict):
+        def __hash__(self):
+            return id(self)
+
+    data = {
+        Segment(label="aa" if i % 2 else "iy"): dict(zip("F1 F2 F3 B1 B2 B3".split(), p))
+        for i, p in enumerate(points[:, 0])
+    }
+    metadata = get_mean_SD(data)
+    assert sorted(metadata) == ["aa", "iy"]
+    assert np.allclose(metadata["aa"][0], points[1::2, 0].mean(axis=0))
+    assert np.allclose(metadata["iy"][1], np.cov(points[::2, 0].T))
+
+    means, covariance = metadata["aa"]
+    inverse_covariance = np.linalg.pinv(covariance)
+    distances = get_mahalanobis_distances(means, points, inverse_covariance)
+    assert distances.shape == (20, 4)
+    for t in range(20):
+        for c in range(4):
+            expected = mahalanobis(means, points[t, c], inverse_covariance)
+            assert abs(distances[t, c] - expected) < 1e-6
+    assert abs(get_mahalanobis(means, points[0, 0], inverse_covariance) - distances[0, 0]) < 1e-6
+
+
+def test_native_formants():
+    sr = 16000
+    source = np.zeros(sr // 2)
+    source[:: sr // 120] = 1
+    signal = source
+    for frequency, bandwidth in [(500, 80), (1500, 100), (2500, 120)]:
+        r = np.exp(-np.pi * bandwidth / sr)
+        signal = lfilter([1], [1, -2 * r * np.cos(2 * np.pi * frequency / sr), r**2], signal)
+    points = native_variable_formant_points(signal, sr, 0.25, 0.1, 0.4)
+    assert sorted(points) == [4.0, 4.5, 5.0, 5.5, 6.0, 6.5, 7.0]
+    assert abs(points[4.0]["F1"] - 500) < 100
+    assert abs(points[4.0]["F2"] - 1500) < 100
+    assert abs(points[4.0]["F3"] - 2500) < 100
+    assert all(points[4.0]["B{}".format(i)] is not None for i in range(1, 4))
+    track = native_formant_track(signal, sr, num_formants=4)
+    assert abs(np.median([x["F1"] for x in track.values()]) - 500) < 100
+    assert abs(np.median([x["F2"] for x in track.values()]) - 1500) < 100
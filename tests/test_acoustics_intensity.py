@@ -1,9 +1,11 @@
 import os
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
 from polyglotdb import CorpusContext
+from polyglotdb.acoustics.native import native_intensity
 
 
 def test_query_intensity(acoustic_utt_config):
@@ -190,3 +192,14 @@ def test_analyze_intensity_basic_praat(
 
         g.reset_acoustic_measure("intensity")
         assert not g.discourse_has_acoustics("intensity", g.discourses[0])
+
+
+def test_native_intensity():
+    sr = 16000
+    t = np.arange(sr) / sr
+    signal = 0.1 * np.sin(2 * np.pi * 200 * t) + 0.05
+    output = native_intensity(signal, sr)
+    assert len(output) == 94
+    expected = 10 * np.log10(0.1**2 / 2 / 4e-10)
+    assert all(abs(x["Intensity"] - expected) < 0.01 for x in output.values())
+    assert all(x["Intensity"] == -300 for x in native_intensity(np.zeros(sr), sr).values())
@@ -1,9 +1,14 @@
 import os
 from decimal import Decimal
 
+import numpy as np
 import pytest
+from conch.analysis.segments import FileSegment
 
 from polyglotdb import CorpusContext
+from polyglotdb.acoustics.native import native_pitch
+from polyglotdb.acoustics.pitch.base import tracks_within_pitch_range
+from polyglotdb.acoustics.pitch.helper import PitchTrackCache, generate_pitch_function
 
 
 @pytest.mark.acoustic
@@ -270,6 +275,23 @@ def test_query_pitch(acoustic_utt_config):
             assert round(point["F0"], 1) == expected_pitch[point.time]["F0"]
 
 
+def test_query_resampled_pitch(acoustic_utt_config_basic_pitch):
+    with CorpusContext(acoustic_utt_config_basic_pitch) as g:
+        expected_pitch = {
+            Decimal("4.23"): {"F0": 98},
+            Decimal("4.25"): {"F0": 99.5},
+            Decimal("4.27"): {"F0": 95.8},
+        }
+        q = g.query_graph(g.phone)
+        q = q.filter(g.phone.label == "ow")
+        q = q.order_by(g.phone.begin.column_name("begin"))
+        q = q.columns(g.phone.label, g.phone.pitch.track.resample(0.02))
+        results = q.all()
+        assert len(results[0].track) == len(expected_pitch.items())
+        for point in results[0].track:
+            assert round(point["F0"], 1) == expected_pitch[point.time]["F0"]
+
+
 def test_query_aggregate_pitch(acoustic_utt_config_basic_pitch):
     with CorpusContext(acoustic_utt_config_basic_pitch) as g:
         q = g.query_graph(g.phone)
@@ -359,3 +381,50 @@ def test_export_pitch(acoustic_utt_config_basic_pitch):
         assert next(t) == {"label": "ow", "time": Decimal("4.25"), "F0": 99}
         assert next(t) == {"label": "ow", "time": Decimal("4.26"), "F0": 95.8}
         assert next(t) == {"label": "ow", "time": Decimal("4.27"), "F0": 95.8}
+
+
+def test_native_pitch():
+    sr = 16000
+    t = np.arange(sr) / sr
+    for f0 in [80, 150, 300]:
+        signal = sum(np.sin(2 * np.pi * f0 * (i + 1) * t) / (i + 1) for i in range(3))
+        output = native_pitch(signal, sr, min_pitch=50, max_pitch=500)
+        assert len(output) == 95
+        assert all(abs(x["F0"] - f0) < 0.5 for x in output.values())
+    noise = np.random.RandomState(1234).randn(sr) * 0.01
+    assert all(x["F0"] is None for x in native_pitch(noise, sr).values())
+
+
+def test_first_pass_cache(tmp_path):
+    segments = [FileSegment("a.wav", i, i + 1, 0) for i in range(3)]
+    tracks = {
+        segments[0]: {0.01: {"F0": 120.5}, 0.02: {"F0": None}, 0.03: {"F0": 180.25}},
+        segments[1]: {1.01: {"F0": 120.3}, 1.02: {"F0": 450.0}},
+        segments[2]: {2.01: {"F0": None}},
+    }
+    assert tracks_within_pitch_range(tracks, 75, 300) == [segments[0]]
+
+    for directory in [None, str(tmp_path)]:
+        cache = PitchTrackCache(directory)
+        cache.store("speaker", tracks)
+        assert "speaker" in cache
+        assert cache.load("speaker") == tracks
+        assert "speaker" not in cache
+    assert not os.listdir(str(tmp_path))
+
+
+@pytest.mark.acoustic
+def test_native_pitch_against_praat(textgrid_test_dir, praat_path):
+    segment = FileSegment(
+        os.path.join(textgrid_test_dir, "acoustic_corpus.wav"), 4.0, 6.0, 0, padding=0.1
+    )
+    praat = generate_pitch_function("praat", 50, 500, path=praat_path)(segment)
+    native = generate_pitch_function("native", 50, 500)(segment)
+    both = [
+        (praat[t]["F0"], v["F0"])
+        for t, v in native.items()
+        if t in praat and praat[t]["F0"] and v["F0"]
+    ]
+    assert len(both) > 50
+    differences = [abs(n - p) / p for p, n in both]
+    assert np.median(differences) < 0.02
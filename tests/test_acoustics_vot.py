@@ -1,9 +1,13 @@
 import os
+import subprocess
 from decimal import Decimal
 
 import pytest
+from conch.analysis.segments import FileSegment
 
 from polyglotdb import CorpusContext
+from polyglotdb.acoustics.vot import helper
+from polyglotdb.exceptions import AcousticError
 
 
 @pytest.mark.acoustic
@@ -59,3 +63,36 @@ def test_analyze_vot(acoustic_utt_config, vot_classifier_path):
 
         for t, r in zip(p_true, p_returns):
             assert (r["node_vot_begin"][0], r["node_vot_end"][0]) == t
+
+
+@pytest.mark.parametrize("returncode", [0, 1])
+def test_analyze_batch(monkeypatch, tmp_path, returncode):
+    sound_file = tmp_path / "a.wav"
+    sound_file.write_bytes(b"")
+    segments = [
+        FileSegment(str(sound_file), 0, 1, 0, vot_marks=[(0.5, 0.6, "s1b"), (0.1, 0.2, "s1a")]),
+        FileSegment(str(sound_file), 1, 2, 0, vot_marks=[(1.1, 1.2, "s2a")]),
+    ]
+
+    def run(args, **kwargs):
+        with open(args[2]) as f:
+            grid_paths = f.read().split()
+        csv_path = args[args.index("--csv_file") + 1]
+        # Write the second file's stop first, to check that rows are matched by file name
+        with open(csv_path, "w") as f:
+            f.write("Filename,Time,VOT,Confidence\n")
+            f.write("{},1.11,0.02,0.9\n".format(grid_paths[1]))
+            f.write("{},0.12,0.015,neg 0\n".format(grid_paths[0]))
+            f.write("{},0.52,0.03,0.7\n".format(grid_paths[0]))
+        return subprocess.CompletedProcess(args, returncode, "", "error")
+
+    monkeypatch.setattr(helper, "is_autovot_friendly_file", lambda x: True)
+    monkeypatch.setattr(helper.subprocess, "run", run)
+    function = helper.AutoVOTBatchFunction(classifier_to_use="classifier")
+    if returncode:
+        with pytest.raises(AcousticError):
+            function.analyze_batch(segments)
+        return
+    output = function.analyze_batch(segments)
+    assert output[segments[0]] == [(0.12, 0.015, 0, "s1a"), (0.52, 0.03, 0.7, "s1b")]
+    assert output[segments[1]] == [(1.11, 0.02, 0.9, "s2a")]
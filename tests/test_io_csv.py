@@ -1,8 +1,14 @@
 import os
+from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
+import polyglotdb.corpus
 from polyglotdb import CorpusContext
+from polyglotdb.acoustics.writer import AcousticWriter
+from polyglotdb.corpus.audio import AudioContext
+from polyglotdb.io.importer.from_csv import import_track_csv, import_track_csvs
 
 
 def test_to_csv(acoustic_utt_config, export_test_dir):
@@ -126,3 +132,92 @@ def test_csv_vot(acoustic_utt_config, vot_classifier_path, export_test_dir):
             p_csv.append((float(line[0]), float(line[1])))
     for t, r in zip(p_true, p_csv):
         assert r == t
+
+
+class TrackImportContext(object):
+    """
+    Stand-in for a corpus context with a single phone per discourse, which writes to a stub of InfluxDB
+    """
+
+    def __init__(self, connection_kwargs):
+        self.config = None
+        self.hierarchy = SimpleNamespace(
+            acoustics={"pitch"}, acoustic_properties={"pitch": [("F0", float)]}
+        )
+        self.annotation_types = ["phone", "word"]
+        self.writer = AcousticWriter(connection_kwargs, batch_size=1000, flush_interval=10)
+        self.cache_cleared = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.writer.flush()
+
+    def discourse_sound_file(self, discourse):
+        if discourse == "missing":
+            return None
+        return {"name": discourse}
+
+    def _phone_intervals(self, discourse):
+        return {
+            "label": ["a", "b"],
+            "begin": np.array([0.0, 1.0]),
+            "end": np.array([0.9, 2.0]),
+            "word_label": ["w", "w"],
+            "speaker": [discourse + "_speaker"] * 2,
+        }
+
+    def _track_points(self, *args, **kwargs):
+        return AudioContext._track_points(self, *args, **kwargs)
+
+    def acoustic_writer(self):
+        return self.writer
+
+    def clear_acoustic_cache(self):
+        self.cache_cleared = True
+
+
+def write_track_csv(path, times):
+    with open(path, "w") as f:
+        f.write("time,F0\n")
+        for t in times:
+            f.write("{},{}\n".format(t, 100 + t))
+
+
+def test_import_track_csv_chunks(influxdb_stub, tmp_path):
+    path = str(tmp_path / "discourse.csv")
+    write_track_csv(path, [0.1, 0.5, 0.95, 1.2, 1.5, 2.0, 2.5])
+    context = TrackImportContext(influxdb_stub.connection_kwargs)
+    chunks = []
+    write = context.writer.write
+    context.writer.write = lambda data, **kwargs: (chunks.append(len(data)), write(data, **kwargs))
+    with context:
+        import_track_csv(context, "pitch", path, ["F0"], chunk_size=2)
+    # Points in the pause between the phones and after the last phone are left out
+    assert chunks == [2, 1, 2, 0]
+    lines = [x for _, request in influxdb_stub.write_requests for x in request]
+    assert len(lines) == 5
+    assert all(x.startswith("pitch,channel=0,discourse=discourse,") for x in lines)
+    assert [x.split("phone=")[1].split(",")[0] for x in lines] == ['"a"'] * 2 + ['"b"'] * 3
+    context.writer.close()
+
+
+@pytest.mark.parametrize("num_jobs", [1, 2])
+def test_import_track_csvs(influxdb_stub, tmp_path, monkeypatch, num_jobs):
+    write_track_csv(str(tmp_path / "first.csv"), [0.1, 1.2])
+    write_track_csv(str(tmp_path / "second.csv"), [0.5, 1.5, 2.0])
+    write_track_csv(str(tmp_path / "missing.csv"), [0.5])
+    (tmp_path / "notes.txt").write_text("not a track")
+    context = TrackImportContext(influxdb_stub.connection_kwargs)
+    # Workers open their own context from the config
+    monkeypatch.setattr(polyglotdb.corpus, "CorpusContext", lambda config: context)
+    with context:
+        import_track_csvs(
+            context, "pitch", str(tmp_path), ["F0"], num_jobs=num_jobs, multiprocessing=False
+        )
+    lines = [x for _, request in influxdb_stub.write_requests for x in request]
+    discourses = sorted(x.split("discourse=")[1].split(",")[0] for x in lines)
+    assert discourses == ["first"] * 2 + ["second"] * 3
+    assert context.cache_cleared == (num_jobs > 1)
+    context.writer.close()
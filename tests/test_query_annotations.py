@@ -45,6 +45,41 @@ def test_speaker_split_queries(overlapped_config):
         assert all(x["speaker_name"] == "Speaker 2" for x in results)
 
 
+def test_parallel_split_queries(overlapped_config, tmp_path):
+    with CorpusContext(overlapped_config) as g:
+        q = g.query_graph(g.word).order_by(g.word.begin)
+        q = q.columns(
+            g.word.label.column_name("label"), g.word.speaker.name.column_name("speaker")
+        )
+        expected = [(x["label"], x["speaker"]) for x in q.all()]
+        expected_count = q.count()
+        serial_path = str(tmp_path / "serial.csv")
+        q.to_csv(serial_path)
+
+        g.config.query_jobs = 2
+        q = g.query_graph(g.word).order_by(g.word.begin)
+        q = q.columns(
+            g.word.label.column_name("label"), g.word.speaker.name.column_name("speaker")
+        )
+        assert q.num_jobs == 2
+        assert [(x["label"], x["speaker"]) for x in q.all()] == expected
+        assert q.count() == expected_count
+        ordered_path = str(tmp_path / "ordered.csv")
+        q.to_csv(ordered_path)
+        unordered_path = str(tmp_path / "unordered.csv")
+        q.to_csv(unordered_path, ordered=False)
+        g.config.query_jobs = 1
+
+    with open(serial_path) as f:
+        serial = f.read().splitlines()
+    with open(ordered_path) as f:
+        assert f.read().splitlines() == serial
+    with open(unordered_path) as f:
+        unordered = f.read().splitlines()
+    assert unordered[0] == serial[0]
+    assert sorted(unordered[1:]) == sorted(serial[1:])
+
+
 def test_basic_query(timed_config):
     with CorpusContext(timed_config) as g:
         q = g.query_graph(g.word).filter(g.word.label == "are")
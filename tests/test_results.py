@@ -3,6 +3,7 @@ import os
 import pytest
 
 from polyglotdb import CorpusContext
+from polyglotdb.exceptions import GraphQueryError
 
 
 def test_encode_class(acoustic_utt_config):
@@ -19,3 +20,31 @@ def test_encode_class(acoustic_utt_config):
         assert second_twenty == results.previous(40)
 
         assert len(results) == 203
+
+
+def test_stream_results(acoustic_utt_config):
+    with CorpusContext(acoustic_utt_config) as g:
+        q = g.query_graph(g.phone).order_by(g.phone.begin)
+        q = q.columns(g.phone.label.column_name("label"), g.phone.begin.column_name("begin"))
+        expected = [
+            (x["label"], x["begin"]) for x in g.execute_cypher(q.cypher(), **q.cypher_params())
+        ]
+
+        g.config.query_batch_size = 50
+        results = q.all()
+        assert [(x["label"], x["begin"]) for x in results] == expected
+        assert [(x["label"], x["begin"]) for x in results] == expected
+        assert len(results) == len(expected)
+        assert results[150]["begin"] == expected[150][1]
+
+        # Streamed results are fetched in batches as they are iterated over rather than kept
+        results = q.all(stream=True)
+        assert len(results.cache) == 0
+        assert [(x["label"], x["begin"]) for x in results] == expected
+        assert len(results.cache) == 0
+        for i, x in enumerate(results):
+            if i == 100:
+                break
+        assert [(x["label"], x["begin"]) for x in results] == expected
+        with pytest.raises(GraphQueryError):
+            results[0]